@@ -0,0 +1,354 @@
+
+import time
+
+import numpy as np
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QColor
+
+from charts import sparkline
+
+HEADERS = [
+    "★",
+    "Location",
+    "Unit",
+    "Bid",
+    "Pred. Final",
+    "Est. Value",
+    "Score",
+    "Velocity",
+    "Time Remaining",
+    "Distance",
+    "Trend",
+]
+
+(
+    COL_STAR, COL_LOCATION, COL_UNIT, COL_BID, COL_PRED, COL_EST, COL_SCORE, COL_VELOCITY, COL_TIME, COL_DIST,
+    COL_TREND,
+) = range(11)
+
+TREND_SIZE = (90, 22)
+TREND_COLOR = "#60a5fa"
+
+# Numeric columns and the table column each one is displayed in
+VALUE_COLUMNS = {
+    "watched": COL_STAR,
+    "bid": COL_BID,
+    "predicted": COL_PRED,
+    "est_low": COL_EST,
+    "est_high": COL_EST,
+    "score": COL_SCORE,
+    "velocity": COL_VELOCITY,
+    "expire_at": COL_TIME,
+    "distance": COL_DIST,
+}
+
+# Above this many separate row runs a single reset is cheaper for the
+# view than a burst of insert/remove signals.
+MAX_SIGNAL_RUNS = 64
+
+
+def _runs(positions):
+    """Splits sorted row positions into (first, last) contiguous runs."""
+    if not len(positions):
+        return []
+    breaks = np.flatnonzero(np.diff(positions) != 1)
+    starts = np.concatenate(([0], breaks + 1))
+    ends = np.concatenate((breaks, [len(positions) - 1]))
+    return [(int(positions[s]), int(positions[e])) for s, e in zip(starts, ends)]
+
+
+def format_time_left(seconds):
+    if seconds <= 0:
+        return "ENDED"
+    seconds = int(seconds)
+    days, rest = divmod(seconds, 86400)
+    hours, rest = divmod(rest, 3600)
+    minutes, seconds = divmod(rest, 60)
+    if days > 0:
+        return f"{days}d {hours}h"
+    if hours > 0:
+        return f"{hours}h {minutes}m"
+    return f"{minutes}m {seconds:02d}s"
+
+
+class AuctionTableModel(QAbstractTableModel):
+    """
+    Auction list backed by columnar arrays.
+
+    Every auction keeps its slot in the arrays; filtering only swaps the
+    boolean mask of visible slots, and the model tells the view exactly
+    which rows appeared or disappeared. Sorting permutes an index array
+    instead of moving items. Cell text is formatted on demand, so only
+    the rows the view actually paints cost anything.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.auctions = []
+        self.values = {}
+        self.location = []
+        self.unit = []
+        self.tooltips = []
+        self.trends = []
+        self.trend_change = np.zeros(0)
+        self.order = np.zeros(0, dtype=np.intp)
+        self.mask = np.zeros(0, dtype=bool)
+        self.visible = np.zeros(0, dtype=np.intp)
+        self.sort_column = None
+        self.sort_order = None
+
+    # ---- Qt model API ----
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.visible)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def headerData(self, section, orientation, role):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return HEADERS[section]
+        return None
+
+    def data(self, index, role):
+        if not index.isValid() or index.row() >= len(self.visible):
+            return None
+        i = int(self.visible[index.row()])
+        col = index.column()
+
+        if role == Qt.DisplayRole:
+            return self._display(i, col)
+        if role == Qt.DecorationRole and col == COL_TREND:
+            # Painted rows only; identical series share one cached pixmap
+            return sparkline(self.trends[i], w=TREND_SIZE[0], h=TREND_SIZE[1], color=QColor(TREND_COLOR))
+        if role == Qt.UserRole:
+            return self._sort_value(i, col)
+        if role == Qt.ToolTipRole:
+            if col == COL_UNIT:
+                return self.tooltips[i]
+            if col == COL_PRED and np.isnan(self.values["predicted"][i]):
+                return "No model yet; run `python predictor.py` once auctions have ended."
+            if col == COL_EST:
+                return "Estimated from past appraisals; no vision call needed."
+            if col == COL_DIST and np.isnan(self.values["distance"][i]):
+                return "No facility location, or the search ZIP is not resolved yet."
+        return None
+
+    def _display(self, i, col):
+        v = self.values
+        if col == COL_STAR:
+            return "⭐" if v["watched"][i] else ""
+        if col == COL_LOCATION:
+            return self.location[i]
+        if col == COL_UNIT:
+            return self.unit[i]
+        if col == COL_BID:
+            return f"${v['bid'][i]:.0f}"
+        if col == COL_PRED:
+            final = v["predicted"][i]
+            return "--" if np.isnan(final) else f"${final:,.0f}"
+        if col == COL_EST:
+            return f"${v['est_low'][i]:,.0f}–{v['est_high'][i]:,.0f}"
+        if col == COL_SCORE:
+            return f"{int(v['score'][i])}/100"
+        if col == COL_VELOCITY:
+            return f"{v['velocity'][i]:.2f}/hr"
+        if col == COL_TIME:
+            return format_time_left(v["expire_at"][i] - time.time())
+        if col == COL_DIST:
+            miles = v["distance"][i]
+            return "--" if np.isnan(miles) else f"{miles:,.1f} mi"
+        return None
+
+    def _sort_value(self, i, col):
+        if col == COL_LOCATION:
+            return self.location[i]
+        if col == COL_UNIT:
+            return self.unit[i]
+        if col == COL_TIME:
+            left = self.values["expire_at"][i] - time.time()
+            return float("inf") if left <= 0 else float(left)
+        return self.sort_keys(col, np.array([i]))[0].item()
+
+    def sort_keys(self, col, slots=None):
+        """Sort key per auction slot (or just `slots`) for a table column."""
+        v = {name: (arr if slots is None else arr[slots]) for name, arr in self.values.items()}
+        if col == COL_STAR:
+            return v["watched"].astype(np.int8)
+        if col == COL_LOCATION:
+            return np.array(self.location, dtype=str)
+        if col == COL_UNIT:
+            return np.array(self.unit, dtype=str)
+        if col == COL_BID:
+            return v["bid"]
+        if col == COL_PRED:
+            return np.where(np.isnan(v["predicted"]), -1.0, v["predicted"])
+        if col == COL_EST:
+            return (v["est_low"] + v["est_high"]) / 2
+        if col == COL_SCORE:
+            return v["score"]
+        if col == COL_VELOCITY:
+            return v["velocity"]
+        if col == COL_TIME:
+            left = v["expire_at"] - time.time()
+            return np.where(left <= 0, np.inf, left)
+        if col == COL_DIST:
+            # Unknown distances sort after the farthest known one
+            return np.where(np.isnan(v["distance"]), np.inf, v["distance"])
+        if col == COL_TREND:
+            return self.trend_change if slots is None else self.trend_change[slots]
+        return np.zeros(len(v["bid"]))
+
+    def sort(self, column, order):
+        self.sort_column = column
+        self.sort_order = order
+        if not len(self.auctions):
+            return
+
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        slots = [int(self.visible[p.row()]) if p.row() < len(self.visible) else -1 for p in persistent]
+
+        self.order = np.argsort(self.sort_keys(column), kind="stable")
+        if order == Qt.DescendingOrder:
+            self.order = self.order[::-1]
+        self.visible = self.order[self.mask[self.order]]
+
+        if persistent:
+            rows = self.row_positions()
+            self.changePersistentIndexList(
+                persistent,
+                [
+                    self.index(int(rows[s]), p.column()) if s >= 0 and rows[s] >= 0 else QModelIndex()
+                    for p, s in zip(persistent, slots)
+                ],
+            )
+        self.layoutChanged.emit()
+
+    # ---- data ----
+    def set_auctions(self, auctions, values, location, unit, tooltips, trends=None):
+        """
+        Replaces everything; `values` maps VALUE_COLUMNS names to arrays and
+        `trends` holds each auction's recent bids for the Trend sparkline.
+        """
+        self.beginResetModel()
+        self.auctions = auctions
+        self.values = {name: np.asarray(values[name]) for name in VALUE_COLUMNS}
+        self.location = location
+        self.unit = unit
+        self.tooltips = tooltips
+        self.trends = trends if trends is not None else [[] for _ in auctions]
+        # Trend sorts by how much the bid moved over the recent window
+        self.trend_change = np.array(
+            [t[-1] - t[0] if len(t) else 0.0 for t in self.trends], dtype=np.float64
+        )
+        self.order = np.arange(len(auctions), dtype=np.intp)
+        self.mask = np.ones(len(auctions), dtype=bool)
+        self.visible = self.order.copy()
+        self.endResetModel()
+        if self.sort_column is not None:
+            self.sort(self.sort_column, self.sort_order)
+
+    def clear(self):
+        empty = {name: np.zeros(0) for name in VALUE_COLUMNS}
+        self.set_auctions([], empty, [], [], [], [])
+
+    def update_values(self, **columns):
+        """
+        Swaps in new arrays for some value columns and emits dataChanged
+        only for visible rows whose values actually differ. Re-sorts when
+        the sort column changed.
+        """
+        changed_cols = set()
+        changed = np.zeros(len(self.auctions), dtype=bool)
+        for name, new in columns.items():
+            new = np.asarray(new)
+            old = self.values[name]
+            if old.shape == new.shape:
+                diff = old != new
+                if new.dtype.kind == "f":
+                    diff &= ~(np.isnan(old) & np.isnan(new))
+            else:
+                diff = np.ones(len(self.auctions), dtype=bool)
+            self.values[name] = new
+            if diff.any():
+                changed |= diff
+                changed_cols.add(VALUE_COLUMNS[name])
+
+        if not changed_cols:
+            return
+        if self.sort_column in changed_cols:
+            self.sort(self.sort_column, self.sort_order)
+
+        rows = self.row_positions()[changed]
+        rows = np.sort(rows[rows >= 0])
+        runs = _runs(rows)
+        if len(runs) > MAX_SIGNAL_RUNS:
+            runs = [(int(rows[0]), int(rows[-1]))]
+        first_col, last_col = min(changed_cols), max(changed_cols)
+        for start, end in runs:
+            self.dataChanged.emit(self.index(start, first_col), self.index(end, last_col))
+
+    def refresh_rows(self, first, last, column):
+        """Repaints one column of a row range, e.g. the countdown of the rows on screen."""
+        if first < 0 or last < first or last >= len(self.visible):
+            return
+        self.dataChanged.emit(self.index(first, column), self.index(last, column), [Qt.DisplayRole])
+
+    def set_mask(self, mask):
+        """
+        Shows exactly the auctions where `mask` is true, in sort order,
+        with one remove/insert signal per contiguous run of rows.
+        """
+        # Own copy: a caller editing its array in place must still look like a change
+        mask = np.array(mask, dtype=bool)
+        if mask.shape != self.mask.shape:
+            raise ValueError("mask length does not match the auction list")
+        if np.array_equal(mask, self.mask):
+            return
+
+        ordered_old = self.mask[self.order]
+        ordered_new = mask[self.order]
+        # Row positions of leaving auctions in the old list and of arriving
+        # auctions in the new one
+        removed = (np.cumsum(ordered_old) - 1)[ordered_old & ~ordered_new]
+        added = (np.cumsum(ordered_new) - 1)[ordered_new & ~ordered_old]
+
+        remove_runs = _runs(removed)
+        add_runs = _runs(added)
+        if len(remove_runs) + len(add_runs) > MAX_SIGNAL_RUNS:
+            self.beginResetModel()
+            self.mask = mask
+            self.visible = self.order[ordered_new]
+            self.endResetModel()
+            return
+
+        for start, end in reversed(remove_runs):
+            self.beginRemoveRows(QModelIndex(), start, end)
+            self.visible = np.delete(self.visible, np.s_[start:end + 1])
+            self.endRemoveRows()
+
+        target = self.order[ordered_new]
+        for start, end in add_runs:
+            self.beginInsertRows(QModelIndex(), start, end)
+            self.visible = np.concatenate((self.visible[:start], target[start:end + 1], self.visible[start:]))
+            self.endInsertRows()
+        self.mask = mask
+
+    # ---- lookups ----
+    def row_positions(self):
+        """View row of every auction slot, -1 when hidden."""
+        rows = np.full(len(self.auctions), -1, dtype=np.intp)
+        rows[self.visible] = np.arange(len(self.visible))
+        return rows
+
+    def slot_at(self, row):
+        if row < 0 or row >= len(self.visible):
+            return None
+        return int(self.visible[row])
+
+    def auction_at(self, row):
+        slot = self.slot_at(row)
+        return None if slot is None else self.auctions[slot]
+
+    def matched(self):
+        return int(self.mask.sum())
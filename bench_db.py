@@ -0,0 +1,259 @@
+
+"""
+Benchmarks for db.py against synthetic bid_history / vision_results data.
+
+    python bench_db.py                              # 100, 1k and 10k auctions x 500 snapshots
+    python bench_db.py --sizes 1000 --snapshots 50
+    python bench_db.py --out before.json
+    python bench_db.py --out after.json --compare before.json
+
+Every run writes a JSON report (one record per operation and size) so
+results can be diffed between schema or index changes. The real
+auctions.db is never touched; each size gets its own throwaway database.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+import db
+
+ITEM_NAMES = [
+    "Couch", "Dresser", "Table", "Chair", "Bed frame", "Mattress", "TV",
+    "Laptop", "Drill", "Toolbox", "Bicycle", "Lamp", "Boxes", "Cabinet",
+    "Mini fridge", "Washer", "Dryer", "Guitar", "Golf clubs", "Rug",
+]
+BRANDS = ["", "Samsung", "DeWalt", "IKEA", "Sony", "Craftsman", "Whirlpool", "Trek"]
+
+SNAPSHOT_INTERVAL = timedelta(minutes=10)
+REGRESSION_THRESHOLD = 1.25
+
+
+def synthetic_item(rng):
+    low = rng.randint(5, 400)
+    return {
+        "name": rng.choice(ITEM_NAMES),
+        "brand": rng.choice(BRANDS),
+        "confidence": round(rng.uniform(0.3, 0.95), 2),
+        "low": low,
+        "high": low + rng.randint(10, 600),
+        "box": {
+            "x": round(rng.random() * 0.7, 3),
+            "y": round(rng.random() * 0.7, 3),
+            "w": round(rng.uniform(0.05, 0.3), 3),
+            "h": round(rng.uniform(0.05, 0.3), 3),
+        },
+    }
+
+
+def bid_rows(aids, snapshots, rng):
+    start = datetime.now(timezone.utc) - SNAPSHOT_INTERVAL * snapshots
+    for aid in aids:
+        bid = float(rng.randint(1, 50))
+        for i in range(snapshots):
+            if rng.random() < 0.15:
+                bid += rng.randint(5, 25)
+            yield aid, bid, (start + SNAPSHOT_INTERVAL * i).isoformat()
+
+
+def vision_rows(aids, rng):
+    now = datetime.now(timezone.utc)
+    for aid in aids:
+        items = [synthetic_item(rng) for _ in range(rng.randint(3, 80))]
+        low = sum(it["low"] * it["confidence"] for it in items)
+        high = sum(it["high"] * it["confidence"] for it in items)
+
+        manual_json = manual_low = manual_high = None
+        if rng.random() < 0.2:
+            manual = [dict(it, hidden=rng.random() < 0.1) for it in items]
+            manual_json = json.dumps(manual)
+            manual_low = sum(it["low"] for it in manual if not it["hidden"])
+            manual_high = sum(it["high"] for it in manual if not it["hidden"])
+
+        updated = now - timedelta(minutes=rng.randint(0, 60 * 24 * 90))
+        yield (
+            aid,
+            json.dumps(items),
+            float(int(low)),
+            float(int(high)),
+            updated.isoformat(),
+            f"Facility {rng.randint(1, 500)}",
+            manual_json,
+            manual_low,
+            manual_high,
+        )
+
+
+def build_fixture(path, auctions, snapshots, vision_ratio, seed):
+    rng = random.Random(seed)
+    aids = [str(1_000_000 + i) for i in range(auctions)]
+
+    db.DB_PATH = path
+    db.init_db()
+
+    conn = sqlite3.connect(path)
+    conn.executemany(
+        "INSERT INTO bid_history (auction_id, bid, timestamp) VALUES (?,?,?)",
+        bid_rows(aids, snapshots, rng),
+    )
+    conn.executemany(
+        """
+        INSERT INTO vision_results (auction_id, items_json, total_low, total_high, updated_at, facility_name, manual_items_json, manual_total_low, manual_total_high)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        vision_rows(aids[: int(auctions * vision_ratio)], rng),
+    )
+    conn.commit()
+    conn.close()
+    return aids
+
+
+def timed(fn, repeat):
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run_size(auctions, args):
+    rng = random.Random(args.seed + auctions)
+    results = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+
+        t0 = time.perf_counter()
+        aids = build_fixture(path, auctions, args.snapshots, args.vision_ratio, args.seed)
+        build_s = time.perf_counter() - t0
+        print(f"[{auctions} auctions x {args.snapshots} snapshots] fixture built in {build_s:.1f}s")
+
+        vision_aids = aids[: int(auctions * args.vision_ratio)] or aids[:1]
+        sample = rng.sample(aids, min(args.samples, len(aids)))
+        vision_sample = rng.sample(vision_aids, min(args.samples, len(vision_aids)))
+
+        ops = [
+            ("bid_velocity", len(sample), lambda: [db.bid_velocity(a) for a in sample]),
+            ("bid_velocity_many[sample]", len(sample), lambda: db.bid_velocity_many(sample)),
+            ("bid_velocity_many[all]", len(aids), lambda: db.bid_velocity_many(aids)),
+            ("get_recent_bids", len(sample), lambda: [db.get_recent_bids(a) for a in sample]),
+            ("get_recent_bids_many[sample]", len(sample), lambda: db.get_recent_bids_many(sample)),
+            ("get_recent_bids_many[all]", len(aids), lambda: db.get_recent_bids_many(aids)),
+            ("load_vision_result", len(vision_sample), lambda: [db.load_vision_result(a) for a in vision_sample]),
+            ("load_vision_result_many[sample]", len(vision_sample), lambda: db.load_vision_result_many(vision_sample)),
+            ("get_recent_vision_results[10]", 1, lambda: db.get_recent_vision_results(limit=10)),
+            ("get_recent_vision_results[100]", 1, lambda: db.get_recent_vision_results(limit=100)),
+        ]
+
+        for name, calls, fn in ops:
+            if args.only and not any(name.startswith(o) for o in args.only):
+                continue
+            total = timed(fn, args.repeat)
+            results.append(
+                {
+                    "op": name,
+                    "auctions": auctions,
+                    "snapshots": args.snapshots,
+                    "vision_rows": int(auctions * args.vision_ratio),
+                    "calls": calls,
+                    "total_s": round(total, 6),
+                    "per_call_ms": round(total * 1000 / max(calls, 1), 4),
+                }
+            )
+            print(f"  {name:<34} {total * 1000:>10.2f} ms  ({results[-1]['per_call_ms']:.3f} ms/call)")
+
+    return results
+
+
+def compare(current, previous_path):
+    with open(previous_path, "r", encoding="utf-8") as f:
+        previous = json.load(f)
+
+    def key(r):
+        return r["op"], r["auctions"], r["snapshots"]
+
+    before = {key(r): r for r in previous.get("results", [])}
+    regressions = 0
+
+    print(f"\nComparison against {previous_path}:")
+    for r in current:
+        old = before.get(key(r))
+        if not old or not old["per_call_ms"]:
+            continue
+        ratio = r["per_call_ms"] / old["per_call_ms"]
+        flag = ""
+        if ratio >= REGRESSION_THRESHOLD:
+            flag = "  REGRESSION"
+            regressions += 1
+        print(f"  {r['op']:<34} n={r['auctions']:<7} {old['per_call_ms']:>10.3f} -> {r['per_call_ms']:>10.3f} ms/call  x{ratio:.2f}{flag}")
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark db.py on synthetic history.")
+    parser.add_argument("--sizes", default="100,1000,10000",
+                        help="comma-separated auction counts (default: %(default)s)")
+    parser.add_argument("--snapshots", type=int, default=500,
+                        help="bid_history rows per auction (default: %(default)s)")
+    parser.add_argument("--vision-ratio", type=float, default=0.2,
+                        help="fraction of auctions with a saved vision result (default: %(default)s)")
+    parser.add_argument("--samples", type=int, default=20,
+                        help="auction ids timed through the per-id functions (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="runs per operation, the best one is kept (default: %(default)s)")
+    parser.add_argument("--only", action="append",
+                        help="only run operations whose name starts with this (repeatable)")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--out", default="bench_output.json",
+                        help="where to write the JSON report (default: %(default)s)")
+    parser.add_argument("--compare", help="previous JSON report to compare against")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+
+    original_path = db.DB_PATH
+    results = []
+    try:
+        for size in sizes:
+            results.extend(run_size(size, args))
+    finally:
+        db.DB_PATH = original_path
+
+    report = {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "sizes": sizes,
+            "snapshots": args.snapshots,
+            "samples": args.samples,
+            "repeat": args.repeat,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nWrote {len(results)} results to {args.out}")
+
+    if args.compare:
+        return 1 if compare(results, args.compare) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,36 +1,198 @@
 
-from PySide6.QtGui import QPixmap, QPainter, QPen, QColor
-from PySide6.QtCore import Qt
+import hashlib
+from collections import OrderedDict
+from datetime import datetime
 
-def sparkline(values, velocity=None, w=140, h=40):
-    pix = QPixmap(w, h)
-    pix.fill(Qt.transparent)
+import numpy as np
+from PySide6.QtGui import QPixmap, QPainter, QPen, QColor, QPolygonF
+from PySide6.QtCore import Qt, QPointF
+from PySide6.QtWidgets import QWidget
+
+from downsample import lttb, visible_slice
+
+# Rendered charts keyed by (series hash, view, size, color), LRU by bytes
+MAX_CACHED_BYTES = 32 * 1024 * 1024
+_pixmaps = OrderedDict()
+_cached_bytes = 0
+
+# Smallest time span the history chart zooms into, in seconds
+MIN_ZOOM_SPAN = 60.0
 
-    if len(values) < 2:
-        return pix
 
+def velocity_color(velocity):
     if velocity is None:
-        color = Qt.green
-    elif velocity < 5:
-        color = QColor("#22c55e")   # green
-    elif velocity < 20:
-        color = QColor("#f59e0b")   # amber
-    else:
-        color = QColor("#ef4444")   # red
-
-    p = QPainter(pix)
-    p.setRenderHint(QPainter.Antialiasing)
-    p.setPen(QPen(color, 2))
-
-    mn, mx = min(values), max(values)
-    span = max(mx - mn, 1)
-
-    for i in range(len(values) - 1):
-        x1 = int(i * (w / (len(values) - 1)))
-        y1 = int(h - ((values[i] - mn) / span) * h)
-        x2 = int((i + 1) * (w / (len(values) - 1)))
-        y2 = int(h - ((values[i + 1] - mn) / span) * h)
-        p.drawLine(x1, y1, x2, y2)
-
-    p.end()
+        return QColor("#22c55e")
+    if velocity < 5:
+        return QColor("#22c55e")   # green
+    if velocity < 20:
+        return QColor("#f59e0b")   # amber
+    return QColor("#ef4444")       # red
+
+
+def series_key(*arrays):
+    h = hashlib.blake2b(digest_size=12)
+    for arr in arrays:
+        h.update(np.ascontiguousarray(arr, dtype=np.float64).tobytes())
+    return h.digest()
+
+
+def _polyline(x, y, x0, x1, w, h, pad):
+    """Screen polygon of the series between x0 and x1, at most one point per pixel column."""
+    lo, hi = visible_slice(x, x0, x1)
+    x, y = x[lo:hi], y[lo:hi]
+    keep = lttb(x, y, max(w, 3))
+    x, y = x[keep], y[keep]
+
+    mn, mx = float(y.min()), float(y.max())
+    span_y = max(mx - mn, 1)
+    span_x = max(x1 - x0, 1e-9)
+    px = (x - x0) / span_x * (w - 1)
+    py = pad + (1 - (y - mn) / span_y) * (h - 1 - 2 * pad)
+    return QPolygonF([QPointF(a, b) for a, b in zip(px.tolist(), py.tolist())])
+
+
+def trend_pixmap(x, y, w, h, color, x_range=None, pen_width=2, series=None):
+    """
+    Line chart of y over x as a cached pixmap.
+
+    Long series are downsampled with LTTB to the pixel width and drawn
+    as one polyline; identical series, view and size reuse the pixmap.
+    Pass `series` (a series_key) to skip rehashing a series drawn often.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if x_range is None:
+        x_range = (float(x[0]), float(x[-1])) if len(x) else (0.0, 1.0)
+
+    global _cached_bytes
+    key = (series or series_key(x, y), x_range, w, h, color.name(), pen_width)
+    entry = _pixmaps.get(key)
+    if entry is not None:
+        _pixmaps.move_to_end(key)
+        return entry[0]
+
+    pix = QPixmap(w, h)
+    pix.fill(Qt.transparent)
+    if len(y) >= 2:
+        p = QPainter(pix)
+        p.setRenderHint(QPainter.Antialiasing)
+        p.setPen(QPen(color, pen_width))
+        p.drawPolyline(_polyline(x, y, x_range[0], x_range[1], w, h, pen_width / 2))
+        p.end()
+
+    nbytes = w * h * 4
+    _pixmaps[key] = (pix, nbytes)
+    _cached_bytes += nbytes
+    while _cached_bytes > MAX_CACHED_BYTES and len(_pixmaps) > 1:
+        _, (_, size) = _pixmaps.popitem(last=False)
+        _cached_bytes -= size
     return pix
+
+
+def sparkline(values, velocity=None, w=140, h=40, color=None):
+    values = np.asarray(values, dtype=np.float64)
+    return trend_pixmap(
+        np.arange(len(values), dtype=np.float64),
+        values,
+        w,
+        h,
+        color or velocity_color(velocity),
+    )
+
+
+class BidHistoryChart(QWidget):
+    """
+    Full bid history of one auction. Scroll to zoom around the cursor,
+    drag to pan, double-click to show everything again. Each frame is a
+    cached trend_pixmap of the visible time range.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMinimumHeight(160)
+        self.x = np.zeros(0)
+        self.y = np.zeros(0)
+        self.series = None
+        self.color = velocity_color(None)
+        self.view = (0.0, 1.0)
+        self._drag_x = None
+
+    def set_history(self, points, velocity=None):
+        """`points` are (unix time, bid) pairs, oldest first."""
+        self.x = np.array([t for t, _ in points], dtype=np.float64)
+        self.y = np.array([b for _, b in points], dtype=np.float64)
+        self.series = series_key(self.x, self.y)
+        self.color = velocity_color(velocity)
+        self.reset_view()
+
+    def reset_view(self):
+        if len(self.x) >= 2:
+            self.view = (float(self.x[0]), float(self.x[-1]))
+        self.update()
+
+    def _clamp(self, x0, x1):
+        full0, full1 = float(self.x[0]), float(self.x[-1])
+        span = min(max(x1 - x0, MIN_ZOOM_SPAN), full1 - full0)
+        x0 = min(max(x0, full0), full1 - span)
+        return x0, x0 + span
+
+    # ---- interaction ----
+    def wheelEvent(self, event):
+        if len(self.x) < 2:
+            return
+        x0, x1 = self.view
+        frac = event.position().x() / max(self.width(), 1)
+        anchor = x0 + frac * (x1 - x0)
+        factor = 0.8 if event.angleDelta().y() > 0 else 1.25
+        self.view = self._clamp(anchor - (anchor - x0) * factor, anchor + (x1 - anchor) * factor)
+        self.update()
+
+    def mousePressEvent(self, event):
+        self._drag_x = event.position().x()
+
+    def mouseMoveEvent(self, event):
+        if self._drag_x is None or len(self.x) < 2:
+            return
+        x0, x1 = self.view
+        shift = (self._drag_x - event.position().x()) / max(self.width(), 1) * (x1 - x0)
+        self._drag_x = event.position().x()
+        self.view = self._clamp(x0 + shift, x1 + shift)
+        self.update()
+
+    def mouseReleaseEvent(self, event):
+        self._drag_x = None
+
+    def mouseDoubleClickEvent(self, event):
+        self.reset_view()
+
+    # ---- painting ----
+    def paintEvent(self, event):
+        p = QPainter(self)
+        p.setPen(QColor("#9ca3af"))
+        if len(self.x) < 2:
+            p.drawText(self.rect(), Qt.AlignCenter, "Not enough bid history yet.")
+            p.end()
+            return
+
+        lo, hi = visible_slice(self.x, *self.view)
+        shown = self.y[lo:hi]
+        label_h = 18
+        chart_h = max(self.height() - label_h, 10)
+        pix = trend_pixmap(
+            self.x, self.y, self.width(), chart_h, self.color, x_range=self.view, series=self.series
+        )
+        p.drawPixmap(0, 0, pix)
+
+        fmt = "%b %d %H:%M"
+        left = datetime.fromtimestamp(self.view[0]).strftime(fmt)
+        right = datetime.fromtimestamp(self.view[1]).strftime(fmt)
+        p.drawText(4, self.height() - 4, left)
+        p.drawText(
+            self.rect().adjusted(0, 0, -4, -4), Qt.AlignRight | Qt.AlignBottom, right
+        )
+        p.drawText(
+            self.rect().adjusted(0, 0, -4, 0),
+            Qt.AlignRight | Qt.AlignTop,
+            f"${shown.min():,.0f} – ${shown.max():,.0f} · {len(self.x)} bids",
+        )
+        p.end()
@@ -1,4 +1,6 @@
 
+import os
+
 API_BASE = "https://api.st-prd-1.aws.storagetreasures.com"
 HEADERS = {
     "Accept": "application/json",
@@ -18,3 +20,9 @@ SEARCH_PARAMS = {
     "sort_column": "expire_date",
     "sort_direction": "asc",
 }
+
+# Map tiles are fetched from here through the disk tile cache; point it at
+# a local server (e.g. `python tile_server.py`) to work offline
+TILE_SERVER_URL = os.environ.get(
+    "TILE_SERVER_URL", "https://tile.openstreetmap.org/{z}/{x}/{y}.png"
+)
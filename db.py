@@ -3,14 +3,85 @@ import json
 import sqlite3
 from datetime import datetime, timezone
 
+import numpy as np
+
+from geo import haversine_miles
+from spatial_index import geohash, geohash_ranges
+
+DB_PATH = "auctions.db"
+
+# SQLite caps the number of bound parameters per statement
+BATCH_SIZE = 500
+
+
+def _connect():
+    return sqlite3.connect(DB_PATH)
+
+
+def _chunks(seq, size=BATCH_SIZE):
+    seq = list(seq)
+    for i in range(0, len(seq), size):
+        yield seq[i:i + size]
+
+
 def init_db():
-    conn = sqlite3.connect("auctions.db")
+    conn = _connect()
     c = conn.cursor()
     c.execute("""
         CREATE TABLE IF NOT EXISTS bid_history (
             auction_id TEXT,
             bid REAL,
-            timestamp TEXT
+            timestamp TEXT,
+            total_bids INTEGER,
+            total_views INTEGER
+        )
+    """)
+
+    for col in ("total_bids INTEGER", "total_views INTEGER"):
+        try:
+            c.execute(f"ALTER TABLE bid_history ADD COLUMN {col}")
+        except sqlite3.OperationalError:
+            # Column already exists
+            pass
+
+    c.execute("""
+        CREATE TABLE IF NOT EXISTS auctions (
+            auction_id TEXT PRIMARY KEY,
+            facility_name TEXT,
+            city TEXT,
+            state TEXT,
+            unit_size TEXT,
+            unit_contents TEXT,
+            expire_at TEXT,
+            lat REAL,
+            lng REAL,
+            first_seen TEXT,
+            last_seen TEXT,
+            geohash TEXT
+        )
+    """)
+
+    try:
+        c.execute("ALTER TABLE auctions ADD COLUMN geohash TEXT")
+    except sqlite3.OperationalError:
+        # Column already exists
+        pass
+    # Radius queries scan a few geohash prefix ranges of this index
+    c.execute("CREATE INDEX IF NOT EXISTS idx_auctions_geohash ON auctions(geohash)")
+    missing = c.execute(
+        "SELECT auction_id, lat, lng FROM auctions WHERE geohash IS NULL AND lat IS NOT NULL AND lng IS NOT NULL"
+    ).fetchall()
+    c.executemany(
+        "UPDATE auctions SET geohash = ? WHERE auction_id = ?",
+        [(geohash(lat, lng), aid) for aid, lat, lng in missing],
+    )
+
+    c.execute("""
+        CREATE TABLE IF NOT EXISTS final_price_model (
+            feature TEXT PRIMARY KEY,
+            coef REAL,
+            samples INTEGER,
+            fitted_at TEXT
         )
     """)
 
@@ -25,7 +96,36 @@ def init_db():
             facility_name TEXT,
             manual_items_json TEXT,
             manual_total_low REAL,
-            manual_total_high REAL
+            manual_total_high REAL,
+            unit_size TEXT
+        )
+        """
+    )
+
+    c.execute(
+        """
+        CREATE TABLE IF NOT EXISTS price_lookup (
+            kind TEXT,
+            key TEXT,
+            samples INTEGER,
+            low REAL,
+            high REAL,
+            low_p25 REAL,
+            high_p75 REAL,
+            multiplier REAL,
+            fitted_at TEXT,
+            PRIMARY KEY (kind, key)
+        )
+        """
+    )
+
+    c.execute(
+        """
+        CREATE TABLE IF NOT EXISTS zip_coords (
+            zip TEXT PRIMARY KEY,
+            lat REAL,
+            lng REAL,
+            resolved_at TEXT
         )
         """
     )
@@ -39,6 +139,7 @@ def init_db():
         "manual_items_json TEXT",
         "manual_total_low REAL",
         "manual_total_high REAL",
+        "unit_size TEXT",
     ):
         try:
             c.execute(f"ALTER TABLE vision_results ADD COLUMN {col}")
@@ -49,31 +150,189 @@ def init_db():
     conn.close()
 
 def save_bid(a):
-    conn = sqlite3.connect("auctions.db")
+    """
+    Record a snapshot of one auction, unless its newest stored snapshot
+    already has the same bid, bid count and views.
+    """
+    snapshot = (
+        float(a["current_bid"]["amount"]),
+        _int_or_none(a.get("total_bids")),
+        _int_or_none(a.get("total_views")),
+    )
+    conn = _connect()
     c = conn.cursor()
-    c.execute(
-        "INSERT INTO bid_history VALUES (?,?,?)",
-        (a["auction_id"], float(a["current_bid"]["amount"]),
-         datetime.now(timezone.utc).isoformat())
+    c.execute("""
+        SELECT bid, total_bids, total_views FROM bid_history
+        WHERE auction_id=?
+        ORDER BY timestamp DESC LIMIT 1
+    """, (a["auction_id"],))
+    if c.fetchone() != snapshot:
+        c.execute(
+            "INSERT INTO bid_history (auction_id, bid, timestamp, total_bids, total_views) VALUES (?,?,?,?,?)",
+            (a["auction_id"], snapshot[0], datetime.now(timezone.utc).isoformat(), *snapshot[1:])
+        )
+        conn.commit()
+    conn.close()
+
+def _int_or_none(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+def _float_or_none(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+def _expire_at(a):
+    raw = (a.get("expire_date") or {}).get("utc", {}).get("datetime")
+    if not raw:
+        return None
+    try:
+        exp = datetime.fromisoformat(raw)
+    except ValueError:
+        return None
+    return exp.replace(tzinfo=timezone.utc).isoformat()
+
+def archive_auctions(auctions):
+    """
+    Records one bid snapshot per listed auction plus its static details,
+    so trajectories and final prices are kept for every auction we list
+    rather than only the ones that were opened.
+    """
+    now = datetime.now(timezone.utc).isoformat()
+    snapshots = []
+    details = []
+    for a in auctions:
+        try:
+            bid = float(a["current_bid"]["amount"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        aid = a["auction_id"]
+        marker = (a.get("facility") or {}).get("marker") or {}
+        lat, lng = _float_or_none(marker.get("lat")), _float_or_none(marker.get("lng"))
+        snapshots.append(
+            (aid, bid, now, _int_or_none(a.get("total_bids")), _int_or_none(a.get("total_views")))
+        )
+        details.append(
+            (
+                aid,
+                a.get("facility_name") or "",
+                a.get("city") or "",
+                a.get("state") or "",
+                a.get("unit_size") or "",
+                a.get("unit_contents") or "",
+                _expire_at(a),
+                lat,
+                lng,
+                now,
+                now,
+                geohash(lat, lng),
+            )
+        )
+
+    conn = _connect()
+    c = conn.cursor()
+    c.executemany(
+        "INSERT INTO bid_history (auction_id, bid, timestamp, total_bids, total_views) VALUES (?,?,?,?,?)",
+        snapshots,
+    )
+    c.executemany(
+        """
+        INSERT INTO auctions (auction_id, facility_name, city, state, unit_size, unit_contents, expire_at, lat, lng, first_seen, last_seen, geohash)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(auction_id) DO UPDATE SET
+            facility_name=excluded.facility_name,
+            city=excluded.city,
+            state=excluded.state,
+            unit_size=excluded.unit_size,
+            unit_contents=excluded.unit_contents,
+            expire_at=COALESCE(excluded.expire_at, auctions.expire_at),
+            lat=COALESCE(excluded.lat, auctions.lat),
+            lng=COALESCE(excluded.lng, auctions.lng),
+            geohash=COALESCE(excluded.geohash, auctions.geohash),
+            last_seen=excluded.last_seen
+        """,
+        details,
     )
     conn.commit()
     conn.close()
 
-def bid_velocity(aid):
-    conn = sqlite3.connect("auctions.db")
+def load_active_auctions(now=None, near=None):
+    """
+    Archived auctions that have not expired yet, with their latest snapshot,
+    shaped like the search API rows (current_bid/total_bids/total_views plus
+    expire_at as an ISO string).
+
+    `near=(lat, lng, miles)` keeps only auctions within that radius. The
+    geohash index narrows the candidates to a few cells first, so only
+    those rows are read and measured. Those results come back nearest
+    first rather than by expiry.
+    """
+    now = (now or datetime.now(timezone.utc)).isoformat()
+    where = "a.expire_at IS NOT NULL AND julianday(a.expire_at) > julianday(?)"
+    params = [now]
+    if near:
+        prefixes = geohash_ranges(*near)
+        where += " AND (" + " OR ".join(["(a.geohash >= ? AND a.geohash < ?)"] * len(prefixes)) + ")"
+        for prefix in prefixes:
+            params += [prefix, prefix + "~"]
+
+    conn = _connect()
     c = conn.cursor()
-    c.execute("""
-        SELECT bid, timestamp FROM bid_history
-        WHERE auction_id=?
-        ORDER BY timestamp DESC LIMIT 5
-    """, (aid,))
+    c.execute(
+        f"""
+        SELECT a.auction_id, a.facility_name, a.city, a.state, a.unit_size, a.unit_contents,
+               a.expire_at, a.lat, a.lng, h.bid, h.total_bids, h.total_views
+        FROM auctions a
+        JOIN (
+            SELECT auction_id, bid, total_bids, total_views,
+                   ROW_NUMBER() OVER (PARTITION BY auction_id ORDER BY timestamp DESC) AS rn
+            FROM bid_history
+            WHERE auction_id IN (SELECT a.auction_id FROM auctions a WHERE {where})
+        ) h ON h.auction_id = a.auction_id AND h.rn = 1
+        ORDER BY a.expire_at
+        """,
+        params,
+    )
     rows = c.fetchall()
     conn.close()
 
+    auctions = [
+        {
+            "auction_id": aid,
+            "facility_name": facility_name or "",
+            "city": city or "",
+            "state": state or "",
+            "unit_size": unit_size or "",
+            "unit_contents": unit_contents or "",
+            "expire_at": expire_at,
+            "facility": {"marker": {"lat": lat, "lng": lng}},
+            "current_bid": {"amount": float(bid or 0)},
+            "total_bids": int(total_bids or 0),
+            "total_views": int(total_views or 0),
+        }
+        for aid, facility_name, city, state, unit_size, unit_contents, expire_at, lat, lng, bid, total_bids, total_views in rows
+    ]
+    if not near:
+        return auctions
+
+    lat, lng, miles = near
+    distances = haversine_miles(
+        lat, lng,
+        [a["facility"]["marker"]["lat"] for a in auctions],
+        [a["facility"]["marker"]["lng"] for a in auctions],
+    )
+    order = np.argsort(distances, kind="stable")
+    return [auctions[i] for i in order if distances[i] <= miles]
+
+def _velocity_from_rows(rows):
+    # rows are (bid, timestamp) pairs, newest first
     if len(rows) < 2:
         return 0.0
 
-    from datetime import datetime, timezone
     b0, t0 = rows[0]
     b1, t1 = rows[-1]
 
@@ -87,25 +346,120 @@ def bid_velocity(aid):
     dt = (t0 - t1).total_seconds() / 3600
     return 0.0 if dt <= 0 else (b0 - b1) / dt
 
+def bid_velocity(aid):
+    conn = _connect()
+    c = conn.cursor()
+    c.execute("""
+        SELECT bid, timestamp FROM bid_history
+        WHERE auction_id=?
+        ORDER BY timestamp DESC LIMIT 5
+    """, (aid,))
+    rows = c.fetchall()
+    conn.close()
+
+    return _velocity_from_rows(rows)
+
+def bid_velocity_many(aids):
+    """
+    Batched bid_velocity: one round trip per chunk of auction ids.
+    Returns {auction_id: velocity}; ids without history map to 0.0.
+    """
+    aids = list(dict.fromkeys(aids))
+    history = {aid: [] for aid in aids}
+
+    conn = _connect()
+    c = conn.cursor()
+    for chunk in _chunks(aids):
+        marks = ",".join("?" * len(chunk))
+        c.execute(f"""
+            SELECT auction_id, bid, timestamp FROM (
+                SELECT auction_id, bid, timestamp,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY auction_id ORDER BY timestamp DESC
+                       ) AS rn
+                FROM bid_history
+                WHERE auction_id IN ({marks})
+            )
+            WHERE rn <= 5
+            ORDER BY auction_id, rn
+        """, chunk)
+        for aid, bid, ts in c.fetchall():
+            history[aid].append((bid, ts))
+    conn.close()
+
+    return {aid: _velocity_from_rows(rows) for aid, rows in history.items()}
+
 def get_recent_bids(auction_id, limit=20):
     """
-    Returns a list of recent bid amounts for sparkline rendering.
+    Returns the newest `limit` bid amounts for sparkline rendering.
     Oldest → newest order.
     """
-    conn = sqlite3.connect("auctions.db")
+    conn = _connect()
     c = conn.cursor()
 
     c.execute("""
         SELECT bid FROM bid_history
         WHERE auction_id = ?
-        ORDER BY timestamp ASC
+        ORDER BY timestamp DESC
         LIMIT ?
     """, (auction_id, limit))
 
     rows = c.fetchall()
     conn.close()
 
-    return [r[0] for r in rows]
+    return [r[0] for r in reversed(rows)]
+
+
+def get_recent_bids_many(auction_ids, limit=20):
+    """
+    Batched get_recent_bids. Returns {auction_id: [bids]} in the same
+    order get_recent_bids uses.
+    """
+    auction_ids = list(dict.fromkeys(auction_ids))
+    bids = {aid: [] for aid in auction_ids}
+
+    conn = _connect()
+    c = conn.cursor()
+    for chunk in _chunks(auction_ids):
+        marks = ",".join("?" * len(chunk))
+        c.execute(f"""
+            SELECT auction_id, bid FROM (
+                SELECT auction_id, bid,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY auction_id ORDER BY timestamp DESC
+                       ) AS rn
+                FROM bid_history
+                WHERE auction_id IN ({marks})
+            )
+            WHERE rn <= ?
+            ORDER BY auction_id, rn DESC
+        """, (*chunk, limit))
+        for aid, bid in c.fetchall():
+            bids[aid].append(bid)
+    conn.close()
+
+    return bids
+
+
+def get_bid_history(auction_id):
+    """Every recorded (timestamp, bid) of an auction, oldest first, for the full-history chart."""
+    conn = _connect()
+    c = conn.cursor()
+    c.execute("""
+        SELECT timestamp, bid FROM bid_history
+        WHERE auction_id = ?
+        ORDER BY timestamp ASC
+    """, (auction_id,))
+    rows = c.fetchall()
+    conn.close()
+
+    history = []
+    for ts, bid in rows:
+        try:
+            history.append((datetime.fromisoformat(ts).timestamp(), float(bid)))
+        except (TypeError, ValueError):
+            continue
+    return history
 
 
 def save_vision_result(
@@ -114,8 +468,9 @@ def save_vision_result(
     facility_name="",
     manual_items=None,
     manual_totals=None,
+    unit_size="",
 ):
-    conn = sqlite3.connect("auctions.db")
+    conn = _connect()
     c = conn.cursor()
 
     manual_json = None
@@ -134,8 +489,8 @@ def save_vision_result(
 
     c.execute(
         """
-        INSERT INTO vision_results (auction_id, items_json, total_low, total_high, updated_at, facility_name, manual_items_json, manual_total_low, manual_total_high)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        INSERT INTO vision_results (auction_id, items_json, total_low, total_high, updated_at, facility_name, manual_items_json, manual_total_low, manual_total_high, unit_size)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         ON CONFLICT(auction_id) DO UPDATE SET
             items_json=excluded.items_json,
             total_low=excluded.total_low,
@@ -144,7 +499,8 @@ def save_vision_result(
             facility_name=COALESCE(NULLIF(excluded.facility_name, ''), vision_results.facility_name),
             manual_items_json=excluded.manual_items_json,
             manual_total_low=excluded.manual_total_low,
-            manual_total_high=excluded.manual_total_high
+            manual_total_high=excluded.manual_total_high,
+            unit_size=COALESCE(NULLIF(excluded.unit_size, ''), vision_results.unit_size)
         """,
         (
             auction_id,
@@ -156,6 +512,7 @@ def save_vision_result(
             manual_json,
             manual_low,
             manual_high,
+            unit_size,
         ),
     )
 
@@ -163,8 +520,31 @@ def save_vision_result(
     conn.close()
 
 
+def _vision_result_from_row(row):
+    items_json, total_low, total_high, manual_json, manual_low, manual_high = row
+
+    try:
+        items = json.loads(items_json)
+    except Exception:
+        items = []
+
+    try:
+        manual_items = json.loads(manual_json) if manual_json is not None else []
+    except Exception:
+        manual_items = []
+
+    return {
+        "items": items,
+        "total_low": float(total_low or 0),
+        "total_high": float(total_high or 0),
+        "manual_items": manual_items,
+        "manual_total_low": float(manual_low) if manual_low is not None else None,
+        "manual_total_high": float(manual_high) if manual_high is not None else None,
+    }
+
+
 def load_vision_result(auction_id):
-    conn = sqlite3.connect("auctions.db")
+    conn = _connect()
     c = conn.cursor()
 
     c.execute(
@@ -182,30 +562,37 @@ def load_vision_result(auction_id):
     if not row:
         return None
 
-    items_json, total_low, total_high, manual_json, manual_low, manual_high = row
+    return _vision_result_from_row(row)
 
-    try:
-        items = json.loads(items_json)
-    except Exception:
-        items = []
 
-    try:
-        manual_items = json.loads(manual_json) if manual_json is not None else []
-    except Exception:
-        manual_items = []
+def load_vision_result_many(auction_ids):
+    """
+    Batched load_vision_result. Returns {auction_id: result} for the ids
+    that have a saved analysis; missing ids are left out.
+    """
+    results = {}
 
-    return {
-        "items": items,
-        "total_low": float(total_low or 0),
-        "total_high": float(total_high or 0),
-        "manual_items": manual_items,
-        "manual_total_low": float(manual_low) if manual_low is not None else None,
-        "manual_total_high": float(manual_high) if manual_high is not None else None,
-    }
+    conn = _connect()
+    c = conn.cursor()
+    for chunk in _chunks(dict.fromkeys(auction_ids)):
+        marks = ",".join("?" * len(chunk))
+        c.execute(
+            f"""
+            SELECT auction_id, items_json, total_low, total_high, manual_items_json, manual_total_low, manual_total_high
+            FROM vision_results
+            WHERE auction_id IN ({marks})
+            """,
+            chunk,
+        )
+        for aid, *row in c.fetchall():
+            results[aid] = _vision_result_from_row(row)
+    conn.close()
+
+    return results
 
 
 def get_recent_vision_results(limit=10):
-    conn = sqlite3.connect("auctions.db")
+    conn = _connect()
     c = conn.cursor()
 
     c.execute(
@@ -239,7 +626,7 @@ def get_recent_vision_results(limit=10):
 
 
 def reset_manual_vision_result(auction_id):
-    conn = sqlite3.connect("auctions.db")
+    conn = _connect()
     c = conn.cursor()
     c.execute(
         """
@@ -251,3 +638,203 @@ def reset_manual_vision_result(auction_id):
     )
     conn.commit()
     conn.close()
+
+
+def load_vision_training_rows():
+    """
+    Every saved analysis as {"auction_id", "unit_size", "items",
+    "manual_items"} for offline model fitting.
+    """
+    conn = _connect()
+    c = conn.cursor()
+    c.execute(
+        """
+        SELECT auction_id, unit_size, items_json, manual_items_json
+        FROM vision_results
+        """
+    )
+    rows = c.fetchall()
+    conn.close()
+
+    results = []
+    for aid, unit_size, items_json, manual_json in rows:
+        try:
+            items = json.loads(items_json) if items_json else []
+        except Exception:
+            items = []
+        try:
+            manual_items = json.loads(manual_json) if manual_json else []
+        except Exception:
+            manual_items = []
+        results.append(
+            {
+                "auction_id": aid,
+                "unit_size": unit_size or "",
+                "items": items,
+                "manual_items": manual_items,
+            }
+        )
+    return results
+
+
+def save_price_lookup(rows):
+    """Replaces the price_lookup table with freshly fitted rows."""
+    conn = _connect()
+    c = conn.cursor()
+    c.execute("DELETE FROM price_lookup")
+    c.executemany(
+        """
+        INSERT INTO price_lookup (kind, key, samples, low, high, low_p25, high_p75, multiplier, fitted_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        [
+            (
+                r["kind"],
+                r["key"],
+                int(r["samples"]),
+                r.get("low"),
+                r.get("high"),
+                r.get("low_p25"),
+                r.get("high_p75"),
+                r.get("multiplier"),
+                r.get("fitted_at") or datetime.now(timezone.utc).isoformat(),
+            )
+            for r in rows
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+
+def load_price_lookup():
+    """Returns {(kind, key): row dict} from the price_lookup table."""
+    conn = _connect()
+    c = conn.cursor()
+    try:
+        c.execute(
+            """
+            SELECT kind, key, samples, low, high, low_p25, high_p75, multiplier, fitted_at
+            FROM price_lookup
+            """
+        )
+        rows = c.fetchall()
+    except sqlite3.OperationalError:
+        # Table not created yet
+        rows = []
+    conn.close()
+
+    lookup = {}
+    for kind, key, samples, low, high, low_p25, high_p75, multiplier, fitted_at in rows:
+        lookup[(kind, key)] = {
+            "samples": samples,
+            "low": low,
+            "high": high,
+            "low_p25": low_p25,
+            "high_p75": high_p75,
+            "multiplier": multiplier,
+            "fitted_at": fitted_at,
+        }
+    return lookup
+
+
+def load_final_price_training_rows(max_gap_hours=2.0, now=None):
+    """
+    One row per snapshot of an ended auction, paired with its final price.
+
+    The final price is the last recorded bid, so auctions whose last
+    snapshot is more than max_gap_hours before expiry are skipped: we
+    stopped watching them and do not know where they ended.
+    """
+    now = (now or datetime.now(timezone.utc)).isoformat()
+    conn = _connect()
+    c = conn.cursor()
+    c.execute(
+        """
+        WITH last AS (
+            SELECT h.auction_id, h.bid AS final_bid, h.timestamp AS final_ts
+            FROM bid_history h
+            JOIN (
+                SELECT auction_id, MAX(timestamp) AS ts
+                FROM bid_history
+                GROUP BY auction_id
+            ) m ON m.auction_id = h.auction_id AND m.ts = h.timestamp
+        ),
+        ended AS (
+            SELECT a.auction_id, a.expire_at, a.unit_size, a.unit_contents, l.final_bid
+            FROM auctions a
+            JOIN last l ON l.auction_id = a.auction_id
+            WHERE a.expire_at IS NOT NULL
+              AND julianday(a.expire_at) < julianday(?)
+              AND (julianday(a.expire_at) - julianday(l.final_ts)) * 24 <= ?
+        )
+        SELECT e.auction_id, h.bid, h.total_bids, h.total_views,
+               (julianday(e.expire_at) - julianday(h.timestamp)) * 24 AS hours_left,
+               e.unit_size, e.unit_contents, e.final_bid
+        FROM bid_history h
+        JOIN ended e ON e.auction_id = h.auction_id
+        WHERE julianday(h.timestamp) < julianday(e.expire_at)
+        ORDER BY e.auction_id, h.timestamp
+        """,
+        (now, max_gap_hours),
+    )
+    rows = c.fetchall()
+    conn.close()
+
+    return [
+        {
+            "auction_id": aid,
+            "bid": float(bid or 0),
+            "total_bids": int(total_bids or 0),
+            "total_views": int(total_views or 0),
+            "hours_left": float(hours_left),
+            "unit_size": unit_size or "",
+            "unit_contents": unit_contents or "",
+            "final_bid": float(final_bid or 0),
+        }
+        for aid, bid, total_bids, total_views, hours_left, unit_size, unit_contents, final_bid in rows
+    ]
+
+
+def save_final_price_model(coefficients, samples):
+    fitted_at = datetime.now(timezone.utc).isoformat()
+    conn = _connect()
+    c = conn.cursor()
+    c.execute("DELETE FROM final_price_model")
+    c.executemany(
+        "INSERT INTO final_price_model (feature, coef, samples, fitted_at) VALUES (?, ?, ?, ?)",
+        [(name, float(coef), int(samples), fitted_at) for name, coef in coefficients.items()],
+    )
+    conn.commit()
+    conn.close()
+
+
+def load_final_price_model():
+    """Returns {feature: coefficient}; empty until a model has been trained."""
+    conn = _connect()
+    c = conn.cursor()
+    try:
+        c.execute("SELECT feature, coef FROM final_price_model")
+        rows = c.fetchall()
+    except sqlite3.OperationalError:
+        # Table not created yet
+        rows = []
+    conn.close()
+    return {feature: coef for feature, coef in rows}
+
+
+def load_zip_coords():
+    """Every ZIP resolved so far, as {zip: (lat, lng)}."""
+    conn = _connect()
+    rows = conn.execute("SELECT zip, lat, lng FROM zip_coords").fetchall()
+    conn.close()
+    return {z: (lat, lng) for z, lat, lng in rows}
+
+
+def save_zip_coords(zip_code, lat, lng):
+    conn = _connect()
+    conn.execute(
+        "INSERT OR REPLACE INTO zip_coords (zip, lat, lng, resolved_at) VALUES (?, ?, ?, ?)",
+        (zip_code, lat, lng, datetime.now(timezone.utc).isoformat()),
+    )
+    conn.commit()
+    conn.close()
@@ -0,0 +1,112 @@
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QFrame, QHBoxLayout, QLabel, QSizePolicy, QVBoxLayout
+
+from ui_helpers import ClickableLabel
+
+STATUS_STYLE = (
+    "color:{fg}; padding:2px 6px; border-radius:8px;"
+    "background:{bg}; font-size:11px;"
+)
+
+
+def _set_text(widget, text):
+    # setText relayouts even when nothing changed
+    if widget.text() != text:
+        widget.setText(text)
+
+
+class WidgetPool:
+    """
+    Reusable widgets of one kind living in one layout.
+
+    `take(n)` hands back the first n widgets, creating them with `factory`
+    and placing them with `place(widget, index)` only when the pool is too
+    small; surplus widgets are hidden instead of deleted. Callers rebind
+    the returned widgets to new data, so switching auctions reuses the
+    same widgets rather than rebuilding the panel.
+    """
+
+    def __init__(self, factory, place):
+        self.factory = factory
+        self.place = place
+        self.widgets = []
+        self.active = 0
+
+    def take(self, count):
+        while len(self.widgets) < count:
+            widget = self.factory()
+            self.place(widget, len(self.widgets))
+            self.widgets.append(widget)
+        for i, widget in enumerate(self.widgets):
+            visible = i < count
+            if widget.isHidden() == visible:
+                widget.setVisible(visible)
+        self.active = count
+        return self.widgets[:count]
+
+    def __iter__(self):
+        return iter(self.widgets[:self.active])
+
+
+class DetailRow(QFrame):
+    def __init__(self):
+        super().__init__()
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(6, 4, 6, 4)
+        layout.setSpacing(12)
+
+        self.title = QLabel()
+        self.title.setStyleSheet("font-weight:600;")
+        self.title.setMinimumWidth(120)
+
+        self.value = QLabel()
+        self.value.setWordWrap(True)
+        self.value.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+
+        layout.addWidget(self.title)
+        layout.addWidget(self.value, 1)
+
+    def bind(self, title, value, max_width):
+        _set_text(self.title, title)
+        _set_text(self.value, str(value))
+        if self.value.maximumWidth() != max_width:
+            self.value.setMaximumWidth(max_width)
+
+
+class ImageTile(QFrame):
+    """Gallery tile: the picture and its analysis status."""
+
+    def __init__(self, size):
+        super().__init__()
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(4, 4, 4, 4)
+        layout.setSpacing(6)
+
+        self.label = ClickableLabel()
+        self.label.setAlignment(Qt.AlignCenter)
+        self.label.setFixedSize(size, size)
+        self.label.setStyleSheet("color:#9ca3af; border:1px dashed #1f2937;")
+
+        self.status = QLabel()
+        self.status.setAlignment(Qt.AlignCenter)
+
+        layout.addWidget(self.label)
+        layout.addWidget(self.status)
+        self.url = None
+
+    def bind(self, url, index):
+        """Points the tile at an image; returns False when it already shows `url`."""
+        self.label.payload = {"url": url, "index": index}
+        if url == self.url:
+            return False
+        self.url = url
+        self.label.clear()
+        self.label.setText("Loading…")
+        return True
+
+    def set_status(self, text, background, color="white"):
+        _set_text(self.status, text)
+        style = STATUS_STYLE.format(fg=color, bg=background)
+        if self.status.styleSheet() != style:
+            self.status.setStyleSheet(style)
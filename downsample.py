@@ -0,0 +1,46 @@
+
+import numpy as np
+
+
+def lttb(x, y, threshold):
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+
+    Returns the indices of at most `threshold` points that keep the
+    visual shape of the series: the first and last points, plus, for
+    each bucket in between, the point forming the largest triangle with
+    the previously kept point and the next bucket's average. Spikes and
+    dips survive where plain striding would drop them.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    # threshold - 2 buckets between the fixed first and last points
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.intp)
+    keep = np.empty(threshold, dtype=np.intp)
+    keep[0] = 0
+    keep[-1] = n - 1
+
+    a = 0
+    for i in range(threshold - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nxt_hi = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[hi:nxt_hi].mean()
+        avg_y = y[hi:nxt_hi].mean()
+        area = np.abs(
+            (x[a] - avg_x) * (y[lo:hi] - y[a])
+            - (x[a] - x[lo:hi]) * (avg_y - y[a])
+        )
+        a = lo + int(area.argmax())
+        keep[i + 1] = a
+    return keep
+
+
+def visible_slice(x, x0, x1):
+    """Index range of points inside [x0, x1] plus one neighbour each side, so lines reach the edges."""
+    lo = max(int(np.searchsorted(x, x0, side="left")) - 1, 0)
+    hi = min(int(np.searchsorted(x, x1, side="right")) + 1, len(x))
+    return lo, hi
@@ -0,0 +1,156 @@
+
+import numpy as np
+
+from resale import unit_size_class
+
+FACETS = {
+    "state": "State",
+    "city": "City",
+    "facility": "Facility",
+    "size": "Unit Size",
+    "tag": "Contents",
+    "watchlist": "Watchlist",
+}
+
+WATCHED = "Watched"
+NOT_WATCHED = "Not watched"
+
+
+def facet_values(a, tags, watched):
+    """{facet: [values]} for one auction; tags are multi-valued."""
+    return {
+        "state": [a.get("state") or "?"],
+        "city": [a.get("city") or "?"],
+        "facility": [a.get("facility_name") or "?"],
+        "size": [unit_size_class(a.get("unit_size") or "") or "other"],
+        "tag": list(tags) or ["misc"],
+        "watchlist": [WATCHED if watched else NOT_WATCHED],
+    }
+
+
+# Set bits per byte value; works on every numpy, unlike np.bitwise_count
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def _popcount_rows(bits, packed_mask):
+    return _POPCOUNT[bits & packed_mask].sum(axis=1, dtype=np.int64)
+
+
+class FacetIndex:
+    """
+    Per-facet bitsets over the auction list.
+
+    Each facet value owns a packed bitset of the rows that have it. The
+    count for a value is popcount(value bits & context), where the context
+    is the other filters plus every *other* facet's selection, so picking
+    Akron still shows how many auctions the other cities have. Counts for
+    a facet are only recomputed when its context actually changed.
+    """
+
+    def __init__(self, auctions, tag_lists, watchlist=()):
+        self.rows = len(auctions)
+        watchlist = set(watchlist)
+        per_row = [
+            facet_values(a, tags, a["auction_id"] in watchlist)
+            for a, tags in zip(auctions, tag_lists)
+        ]
+
+        self.values = {}
+        self.bits = {}
+        for facet in FACETS:
+            rows_by_value = {}
+            for row, values in enumerate(per_row):
+                for value in values[facet]:
+                    rows_by_value.setdefault(value, []).append(row)
+            self.values[facet] = sorted(rows_by_value)
+            self._set_bits(facet, rows_by_value)
+
+        self.selected = {facet: set() for facet in FACETS}
+        self._masks = {}
+        self._counts = {}
+        self._contexts = {}
+
+    def _set_bits(self, facet, rows_by_value):
+        matrix = np.zeros((len(self.values[facet]), self.rows), dtype=bool)
+        for i, value in enumerate(self.values[facet]):
+            matrix[i, rows_by_value[value]] = True
+        self.bits[facet] = np.packbits(matrix, axis=1)
+
+    def _unpack(self, packed):
+        return np.unpackbits(packed, count=self.rows).astype(bool)
+
+    def set_watchlist(self, auction_ids, watchlist):
+        watched = np.fromiter((aid in watchlist for aid in auction_ids), dtype=bool, count=self.rows)
+        self.values["watchlist"] = [NOT_WATCHED, WATCHED]
+        self.bits["watchlist"] = np.packbits(np.vstack([~watched, watched]), axis=1)
+        self._invalidate("watchlist")
+
+    def _invalidate(self, facet):
+        self._masks.pop(facet, None)
+        # Every facet's context includes this one's selection
+        self._contexts.clear()
+
+    # ---- selection ----
+    def toggle(self, facet, value):
+        chosen = self.selected[facet]
+        if value in chosen:
+            chosen.discard(value)
+        else:
+            chosen.add(value)
+        self._invalidate(facet)
+
+    def clear(self, facet=None):
+        for name in ([facet] if facet else FACETS):
+            if self.selected[name]:
+                self.selected[name].clear()
+                self._invalidate(name)
+
+    def active(self):
+        return any(self.selected.values())
+
+    def facet_mask(self, facet):
+        """Packed rows matching any selected value of `facet`; None when nothing is selected."""
+        if not self.selected[facet]:
+            return None
+        mask = self._masks.get(facet)
+        if mask is None:
+            index = {v: i for i, v in enumerate(self.values[facet])}
+            picks = [index[v] for v in self.selected[facet] if v in index]
+            if picks:
+                mask = np.bitwise_or.reduce(self.bits[facet][picks], axis=0)
+            else:
+                mask = np.zeros(self.bits[facet].shape[1], dtype=np.uint8)
+            self._masks[facet] = mask
+        return mask
+
+    def mask(self):
+        """Row mask of every facet selection combined, None when no facet is active."""
+        combined = None
+        for facet in FACETS:
+            m = self.facet_mask(facet)
+            if m is not None:
+                combined = m if combined is None else combined & m
+        return None if combined is None else self._unpack(combined)
+
+    # ---- counts ----
+    def counts(self, base_mask):
+        """
+        {facet: {value: count}} under the non-facet filters in `base_mask`
+        and the other facets' selections.
+        """
+        packed_base = np.packbits(np.asarray(base_mask, dtype=bool))
+        out = {}
+        for facet in FACETS:
+            context = packed_base
+            for other in FACETS:
+                if other != facet:
+                    m = self.facet_mask(other)
+                    if m is not None:
+                        context = context & m
+
+            key = context.tobytes()
+            if self._contexts.get(facet) != key:
+                self._contexts[facet] = key
+                self._counts[facet] = dict(zip(self.values[facet], _popcount_rows(self.bits[facet], context).tolist()))
+            out[facet] = self._counts[facet]
+        return out
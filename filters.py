@@ -0,0 +1,107 @@
+
+import time
+
+import numpy as np
+
+# Slider changes closer together than this are coalesced into one pass
+FILTER_DEBOUNCE_MS = 60
+# Distance slider: notches of RADIUS_STEP_MILES up to MAX_RADIUS_MILES, which means no limit
+MAX_RADIUS_MILES = 200
+RADIUS_STEP_MILES = 5
+
+
+class FilterPipeline:
+    """
+    Turns the list filters into one boolean row mask.
+
+    Per-row score, hours-left and distance are computed once per data
+    change; the sliders only move thresholds, so a pass is a few
+    vectorized comparisons. Other filters (text search, facets) plug in as named
+    masks. Each threshold mask is cached until its threshold moves.
+    """
+
+    def __init__(self, min_score=0, max_hours=72, max_miles=np.inf):
+        self.min_score = min_score
+        self.max_hours = max_hours
+        self.max_miles = max_miles
+        self.scores = np.zeros(0)
+        self.hours_left = np.zeros(0)
+        self.distances = np.zeros(0)
+        self.masks = {}
+        self._score_mask = None
+        self._hours_mask = None
+        self._distance_mask = None
+        self.matched = 0
+
+    def __len__(self):
+        return len(self.scores)
+
+    def set_rows(self, scores, expire_at, now=None):
+        """New auction list: drops every named mask."""
+        self.masks.clear()
+        self.set_scores(scores)
+        self.refresh_hours(expire_at, now)
+        self.set_distances(np.full(len(self.scores), np.nan))
+
+    def set_scores(self, scores):
+        self.scores = np.asarray(scores)
+        self._score_mask = None
+
+    def refresh_hours(self, expire_at, now=None):
+        now = time.time() if now is None else now
+        self.hours_left = np.clip((np.asarray(expire_at, dtype=np.float64) - now) / 3600, 0, None)
+        self._hours_mask = None
+
+    def set_distances(self, distances):
+        """Miles to the nearest search origin per row; NaN (unknown) always passes."""
+        distances = np.asarray(distances, dtype=np.float64)
+        if distances.shape != self.scores.shape:
+            raise ValueError("distance array length does not match the auction list")
+        self.distances = distances
+        self._distance_mask = None
+
+    def set_thresholds(self, min_score=None, max_hours=None, max_miles=None):
+        """Moves thresholds; None leaves one as it is and max_miles=inf turns the radius off."""
+        if min_score is not None and min_score != self.min_score:
+            self.min_score = min_score
+            self._score_mask = None
+        if max_hours is not None and max_hours != self.max_hours:
+            self.max_hours = max_hours
+            self._hours_mask = None
+        if max_miles is not None and max_miles != self.max_miles:
+            self.max_miles = max_miles
+            self._distance_mask = None
+
+    def set_mask(self, name, mask):
+        """Adds or replaces a named mask; None removes it."""
+        if mask is None:
+            self.masks.pop(name, None)
+            return
+        mask = np.asarray(mask, dtype=bool)
+        if mask.shape != self.scores.shape:
+            raise ValueError(f"{name} mask length does not match the auction list")
+        self.masks[name] = mask
+
+    def threshold_mask(self):
+        if self._score_mask is None:
+            self._score_mask = self.scores >= self.min_score
+        if self._hours_mask is None:
+            self._hours_mask = self.hours_left <= self.max_hours
+        mask = self._score_mask & self._hours_mask
+        if np.isfinite(self.max_miles):
+            if self._distance_mask is None:
+                self._distance_mask = ~(self.distances > self.max_miles)
+            mask = mask & self._distance_mask
+        return mask
+
+    def run(self, exclude=()):
+        """
+        Rows passing every filter. `exclude` names masks to leave out,
+        e.g. the facet selection when counting facet values.
+        """
+        mask = self.threshold_mask()
+        self.matched = int(mask.sum())
+        for name, extra in self.masks.items():
+            if name not in exclude:
+                mask = mask & extra
+        return mask
@@ -0,0 +1,59 @@
+
+import numpy as np
+
+
+def marker_coords(auctions):
+    """
+    Facility latitude and longitude of every auction as float arrays.
+
+    Markers come from the API as numbers or numeric strings; missing,
+    unparsable or out-of-range coordinates become NaN, so callers can
+    mask them out with np.isfinite instead of re-validating each one.
+    """
+    lat = np.full(len(auctions), np.nan)
+    lng = np.full(len(auctions), np.nan)
+    for i, a in enumerate(auctions):
+        marker = (a.get("facility") or {}).get("marker") or {}
+        try:
+            lat[i] = float(marker.get("lat"))
+            lng[i] = float(marker.get("lng"))
+        except (TypeError, ValueError):
+            lat[i] = lng[i] = np.nan
+    bad = ~((np.abs(lat) <= 90) & (np.abs(lng) <= 180))
+    lat[bad] = np.nan
+    lng[bad] = np.nan
+    return lat, lng
+
+
+EARTH_RADIUS_MILES = 3958.8
+
+
+def haversine_miles(lat1, lng1, lat2, lng2):
+    """Great-circle distance in miles; broadcasts like any numpy expression."""
+    lat1, lng1, lat2, lng2 = (np.radians(np.asarray(v, dtype=np.float64)) for v in (lat1, lng1, lat2, lng2))
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_MILES * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def nearest_origin(origins, lat, lng):
+    """
+    Distance from each point to its closest origin, and that origin's
+    index, in one (points x origins) pass. Points without coordinates,
+    or every point when there are no origins, get NaN and -1.
+    """
+    lat = np.asarray(lat, dtype=np.float64)
+    lng = np.asarray(lng, dtype=np.float64)
+    distances = np.full(len(lat), np.nan)
+    which = np.full(len(lat), -1, dtype=np.intp)
+    origins = np.asarray(origins, dtype=np.float64).reshape(-1, 2)
+    valid = np.isfinite(lat) & np.isfinite(lng)
+    if not len(origins) or not valid.any():
+        return distances, which
+
+    d = haversine_miles(lat[valid, None], lng[valid, None], origins[None, :, 0], origins[None, :, 1])
+    which[valid] = d.argmin(axis=1)
+    distances[valid] = d[np.arange(len(d)), which[valid]]
+    return distances, which
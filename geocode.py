@@ -0,0 +1,118 @@
+
+import os
+
+import numpy as np
+
+# Precomputed US ZIP centroids, rebuilt from pgeocode when missing
+ZIP_CENTROIDS_FILE = "zip_centroids.npz"
+# After a failed build (e.g. offline on first run) wait this long before retrying
+GEOCODER_RETRY_SECONDS = 10 * 60
+MAX_ZIP = 99999
+
+
+def zip_key(zip_code):
+    """Integer key of a 5-digit ZIP ('02134', '44647-1234', 2134), or None."""
+    text = str(zip_code).strip()[:5]
+    if not text.isdigit():
+        return None
+    return int(text)
+
+
+def parse_zip_list(text):
+    """Valid 5-digit ZIPs in a comma or space separated list, in order and without repeats."""
+    zips = []
+    for part in str(text).replace(",", " ").split():
+        if len(part) == 5 and part.isdigit() and part not in zips:
+            zips.append(part)
+    return zips
+
+
+class ZipCentroids:
+    """
+    Every US ZIP centroid as three parallel arrays sorted by ZIP.
+
+    A lookup is a binary search over an int32 array, so resolving a ZIP
+    needs neither pandas nor the pgeocode dataset once the arrays exist,
+    and the whole table is about half a megabyte in memory.
+    """
+
+    def __init__(self, zips, lat, lng):
+        self.zips = np.asarray(zips, dtype=np.int32)
+        self.lat = np.asarray(lat, dtype=np.float32)
+        self.lng = np.asarray(lng, dtype=np.float32)
+
+    @classmethod
+    def from_records(cls, codes, lat, lng):
+        """Builds sorted arrays from unsorted ZIP/lat/lng columns, skipping invalid rows."""
+        keys = np.array([zip_key(c) for c in codes], dtype=object)
+        lat = np.asarray(lat, dtype=np.float64)
+        lng = np.asarray(lng, dtype=np.float64)
+        valid = (keys != None) & np.isfinite(lat) & np.isfinite(lng)  # noqa: E711
+        keys = keys[valid].astype(np.int64)
+        order = np.argsort(keys, kind="stable")
+        keys, lat, lng = keys[order], lat[valid][order], lng[valid][order]
+        # Keep one centroid per ZIP
+        first = np.ones(len(keys), dtype=bool)
+        first[1:] = keys[1:] != keys[:-1]
+        return cls(keys[first], lat[first], lng[first])
+
+    def __len__(self):
+        return len(self.zips)
+
+    def lookup(self, zip_code):
+        """(lat, lng) of a ZIP, or None when it is unknown."""
+        key = zip_key(zip_code)
+        if key is None or not len(self.zips):
+            return None
+        i = int(np.searchsorted(self.zips, key))
+        if i == len(self.zips) or self.zips[i] != key:
+            return None
+        # float32 storage; six decimals is ~0.1 m, well past centroid accuracy
+        return round(float(self.lat[i]), 6), round(float(self.lng[i]), 6)
+
+    def lookup_many(self, zip_codes):
+        """Latitude and longitude arrays for many ZIPs at once; NaN where unknown."""
+        keys = np.array([zip_key(z) or -1 for z in zip_codes], dtype=np.int64)
+        lat = np.full(len(keys), np.nan)
+        lng = np.full(len(keys), np.nan)
+        if not len(self.zips):
+            return lat, lng
+        idx = np.minimum(np.searchsorted(self.zips, keys), len(self.zips) - 1)
+        found = self.zips[idx] == keys
+        lat[found] = self.lat[idx[found]]
+        lng[found] = self.lng[idx[found]]
+        return lat, lng
+
+    def save(self, path):
+        tmp = f"{path}.tmp.npz"
+        np.savez_compressed(tmp, zips=self.zips, lat=self.lat, lng=self.lng)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            return cls(data["zips"], data["lat"], data["lng"])
+
+
+def load_zip_centroids(path=ZIP_CENTROIDS_FILE):
+    """
+    The ZIP centroid arrays, built from pgeocode's US dataset and saved
+    to `path` the first time. That first build loads (and may download)
+    the dataset, so call this off the GUI thread.
+    """
+    try:
+        return ZipCentroids.load(path)
+    except (OSError, KeyError, ValueError):
+        pass
+
+    import pgeocode
+
+    nominatim = pgeocode.Nominatim("us")
+    # Ask the public query API for the whole 5-digit ZIP space at once;
+    # codes that do not exist come back as NaN and are dropped
+    frame = nominatim.query_postal_code([f"{key:05d}" for key in range(MAX_ZIP + 1)])
+    centroids = ZipCentroids.from_records(
+        list(frame["postal_code"]), frame["latitude"], frame["longitude"]
+    )
+    centroids.save(path)
+    return centroids
@@ -0,0 +1,269 @@
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+import requests
+
+IMAGE_CACHE_DIR = "image_cache"
+MAX_DISK_BYTES = 512 * 1024 * 1024
+MAX_MEMORY_BYTES = 64 * 1024 * 1024
+# Cached bytes younger than this are served without asking the server
+REVALIDATE_AFTER = 24 * 3600
+CHUNK_SIZE = 64 * 1024
+# Last-use times of cache hits are written in batches, not one commit per hit
+USED_FLUSH_COUNT = 256
+USED_FLUSH_SECONDS = 30
+
+
+class ImageCache:
+    """
+    Two-tier image cache shared by the tile loader and the vision worker.
+
+    Disk tier: raw downloaded bytes stored content-addressed by sha256
+    under `directory`, with a small sqlite index mapping each URL to its
+    blob plus the ETag/Last-Modified needed to revalidate it. Blobs are
+    evicted least-recently-used once they exceed `max_disk_bytes`. Hits
+    only note their time in memory; those are written in batches (and
+    before every eviction), so reading a cached image never commits.
+
+    Memory tier: decoded thumbnails keyed by URL in an LRU capped at
+    `max_memory_bytes`; the caller states each entry's size.
+    """
+
+    def __init__(
+        self,
+        directory=IMAGE_CACHE_DIR,
+        max_disk_bytes=MAX_DISK_BYTES,
+        max_memory_bytes=MAX_MEMORY_BYTES,
+        revalidate_after=REVALIDATE_AFTER,
+        headers=None,
+    ):
+        self.directory = directory
+        self.headers = dict(headers or {})
+        self.max_disk_bytes = max_disk_bytes
+        self.max_memory_bytes = max_memory_bytes
+        self.revalidate_after = revalidate_after
+        self._lock = threading.Lock()
+        self._ready = False
+        self._thumbs = OrderedDict()
+        self._thumb_bytes = 0
+        self._used = {}
+        self._used_flushed_at = time.time()
+        self.hits = 0
+        self.revalidated = 0
+        self.downloads = 0
+
+    # ---- disk tier ----
+    def _connect(self):
+        return sqlite3.connect(os.path.join(self.directory, "index.sqlite"), timeout=10)
+
+    def _ensure(self):
+        if self._ready:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        conn = self._connect()
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS blobs (
+                sha TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                used_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS urls (
+                url TEXT PRIMARY KEY,
+                sha TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_blobs_used ON blobs(used_at);
+            """
+        )
+        conn.commit()
+        conn.close()
+        self._ready = True
+
+    def _blob_path(self, sha):
+        return os.path.join(self.directory, sha[:2], sha)
+
+    def _read_blob(self, sha):
+        try:
+            with open(self._blob_path(sha), "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _lookup(self, url):
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT sha, etag, last_modified, fetched_at FROM urls WHERE url=?", (url,)
+        ).fetchone()
+        conn.close()
+        return row
+
+    def _touch(self, url, sha, revalidated=False):
+        now = time.time()
+        if revalidated:
+            conn = self._connect()
+            conn.execute("UPDATE urls SET fetched_at=? WHERE url=?", (now, url))
+            conn.commit()
+            conn.close()
+        with self._lock:
+            self._used[sha] = now
+            due = len(self._used) >= USED_FLUSH_COUNT or now - self._used_flushed_at >= USED_FLUSH_SECONDS
+        if due:
+            self.flush_used()
+
+    def flush_used(self):
+        """Writes the batched last-use times of cache hits to the index."""
+        with self._lock:
+            self._flush_used()
+
+    def _flush_used(self):
+        # Caller holds self._lock
+        used, self._used = self._used, {}
+        self._used_flushed_at = time.time()
+        if not used:
+            return
+        conn = self._connect()
+        conn.executemany(
+            "UPDATE blobs SET used_at=MAX(used_at, ?) WHERE sha=?",
+            [(at, sha) for sha, at in used.items()],
+        )
+        conn.commit()
+        conn.close()
+
+    def _store(self, url, data, etag, last_modified):
+        sha = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(sha)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+
+        now = time.time()
+        conn = self._connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO blobs (sha, size, used_at) VALUES (?, ?, ?)",
+            (sha, len(data), now),
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO urls (url, sha, etag, last_modified, fetched_at) VALUES (?, ?, ?, ?, ?)",
+            (url, sha, etag, last_modified, now),
+        )
+        conn.commit()
+        conn.close()
+        self.evict()
+
+    def evict(self):
+        """Deletes least recently used blobs until the disk tier fits its cap."""
+        with self._lock:
+            self._flush_used()
+            conn = self._connect()
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+            if total <= self.max_disk_bytes:
+                conn.close()
+                return
+            victims = []
+            for sha, size in conn.execute("SELECT sha, size FROM blobs ORDER BY used_at"):
+                if total <= self.max_disk_bytes:
+                    break
+                victims.append(sha)
+                total -= size
+            conn.executemany("DELETE FROM blobs WHERE sha=?", [(s,) for s in victims])
+            conn.executemany("DELETE FROM urls WHERE sha=?", [(s,) for s in victims])
+            conn.commit()
+            conn.close()
+        for sha in victims:
+            try:
+                os.remove(self._blob_path(sha))
+            except OSError:
+                pass
+
+    def cached_bytes(self, url):
+        """Bytes for `url` when cached and fresh, without any request; None otherwise."""
+        self._ensure()
+        row = self._lookup(url)
+        if row is None or time.time() - row[3] >= self.revalidate_after:
+            return None
+        data = self._read_blob(row[0])
+        if data is not None:
+            self._touch(url, row[0])
+            self.hits += 1
+        return data
+
+    def get_bytes(self, url, cancel=None, timeout=10):
+        """
+        Image bytes for `url`: from disk when fresh, after a conditional
+        request when stale, downloaded otherwise. Returns None when
+        `cancel` (a threading.Event) is set mid-download. Network errors
+        propagate, except that stale bytes are served if revalidation fails.
+        """
+        self._ensure()
+        row = self._lookup(url)
+        cached = self._read_blob(row[0]) if row else None
+
+        headers = dict(self.headers)
+        if cached is not None:
+            sha, etag, last_modified, fetched_at = row
+            if time.time() - fetched_at < self.revalidate_after:
+                self._touch(url, sha)
+                self.hits += 1
+                return cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        try:
+            with requests.get(url, headers=headers, timeout=timeout, stream=True) as r:
+                if cached is not None and r.status_code == 304:
+                    self._touch(url, row[0], revalidated=True)
+                    self.revalidated += 1
+                    return cached
+                r.raise_for_status()
+                chunks = []
+                for chunk in r.iter_content(CHUNK_SIZE):
+                    if cancel is not None and cancel.is_set():
+                        return None
+                    chunks.append(chunk)
+                data = b"".join(chunks)
+                etag = r.headers.get("ETag")
+                last_modified = r.headers.get("Last-Modified")
+        except requests.RequestException:
+            if cached is not None:
+                return cached
+            raise
+
+        self.downloads += 1
+        self._store(url, data, etag, last_modified)
+        return data
+
+    # ---- memory tier ----
+    def thumbnail(self, key):
+        with self._lock:
+            entry = self._thumbs.get(key)
+            if entry is None:
+                return None
+            self._thumbs.move_to_end(key)
+            return entry[0]
+
+    def put_thumbnail(self, key, image, nbytes):
+        with self._lock:
+            old = self._thumbs.pop(key, None)
+            if old is not None:
+                self._thumb_bytes -= old[1]
+            self._thumbs[key] = (image, nbytes)
+            self._thumb_bytes += nbytes
+            while self._thumb_bytes > self.max_memory_bytes and len(self._thumbs) > 1:
+                _, (_, size) = self._thumbs.popitem(last=False)
+                self._thumb_bytes -= size
+
+
+IMAGE_CACHE = ImageCache()
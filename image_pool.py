@@ -0,0 +1,139 @@
+
+import threading
+
+from PySide6.QtCore import QBuffer, QByteArray, QIODevice, QObject, QRunnable, QThreadPool, Qt, Signal
+from PySide6.QtGui import QImage, QImageReader
+
+from image_cache import IMAGE_CACHE
+
+MAX_IMAGE_THREADS = 4
+TILE_SIZE = 220
+# Gallery tiles load within this many viewport heights of the visible area
+# and give their pixmaps back beyond the release distance
+TILE_PREFETCH_SCREENS = 0.5
+TILE_RELEASE_SCREENS = 2
+# Tiles loaded while the gallery tab is hidden (two rows of three)
+FIRST_SCREEN_TILES = 6
+
+
+def decode_thumbnail(data, size=TILE_SIZE):
+    """
+    Decodes image bytes straight to a QImage fitting `size` x `size`.
+    Setting the scaled size before reading lets the JPEG decoder skip
+    most of the full-resolution work. Safe off the GUI thread.
+    """
+    buf = QBuffer()
+    buf.setData(QByteArray(data))
+    buf.open(QIODevice.ReadOnly)
+    reader = QImageReader(buf)
+    full = reader.size()
+    if full.isValid() and (full.width() > size or full.height() > size):
+        full.scale(size, size, Qt.KeepAspectRatio)
+        reader.setScaledSize(full)
+    image = reader.read()
+    return None if image.isNull() else image
+
+
+class _ImageTask(QRunnable):
+    def __init__(self, pool, generation, url, token, skip):
+        super().__init__()
+        self.pool = pool
+        self.generation = generation
+        self.url = url
+        self.token = token
+        self.skip = skip
+
+    def run(self):
+        if self.token.is_set() or self.skip.is_set():
+            return
+        try:
+            data = self.pool.fetch(self.url, self.token)
+        except Exception:
+            data = None
+        if data is None or self.token.is_set():
+            return
+        image = decode_thumbnail(data)
+        if image is None:
+            return
+        self.pool.cache.put_thumbnail(self.url, image, image.sizeInBytes())
+        if not self.token.is_set():
+            self.pool.loaded.emit(self.generation, self.url, image)
+
+
+class _FullImageTask(QRunnable):
+    def __init__(self, pool, url):
+        super().__init__()
+        self.pool = pool
+        self.url = url
+
+    def run(self):
+        try:
+            data = self.pool.cache.get_bytes(self.url)
+        except Exception:
+            data = None
+        image = QImage.fromData(data) if data else None
+        if image is not None and not image.isNull():
+            self.pool.fullLoaded.emit(self.url, image)
+
+
+class ImagePool(QObject):
+    """
+    Bounded pool for tile image downloads and thumbnail decoding.
+
+    Every auction selection opens a new generation. Starting one cancels
+    the previous: queued tasks are dropped from the pool and in-flight
+    downloads stop at their next chunk. Lower `priority` values are
+    fetched first, so the first tiles on screen arrive first, and a single
+    queued request can be cancelled when its tile leaves the viewport. `loaded`
+    carries the generation so late results for torn-down tiles can be
+    ignored by the receiver, and a tile-sized QImage that the GUI thread
+    only has to convert to a pixmap. Bytes come through the shared image cache,
+    so only images missing from disk touch the network.
+    """
+
+    loaded = Signal(int, str, object)
+    fullLoaded = Signal(str, object)
+
+    def __init__(self, max_threads=MAX_IMAGE_THREADS, cache=IMAGE_CACHE, parent=None):
+        super().__init__(parent)
+        self.cache = cache
+        self.threads = QThreadPool(self)
+        self.threads.setMaxThreadCount(max_threads)
+        self.generation = 0
+        self.token = threading.Event()
+        self.pending = {}
+
+    def new_generation(self):
+        self.token.set()
+        self.threads.clear()
+        self.token = threading.Event()
+        self.pending = {}
+        self.generation += 1
+        return self.generation
+
+    def is_current(self, generation):
+        return generation == self.generation
+
+    def submit(self, url, priority=0):
+        skip = threading.Event()
+        self.pending[url] = skip
+        # QThreadPool runs higher priorities first
+        task = _ImageTask(self, self.generation, url, self.token, skip)
+        self.threads.start(task, -priority)
+
+    def cancel(self, url):
+        """Drops a queued request of the current generation, e.g. for a tile scrolled away."""
+        skip = self.pending.pop(url, None)
+        if skip is not None:
+            skip.set()
+
+    def submit_full(self, url):
+        """Fetches and decodes `url` at full size for the viewer; `fullLoaded` delivers it."""
+        self.threads.start(_FullImageTask(self, url), 1)
+
+    def fetch(self, url, token):
+        return self.cache.get_bytes(url, cancel=token)
+
+    def shutdown(self):
+        self.new_generation()
+        self.threads.waitForDone(2000)
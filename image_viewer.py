@@ -10,15 +10,19 @@ class ImageViewer(QDialog):
         self.resize(900, 900)
         layout = QVBoxLayout(self)
 
-        annotated = QPixmap(pix)
-        if boxes:
-            self._draw_boxes(annotated, boxes)
+        self.boxes = boxes
+        self.label = QLabel()
+        layout.addWidget(self.label)
+        self.set_pixmap(pix)
 
-        lbl = QLabel()
-        lbl.setPixmap(annotated.scaled(
+    def set_pixmap(self, pix):
+        """Shows `pix` with the boxes drawn over it, e.g. the full image once it has loaded."""
+        annotated = QPixmap(pix)
+        if self.boxes:
+            self._draw_boxes(annotated, self.boxes)
+        self.label.setPixmap(annotated.scaled(
             880, 880, Qt.KeepAspectRatio, Qt.SmoothTransformation
         ))
-        layout.addWidget(lbl)
 
     def _draw_boxes(self, pixmap, boxes):
         painter = QPainter(pixmap)
@@ -1,48 +1,73 @@
-import sys, json, requests, sqlite3, webbrowser, csv, base64, math
+import sys, json, requests, sqlite3, webbrowser, csv, base64, math, time
 from datetime import datetime, timezone
+import numpy as np
 from vision_worker import VisionWorker
 
-import pgeocode
-
-from PySide6.QtCore import Qt, QThread, Signal, QTimer, QSortFilterProxyModel, QRegularExpression, QUrl
+from PySide6.QtCore import Qt, QThread, Signal, QTimer, QPoint
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QListWidget, QListWidgetItem,
     QLabel, QVBoxLayout, QHBoxLayout, QScrollArea, QPushButton,
     QFileDialog, QSplitter, QFrame, QGridLayout, QSizePolicy,
     QLineEdit, QComboBox, QSlider, QMenu, QDialog, QDialogButtonBox,
     QMessageBox, QDoubleSpinBox, QTableView, QAbstractItemView, QToolButton,
-    QTabWidget, QSpinBox, QCheckBox, QFormLayout, QStyle, QStackedLayout,
+    QTabWidget, QSpinBox, QCheckBox, QFormLayout, QStyle, QStackedWidget,
 )
-from PySide6.QtWebEngineWidgets import QWebEngineView
 from PySide6.QtGui import (
     QPixmap,
     QFont,
     QPdfWriter,
     QPainter,
     QPageSize,
-    QStandardItemModel,
-    QStandardItem,
 )
 
 from config import API_BASE, HEADERS, SEARCH_PARAMS
 from db import (
     init_db,
     save_bid,
+    archive_auctions,
     bid_velocity,
+    bid_velocity_many,
     get_recent_bids,
+    get_recent_bids_many,
+    get_bid_history,
+    load_zip_coords,
+    save_zip_coords,
     save_vision_result,
     load_vision_result,
+    load_vision_result_many,
     get_recent_vision_results,
     reset_manual_vision_result,
 )
-from scoring import profit_score
+from scoring import (
+    auction_columns,
+    ScoreCache,
+    load_profiles,
+    active_profile,
+)
 from alerts import SniperAlerts
-from charts import sparkline
-from vision import tag_from_text
-from resale import estimate
+from charts import BidHistoryChart, sparkline
+from vision import tag_from_text, tag_many
+from resale import estimate, reload_price_lookup
+from predictor import PredictionCache, unit_area
+from auction_table import AuctionTableModel, COL_SCORE, COL_TIME, COL_VELOCITY
+from image_cache import IMAGE_CACHE
+from tile_cache import TILE_CACHE
+from image_pool import (
+    FIRST_SCREEN_TILES, TILE_PREFETCH_SCREENS, TILE_RELEASE_SCREENS, TILE_SIZE, ImagePool,
+)
+from filters import FilterPipeline, FILTER_DEBOUNCE_MS, MAX_RADIUS_MILES, RADIUS_STEP_MILES
+from geo import haversine_miles, marker_coords, nearest_origin
+from geocode import GEOCODER_RETRY_SECONDS, load_zip_centroids, parse_zip_list
+from search_index import SearchIndex
+from spatial_index import NEARBY_MILES, FacilityIndex
+from facets import FACETS, FacetIndex
+from ranking import METRICS, TopK, metric_values, value_range, format_metric
 from state import AppState
-from ui_helpers import Card, clear_layout
+from ui_helpers import Card
+from detail_widgets import DetailRow, ImageTile, WidgetPool
+from vision_table import VisionItemModel, VisionItemView, confidence_badge
 from image_viewer import ImageViewer
+from map_view import ClusterMap, MapPreview, register_tile_scheme, shutdown_tile_handler
 from styles import STYLE, THEMES
 
 
@@ -56,160 +81,6 @@ class Worker(QThread):
         self.done.emit(self.fn())
         
 
-class ImageLoader(QThread):
-    loaded = Signal(QPixmap, object)
-
-    def __init__(self, url, target_label):
-        super().__init__()
-        self.url = url
-        self.target_label = target_label
-
-    def run(self):
-        try:
-            r = requests.get(self.url, timeout=10)
-            pix = QPixmap()
-            pix.loadFromData(r.content)
-            self.loaded.emit(pix, self.target_label)
-        except Exception:
-            pass
-
-
-class ClickableLabel(QLabel):
-    clicked = Signal(object)
-
-    def __init__(self, payload=None, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.payload = payload or {}
-
-    def mousePressEvent(self, event):
-        self.clicked.emit(self.payload)
-        super().mousePressEvent(event)
-
-
-class MapPreview(QWidget):
-    def __init__(self, on_open_full_map, parent=None):
-        super().__init__(parent)
-        self.setMinimumSize(240, 170)
-        self.setMaximumHeight(240)
-
-        self.on_open_full_map = on_open_full_map
-        self.marker = None
-
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(8)
-
-        toolbar = QHBoxLayout()
-        toolbar.setContentsMargins(0, 0, 0, 0)
-
-        self.btn_recenter = QToolButton()
-        self.btn_recenter.setText("Recenter")
-        self.btn_recenter.setIcon(self.style().standardIcon(QStyle.SP_BrowserReload))
-        self.btn_recenter.clicked.connect(self.recenter)
-        self.btn_recenter.setEnabled(False)
-
-        self.btn_open_full = QToolButton()
-        self.btn_open_full.setText("Open Full Map")
-        self.btn_open_full.setIcon(self.style().standardIcon(QStyle.SP_DriveNetIcon))
-        self.btn_open_full.clicked.connect(self.open_full_map)
-        self.btn_open_full.setEnabled(False)
-
-        toolbar.addWidget(self.btn_recenter)
-        toolbar.addWidget(self.btn_open_full)
-        toolbar.addStretch()
-        layout.addLayout(toolbar)
-
-        self.web_view = QWebEngineView()
-        self.web_view.setContextMenuPolicy(Qt.NoContextMenu)
-        self.web_view.setStyleSheet("border:1px solid #1f2937; border-radius:12px;")
-
-        self.fallback_label = QLabel("Add a facility location to preview the map.")
-        self.fallback_label.setAlignment(Qt.AlignCenter)
-        self.fallback_label.setWordWrap(True)
-        self.fallback_label.setStyleSheet(
-            "border:1px dashed #1f2937; border-radius:12px; padding:12px; color:#9ca3af;"
-        )
-
-        self.stack = QStackedLayout()
-        self.stack.setContentsMargins(0, 0, 0, 0)
-        self.stack.setStackingMode(QStackedLayout.StackAll)
-        self.stack.addWidget(self.fallback_label)
-        self.stack.addWidget(self.web_view)
-
-        container = QWidget()
-        container.setLayout(self.stack)
-        layout.addWidget(container)
-
-        self.show_fallback()
-
-    def show_fallback(self, message="Add a facility location to preview the map."):
-        self.fallback_label.setText(message)
-        self.stack.setCurrentWidget(self.fallback_label)
-        self.btn_recenter.setEnabled(False)
-        self.btn_open_full.setEnabled(False)
-
-    def show_map(self):
-        self.stack.setCurrentWidget(self.web_view)
-        self.btn_recenter.setEnabled(True)
-        self.btn_open_full.setEnabled(True)
-
-    def load_marker(self, marker):
-        self.marker = marker if marker else None
-        if not marker:
-            self.show_fallback("Map preview unavailable without coordinates.")
-            return
-
-        lat, lng = marker.get("lat"), marker.get("lng")
-        try:
-            lat, lng = float(lat), float(lng)
-        except (TypeError, ValueError):
-            self.show_fallback("Map preview unavailable without valid coordinates.")
-            return
-
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-          <head>
-            <meta charset='utf-8' />
-            <meta name='viewport' content='initial-scale=1.0'>
-            <link
-              rel='stylesheet'
-              href='https://unpkg.com/leaflet@1.9.4/dist/leaflet.css'
-            />
-            <style>
-              html, body, #map {{ height: 100%; margin: 0; }}
-              #map {{ border-radius: 12px; }}
-            </style>
-          </head>
-          <body>
-            <div id='map'></div>
-            <script
-              src='https://unpkg.com/leaflet@1.9.4/dist/leaflet.js'
-            ></script>
-            <script>
-              const center = [{lat}, {lng}];
-              const map = L.map('map', {{ zoomControl: true }}).setView(center, 13);
-              L.tileLayer('https://{{s}}.tile.openstreetmap.org/{{z}}/{{x}}/{{y}}.png', {{
-                maxZoom: 19,
-                attribution: '© OpenStreetMap'
-              }}).addTo(map);
-              L.marker(center).addTo(map);
-            </script>
-          </body>
-        </html>
-        """
-
-        self.web_view.setHtml(html, QUrl("https://local.map"))
-        self.show_map()
-
-    def recenter(self):
-        if self.marker:
-            self.load_marker(self.marker)
-
-    def open_full_map(self):
-        if self.marker and self.on_open_full_map:
-            self.on_open_full_map()
-
 # ================= MAIN =================
 class AuctionBrowser(QMainWindow):
     def __init__(self):
@@ -220,16 +91,40 @@ class AuctionBrowser(QMainWindow):
         init_db()
         self.state = AppState()
         self.sniper = SniperAlerts()
+        self.score_cache = ScoreCache()
+        self.prediction_cache = PredictionCache()
+        self.scoring_profile, self.scoring_weights = active_profile(self.state.preferences)
 
         self.apply_theme(self.state.preferences.get("theme"))
 
         self.user_ip = None
         self.vision_resale = {}
         self.auctions = []
-        self.filtered = []
+        self.auction_columns = auction_columns([])
+        self.auction_tags = []
+        self.auction_estimates = []
+        self.auction_expiries = []
+        self.auction_unit_areas = []
+        self.auction_lat = np.zeros(0)
+        self.auction_lng = np.zeros(0)
+        self.facility_index = FacilityIndex(self.auction_lat, self.auction_lng)
+        self.auction_values = []
+        self.auction_index = {}
+        self.auction_expire_at = np.zeros(0)
+        self.search_index = SearchIndex([])
+        self.facets = FacetIndex([], [])
+        self.filters = FilterPipeline()
+        self.filter_pass_ms = 0.0
+        self.auction_scores = np.zeros(0)
+        self.auction_predictions = np.zeros(0)
+        self.top_deals = TopK(k=8)
+        self.top_deals_metric = "score"
         self.current = None
+        self.current_expiry = None
+        self.countdown_ticks = 0
         self.threads = []
-        self.image_threads = []
+        self.image_pool = ImagePool(parent=self)
+        self.image_pool.loaded.connect(self.on_image_loaded)
         self.had_vision_error = False
         self.analysis_cancelled = False
         self.vision_aid_in_progress = None
@@ -238,8 +133,17 @@ class AuctionBrowser(QMainWindow):
         self.recent_vision_results = []
         self.image_tile_map = {}
         self.using_manual = False
-        self.zip_coord_cache = {}
-        self.geocoder = pgeocode.Nominatim("us")
+        # ZIPs resolved in earlier sessions; the full centroid table loads
+        # on a worker the first time a ZIP is missing from here
+        self.zip_coord_cache = load_zip_coords()
+        self.zip_centroids = None
+        self.geocoder_loading = False
+        self.geocoder_failed_at = None
+        # Every ZIP in the search box is an origin; distances are to the nearest
+        self.search_zips = [SEARCH_PARAMS["search_term"]]
+        self.origin_zips = []
+        self.auction_distances = np.zeros(0)
+        self.auction_origin = np.zeros(0, dtype=np.intp)
 
         splitter = QSplitter(Qt.Horizontal)
         self.setCentralWidget(splitter)
@@ -254,6 +158,7 @@ class AuctionBrowser(QMainWindow):
 
         self.zip_input = QLineEdit("44647")
         self.zip_input.setPlaceholderText("ZIP")
+        self.zip_input.setToolTip("One ZIP, or several separated by commas to search multiple regions.")
 
         self.radius_input = QComboBox()
         self.radius_input.addItems(["5", "10", "25", "50", "100"])
@@ -282,6 +187,9 @@ class AuctionBrowser(QMainWindow):
         self.lbl_time_val = QLabel("Max Hours: 72")
         self.lbl_time_val.setStyleSheet("color:#60a5fa; font-weight:600;")
 
+        self.lbl_distance_val = QLabel("Max Distance: Any")
+        self.lbl_distance_val.setStyleSheet("color:#a78bfa; font-weight:600;")
+
         # ---- FILTERS PANEL ----
         filters = QFrame()
         filters.setObjectName("Card")
@@ -303,8 +211,20 @@ class AuctionBrowser(QMainWindow):
         self.time_slider.setToolTip("Only show auctions ending within this many hours.")
         fl.addWidget(self.time_slider)
 
+        fl.addSpacing(6)
+
+        fl.addWidget(self.lbl_distance_val)
+        self.distance_slider = QSlider(Qt.Horizontal)
+        self.distance_slider.setRange(1, MAX_RADIUS_MILES // RADIUS_STEP_MILES)
+        self.distance_slider.setValue(MAX_RADIUS_MILES // RADIUS_STEP_MILES)
+        self.distance_slider.setToolTip(
+            "Only show auctions within this many miles of the nearest search ZIP. "
+            "Auctions without a location are kept."
+        )
+        fl.addWidget(self.distance_slider)
+
         helper_label = QLabel(
-            "Filters limit the auctions shown below based on profit score and hours remaining."
+            "Filters limit the auctions shown below based on profit score, hours remaining and distance."
         )
         helper_label.setStyleSheet("color:#9ca3af; font-size:12px;")
         helper_label.setWordWrap(True)
@@ -312,6 +232,13 @@ class AuctionBrowser(QMainWindow):
 
         self.score_slider.valueChanged.connect(self.on_score_slider)
         self.time_slider.valueChanged.connect(self.on_time_slider)
+        self.distance_slider.valueChanged.connect(self.on_distance_slider)
+
+        # Coalesce slider drags into one filter pass
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(FILTER_DEBOUNCE_MS)
+        self.filter_timer.timeout.connect(self.apply_filters)
 
         left_layout.addWidget(filters)
 
@@ -342,32 +269,40 @@ class AuctionBrowser(QMainWindow):
         list_toolbar.addStretch()
 
         self.filter_input = QLineEdit()
-        self.filter_input.setPlaceholderText("Filter auctions…")
+        self.filter_input.setPlaceholderText("Search city, facility, size, contents…")
+        self.filter_input.setToolTip("Every word must start a word in the auction, e.g. \"akr tool\".")
         self.filter_input.textChanged.connect(self.on_filter_text)
         list_toolbar.addWidget(self.filter_input)
 
         left_layout.addLayout(list_toolbar)
 
+        # ---- FACETS ----
+        facet_bar = QHBoxLayout()
+        facet_bar.setSpacing(6)
+        facet_bar.addWidget(QLabel("Narrow:"))
+        self.facet_buttons = {}
+        for facet, label in FACETS.items():
+            btn = QToolButton()
+            btn.setText(label)
+            btn.setPopupMode(QToolButton.InstantPopup)
+            menu = QMenu(btn)
+            menu.aboutToShow.connect(lambda f=facet: self.fill_facet_menu(f))
+            btn.setMenu(menu)
+            facet_bar.addWidget(btn)
+            self.facet_buttons[facet] = btn
+        facet_bar.addStretch()
+        self.btn_clear_facets = QToolButton()
+        self.btn_clear_facets.setText("Clear")
+        self.btn_clear_facets.setEnabled(False)
+        self.btn_clear_facets.clicked.connect(self.clear_facets)
+        facet_bar.addWidget(self.btn_clear_facets)
+        left_layout.addLayout(facet_bar)
+
         # ---- AUCTION LIST (FIXED HEIGHT) ----
-        self.list_model = QStandardItemModel(0, 7)
-        self.list_model.setHorizontalHeaderLabels([
-            "★",
-            "Location",
-            "Unit",
-            "Bid",
-            "Score",
-            "Velocity",
-            "Time Remaining",
-        ])
-
-        self.proxy_model = QSortFilterProxyModel()
-        self.proxy_model.setFilterCaseSensitivity(Qt.CaseInsensitive)
-        self.proxy_model.setFilterKeyColumn(-1)
-        self.proxy_model.setSortRole(Qt.UserRole)
-        self.proxy_model.setSourceModel(self.list_model)
+        self.list_model = AuctionTableModel()
 
         self.list = QTableView()
-        self.list.setModel(self.proxy_model)
+        self.list.setModel(self.list_model)
         self.list.setFixedHeight(650)
         self.list.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.list.setSelectionMode(QAbstractItemView.SingleSelection)
@@ -380,19 +315,33 @@ class AuctionBrowser(QMainWindow):
         self.list.setContextMenuPolicy(Qt.CustomContextMenu)
         self.list.customContextMenuRequested.connect(self.open_list_menu)
 
-        left_layout.addWidget(self.list)
+        # Map mode plots the same filtered auctions, clustered
+        self.cluster_map = ClusterMap()
+        self.cluster_map.setFixedHeight(650)
+        self.cluster_map.auctionsClicked.connect(self.select_slots)
+
+        self.list_stack = QStackedWidget()
+        self.list_stack.addWidget(self.list)
+        self.list_stack.addWidget(self.cluster_map)
+        left_layout.addWidget(self.list_stack)
 
         status_layout = QHBoxLayout()
         self.filter_status = QLabel("0 results")
         self.filter_status.setStyleSheet("color:#9ca3af;")
         status_layout.addWidget(self.filter_status)
         status_layout.addStretch()
+        self.btn_map_mode = QToolButton()
+        self.btn_map_mode.setText("Map")
+        self.btn_map_mode.setToolTip("Show the filtered auctions on a map")
+        self.btn_map_mode.setCheckable(True)
+        self.btn_map_mode.toggled.connect(self.set_map_mode)
+        status_layout.addWidget(self.btn_map_mode)
         left_layout.addLayout(status_layout)
 
         self.field_column_map = {
-            "time": 6,
-            "score": 4,
-            "velocity": 5,
+            "time": COL_TIME,
+            "score": COL_SCORE,
+            "velocity": COL_VELOCITY,
         }
         self.sort_button_map = {
             "time": self.btn_sort_time,
@@ -559,6 +508,12 @@ class AuctionBrowser(QMainWindow):
         self.details_layout = QVBoxLayout(details_container)
         self.details_layout.setContentsMargins(0, 0, 0, 0)
         self.details_layout.setSpacing(8)
+        self.detail_rows = WidgetPool(DetailRow, lambda w, i: self.details_layout.insertWidget(i, w))
+        self.bid_trend_title = QLabel("Bid Trend")
+        self.bid_trend = QLabel()
+        for w in (self.bid_trend_title, self.bid_trend):
+            w.setVisible(False)
+            self.details_layout.addWidget(w)
         self.details_scroll.setWidget(details_container)
         self.card_details.layout.addWidget(self.details_scroll)
 
@@ -595,6 +550,7 @@ class AuctionBrowser(QMainWindow):
         self.images_scroll.setStyleSheet(scroll_style)
         self.images_scroll.setMinimumHeight(340)
         self.images_scroll.setMaximumHeight(720)
+        self.images_scroll.verticalScrollBar().valueChanged.connect(self.realize_image_tiles)
 
         images_container = QWidget()
         images_layout = QVBoxLayout(images_container)
@@ -608,7 +564,12 @@ class AuctionBrowser(QMainWindow):
         self.btn_reset_ai = QPushButton("Reset to AI output")
         self.btn_reset_ai.setVisible(False)
         self.btn_reset_ai.clicked.connect(self.reset_manual_overrides)
+        self.btn_save_vision = QPushButton("Save edits")
+        self.btn_save_vision.setToolTip("Save edited names, prices and hidden items as manual totals.")
+        self.btn_save_vision.setVisible(False)
+        self.btn_save_vision.clicked.connect(self.persist_manual_edits)
         vision_header.addStretch()
+        vision_header.addWidget(self.btn_save_vision)
         vision_header.addWidget(self.btn_reset_ai)
         self.vision_card.layout.addLayout(vision_header)
 
@@ -618,12 +579,23 @@ class AuctionBrowser(QMainWindow):
 
         self.vision_container = QVBoxLayout()
         self.vision_container.setSpacing(6)
+        self.vision_placeholder = QLabel()
+        self.vision_placeholder.setStyleSheet("color:#9ca3af;")
+        self.vision_container.addWidget(self.vision_placeholder)
+        self.vision_model = VisionItemModel(self)
+        self.vision_table = VisionItemView(self.vision_model)
+        self.vision_table.setVisible(False)
+        self.vision_container.addWidget(self.vision_table)
         self.vision_items_displayed = []
         self.vision_card.layout.addLayout(self.vision_container)
         images_layout.addWidget(self.vision_card)
 
         self.image_grid = QGridLayout()
         self.image_grid.setSpacing(12)
+        self.image_tiles = WidgetPool(
+            self.make_image_tile,
+            lambda w, i: self.image_grid.addWidget(w, i // 3, i % 3),
+        )
         grid_container = QWidget()
         grid_layout = QVBoxLayout(grid_container)
         grid_layout.setContentsMargins(0, 0, 0, 0)
@@ -657,22 +629,51 @@ class AuctionBrowser(QMainWindow):
         self.recent_card.layout.addLayout(recent_layout)
         activity_layout.addWidget(self.recent_card)
 
+        self.deals_card = Card("Top Deals", fixed_height=240)
+        self.deals_metric = QComboBox()
+        for key, label in METRICS.items():
+            self.deals_metric.addItem(label, key)
+        self.deals_metric.currentIndexChanged.connect(self.on_deals_metric_changed)
+        self.deals_list = QListWidget()
+        self.deals_list.setFixedHeight(170)
+        self.deals_list.setToolTip("Best auctions in the current search; click one to open it.")
+        self.deals_list.itemClicked.connect(self.open_top_deal)
+        self.deals_card.layout.addWidget(self.deals_metric)
+        self.deals_card.layout.addWidget(self.deals_list)
+        activity_layout.addWidget(self.deals_card)
+
+        self.history_card = Card("Bid History")
+        self.bid_chart = BidHistoryChart()
+        self.bid_chart.setToolTip("Scroll to zoom, drag to pan, double-click to reset.")
+        self.history_card.layout.addWidget(self.bid_chart)
+        activity_layout.addWidget(self.history_card)
+
         self.apply_preferences(refresh=False)
 
         # ---- TIMER ----
         self.timer = QTimer()
         self.timer.timeout.connect(self.update_countdown)
+        self.timer.timeout.connect(self.update_list_countdown)
         self.timer.start(1000)
 
         self.bootstrap()
         self.refresh_recent_vision_results()
 
+    def closeEvent(self, event):
+        # Stop tile downloads before their signal source goes away
+        self.image_pool.shutdown()
+        shutdown_tile_handler()
+        IMAGE_CACHE.flush_used()
+        TILE_CACHE.flush_used()
+        super().closeEvent(event)
+
     def on_tab_changed(self, index):
         if not self.current:
             return
 
         self.update_profit_ratio_display()
         self.update_distance_badge(self.current.get("facility", {}).get("marker"))
+        self.realize_image_tiles()
 
     # ================= DATA =================
     def run_worker(self, fn, cb):
@@ -715,35 +716,49 @@ class AuctionBrowser(QMainWindow):
         return d if isinstance(d, str) else d.get("ip")
 
     def fetch_list(self):
-        r = requests.get(f"{API_BASE}/p/auctions", headers=HEADERS, params=SEARCH_PARAMS)
-        return r.json()["auctions"]
+        # One search per origin ZIP; auctions in overlapping regions are listed once
+        found = {}
+        for zip_code in self.search_zips:
+            params = dict(SEARCH_PARAMS, search_term=zip_code)
+            r = requests.get(f"{API_BASE}/p/auctions", headers=HEADERS, params=params)
+            for a in r.json()["auctions"]:
+                found.setdefault(a["auction_id"], a)
+        auctions = list(found.values())
+        archive_auctions(auctions)
+        return auctions
         
-    def on_image_loaded(self, pix, label):
-        label.setText("")
-        url = getattr(label, "payload", {}).get("url")
-        if url:
-            meta = self.image_tile_map.get(url, {})
-            meta["base_pixmap"] = pix
-            self.image_tile_map[url] = meta
-            self.set_label_pixmap(url, pix)
-        else:
-            label.setPixmap(
-                pix.scaled(
-                    220, 220,
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation
-                )
-            )
+    def on_image_loaded(self, generation, url, image):
+        # Tiles of a previous selection are gone; drop their late results
+        meta = self.image_tile_map.get(url)
+        if not self.image_pool.is_current(generation) or not meta:
+            return
+
+        meta["label"].setText("")
+        self.set_label_pixmap(url, QPixmap.fromImage(image))
 
     def on_score_slider(self, value):
         color = "#22c55e" if value >= 70 else "#f59e0b" if value >= 40 else "#ef4444"
         self.lbl_score_val.setStyleSheet(f"color:{color}; font-weight:600;")
         self.lbl_score_val.setText(f"Min Score: {value}")
-        self.apply_filters()
+        self.filter_timer.start()
 
     def on_time_slider(self, value):
         self.lbl_time_val.setText(f"Max Hours: {value}")
-        self.apply_filters()
+        self.filter_timer.start()
+
+    def max_miles(self):
+        """Radius filter in miles; the slider's last notch means no limit."""
+        value = self.distance_slider.value()
+        if value >= self.distance_slider.maximum():
+            return math.inf
+        return value * RADIUS_STEP_MILES
+
+    def on_distance_slider(self, value):
+        miles = self.max_miles()
+        self.lbl_distance_val.setText(
+            "Max Distance: Any" if math.isinf(miles) else f"Max Distance: {miles} mi"
+        )
+        self.filter_timer.start()
 
     def apply_theme(self, theme_name):
         app = QApplication.instance()
@@ -771,7 +786,13 @@ class AuctionBrowser(QMainWindow):
 
         self.apply_theme(prefs.get("theme"))
 
-        SEARCH_PARAMS["search_term"] = zip_code
+        profile = active_profile(prefs)
+        if profile != (self.scoring_profile, self.scoring_weights):
+            self.scoring_profile, self.scoring_weights = profile
+            self.refresh_list_values()
+
+        self.search_zips = parse_zip_list(zip_code) or self.search_zips
+        SEARCH_PARAMS["search_term"] = self.search_zips[0]
         SEARCH_PARAMS["search_radius"] = radius
 
         if refresh:
@@ -803,6 +824,14 @@ class AuctionBrowser(QMainWindow):
         theme_combo.addItems(THEMES.keys())
         theme_combo.setCurrentText(prefs.get("theme", "Dark"))
 
+        profile_combo = QComboBox()
+        profile_combo.addItems(load_profiles(prefs).keys())
+        profile_combo.setCurrentText(active_profile(prefs)[0])
+        profile_combo.setToolTip(
+            "Weights used for the profit score. Add your own under "
+            "\"scoring_profiles\" in the preferences file."
+        )
+
         lock_checkbox = QCheckBox("Lock auction list during analysis")
         lock_checkbox.setChecked(prefs.get("lock_during_analysis", True))
 
@@ -814,6 +843,7 @@ class AuctionBrowser(QMainWindow):
         form.addRow("Min Score slider default", min_score_spin)
         form.addRow("Max Hours slider default", max_hours_spin)
         form.addRow("Theme", theme_combo)
+        form.addRow("Scoring profile", profile_combo)
 
         layout.addLayout(form)
         layout.addWidget(QLabel("Analysis behaviors"))
@@ -834,24 +864,24 @@ class AuctionBrowser(QMainWindow):
                 "theme": theme_combo.currentText(),
                 "lock_during_analysis": lock_checkbox.isChecked(),
                 "show_analysis_banner": banner_checkbox.isChecked(),
+                "scoring_profile": profile_combo.currentText(),
             })
             self.state.preferences = prefs
             self.state.save()
             self.apply_preferences()
 
     def refresh_search(self):
-        zip_code = self.zip_input.text().strip()
+        zips = parse_zip_list(self.zip_input.text())
         radius = self.radius_input.currentText()
 
-        if not zip_code.isdigit() or len(zip_code) != 5:
+        if not zips:
             return
 
-        SEARCH_PARAMS["search_term"] = zip_code
+        self.search_zips = zips
+        SEARCH_PARAMS["search_term"] = zips[0]
         SEARCH_PARAMS["search_radius"] = radius
 
-        self.list_model.removeRows(0, self.list_model.rowCount())
-        self.filtered = []
-        self.update_filter_status()
+        self.populate_list([])
         self.current = None
         self.run_worker(self.fetch_list, self.populate_list)
         
@@ -900,18 +930,19 @@ class AuctionBrowser(QMainWindow):
         self.vision_status.setStyleSheet("color:#9ca3af;")
         self.vision_status.setText("Downloading and analyzing images…")
 
-        clear_layout(self.vision_container)
+        self.vision_model.set_items([])
+        self.vision_table.setVisible(False)
+        self.btn_save_vision.setVisible(False)
         lock_note = (
             "selection locked to prevent cross-auction updates."
             if lock_enabled
             else "analysis running in the background."
         )
-        placeholder = QLabel(
+        self.vision_placeholder.setText(
             f"Analyzing images… (0/{len(image_urls)}) — {lock_note}"
         )
-        placeholder.setStyleSheet("color:#9ca3af;")
-        self.analysis_placeholder = placeholder
-        self.vision_container.addWidget(placeholder)
+        self.vision_placeholder.setVisible(True)
+        self.analysis_placeholder = self.vision_placeholder
         self.vision_items_displayed = []
 
         self.vision_worker = VisionWorker(image_urls, aid)
@@ -937,13 +968,19 @@ class AuctionBrowser(QMainWindow):
                 or self.current.get("facility", {}).get("name")
                 or ""
             )
-            save_vision_result(aid, result, facility_name=facility_name)
+            save_vision_result(
+                aid,
+                result,
+                facility_name=facility_name,
+                unit_size=self.current.get("unit_size") or "",
+            )
             self.refresh_recent_vision_results()
 
             lo = result.get("total_low", 0)
             hi = result.get("total_high", 0)
 
             self.update_totals_display({"low": lo, "high": hi})
+            self.update_deal_value(aid, lo, hi)
             self.vision_status.setStyleSheet("color:#9ca3af;")
             self.vision_status.setText("")
             self.render_vision_items(result.get("items", []))
@@ -981,25 +1018,15 @@ class AuctionBrowser(QMainWindow):
 
         new_items = items[len(self.vision_items_displayed):]
         if new_items:
-            if self.vision_container.count() == 1:
-                w = self.vision_container.itemAt(0).widget()
-                if isinstance(w, QLabel) and "Analyzing images" in w.text():
-                    self.vision_container.removeWidget(w)
-                    w.deleteLater()
-                    self.analysis_placeholder = None
+            if self.analysis_placeholder:
+                self.analysis_placeholder.setVisible(False)
+                self.analysis_placeholder = None
 
             self.append_vision_items(new_items)
-            self.vision_items_displayed.extend(new_items)
 
         if image_url:
             self.store_image_items(aid, image_url, image_idx, image_items, annotated_image)
-            if image_items:
-                label = f"Analyzed ({len(image_items)} items)"
-                color = "#22c55e"
-            else:
-                label = "Analyzed (no items)"
-                color = "#6b7280"
-            self.set_image_status(image_url, label, color)
+            self.set_image_status(image_url, *self.summary_status(image_items))
 
             if annotated_image:
                 pix = QPixmap()
@@ -1049,93 +1076,264 @@ class AuctionBrowser(QMainWindow):
     # ================= LIST / FILTER =================
     def populate_list(self, auctions):
         self.auctions = auctions
-        self.apply_filters()
+        self.auction_columns = auction_columns(auctions)
+        self.auction_tags = tag_many(a.get("unit_contents") for a in auctions)
+        reload_price_lookup()
+        self.auction_estimates = [
+            estimate(tags, a.get("unit_size") or "")
+            for a, tags in zip(auctions, self.auction_tags)
+        ]
+        self.auction_expiries = [
+            datetime.fromisoformat(a["expire_date"]["utc"]["datetime"]).replace(tzinfo=timezone.utc)
+            for a in auctions
+        ]
+        self.auction_expire_at = np.array([e.timestamp() for e in self.auction_expiries], dtype=np.float64)
+        self.auction_unit_areas = [unit_area(a.get("unit_size")) for a in auctions]
+        self.auction_lat, self.auction_lng = marker_coords(auctions)
+        self.facility_index = FacilityIndex(self.auction_lat, self.auction_lng)
+        self.refresh_distances()
+        self.search_index = SearchIndex.from_auctions(auctions, self.auction_tags)
+        self.facets = FacetIndex(auctions, self.auction_tags, self.state.watchlist)
+        self.update_facet_buttons()
+        aids = [a["auction_id"] for a in auctions]
+        self.auction_index = {aid: i for i, aid in enumerate(aids)}
+        vision = load_vision_result_many(aids)
+        self.auction_values = [
+            value_range(vision.get(aid), est)
+            for aid, est in zip(aids, self.auction_estimates)
+        ]
+        self.top_deals.retain(aids)
+        # Pick up coefficients from the latest `python predictor.py` run
+        self.prediction_cache.reload()
+
+        self.refresh_list_values(reset=True)
+        self.on_filter_text(self.filter_input.text())
+
+    def refresh_list_values(self, reset=False):
+        """
+        Recomputes velocity, score and predicted final price for every
+        auction and hands the arrays to the list model, which only repaints
+        rows whose values changed. Filters are masks over these arrays.
+        """
+        aids = [a["auction_id"] for a in self.auctions]
+        velocity_map = bid_velocity_many(aids)
+        velocities = np.array([velocity_map[aid] for aid in aids], dtype=np.float64)
+        self.auction_scores = self.score_cache.scores(
+            aids, *self.auction_columns, velocities, self.scoring_weights
+        )
+
+        bids, views, bid_counts = self.auction_columns
+        hours_left = np.clip((self.auction_expire_at - time.time()) / 3600, 0, None)
+        self.auction_predictions = self.prediction_cache.predict(
+            aids,
+            bids,
+            bid_counts,
+            views,
+            hours_left,
+            self.auction_unit_areas,
+            self.auction_tags,
+        )
+        self.refresh_top_deals()
+        if reset:
+            self.filters.set_rows(self.auction_scores, self.auction_expire_at)
+            self.filters.set_distances(self.auction_distances)
+        else:
+            self.filters.set_scores(self.auction_scores)
+
+        values = {
+            "watched": np.array([aid in self.state.watchlist for aid in aids], dtype=bool),
+            "score": self.auction_scores,
+            "velocity": velocities,
+            "predicted": self.auction_predictions,
+        }
+        if not reset:
+            self.list_model.update_values(**values)
+            self.apply_filters()
+            return
+
+        recent_bids = get_recent_bids_many(aids)
+        self.list_model.set_auctions(
+            self.auctions,
+            dict(
+                values,
+                bid=bids,
+                est_low=np.array([lo for lo, _ in self.auction_estimates], dtype=np.float64),
+                est_high=np.array([hi for _, hi in self.auction_estimates], dtype=np.float64),
+                expire_at=self.auction_expire_at,
+                distance=self.auction_distances,
+            ),
+            [f"{a['city']} {a['state']}" for a in self.auctions],
+            [a.get("unit_size", "") for a in self.auctions],
+            [", ".join(tags) for tags in self.auction_tags],
+            trends=[recent_bids[aid] for aid in aids],
+        )
 
     def apply_filters(self):
-        self.list_model.removeRows(0, self.list_model.rowCount())
-        self.filtered = []
+        self.filter_timer.stop()
+        if len(self.filters) != len(self.auctions):
+            return
 
-        min_score = self.score_slider.value()
-        max_hours = self.time_slider.value()
-        now = datetime.now(timezone.utc)
+        t0 = time.perf_counter()
+        self.filters.set_thresholds(
+            min_score=self.score_slider.value(),
+            max_hours=self.time_slider.value(),
+            max_miles=self.max_miles(),
+        )
+        self.list_model.set_mask(self.filters.run())
+        self.filter_pass_ms = (time.perf_counter() - t0) * 1000
+        self.update_filter_status()
+        self.update_cluster_map()
 
-        for a in self.auctions:
-            exp = datetime.fromisoformat(
-                a["expire_date"]["utc"]["datetime"]
-            ).replace(tzinfo=timezone.utc)
+    # ================= MAP MODE =================
+    def set_map_mode(self, on):
+        self.list_stack.setCurrentWidget(self.cluster_map if on else self.list)
+        self.update_cluster_map()
 
-            delta = exp - now
-            hrs = max(delta.total_seconds() / 3600, 0)
+    def update_cluster_map(self):
+        if not self.btn_map_mode.isChecked():
+            return
+        slots = self.list_model.visible
+        self.cluster_map.set_points(slots, self.auction_lat[slots], self.auction_lng[slots])
+
+    def select_slots(self, slots):
+        """Selects whichever of `slots` sits highest in the list, as if its row was clicked."""
+        rows = self.list_model.row_positions()[slots]
+        rows = rows[rows >= 0]
+        if not len(rows):
+            return
+        index = self.list_model.index(int(rows.min()), 0)
+        self.list.selectRow(index.row())
+        self.list.scrollTo(index)
+        self.select_auction(index)
+
+    # ================= TOP DEALS =================
+    def deal_values(self, rows=None):
+        bids = self.auction_columns[0]
+        lows = [lo for lo, _ in self.auction_values]
+        highs = [hi for _, hi in self.auction_values]
+        if rows is None:
+            return metric_values(
+                self.top_deals_metric, self.auction_scores, bids,
+                self.auction_predictions, lows, highs,
+            )
+        return metric_values(
+            self.top_deals_metric,
+            self.auction_scores[rows],
+            bids[rows],
+            self.auction_predictions[rows],
+            [lows[i] for i in rows],
+            [highs[i] for i in rows],
+        )
 
-            if delta.total_seconds() <= 0:
-                time_left = "ENDED"
-                sort_hours = float("inf")
-            else:
-                days = delta.days
-                hours = delta.seconds // 3600
-                minutes = (delta.seconds % 3600) // 60
-                time_left = f"{days}d {hours}h" if days > 0 else f"{hours}h {minutes}m"
-                sort_hours = hrs
+    def refresh_top_deals(self):
+        # Unchanged values are no-ops inside TopK, so this only pays for
+        # auctions whose metric actually moved.
+        if len(self.auction_scores) == len(self.auctions):
+            self.top_deals.update_many(
+                [a["auction_id"] for a in self.auctions],
+                self.deal_values().tolist(),
+                self.auctions,
+            )
+        self.render_top_deals()
 
-            vel = bid_velocity(a["auction_id"])
-            score = profit_score(a, vel)
+    def update_deal_value(self, aid, low, high):
+        idx = self.auction_index.get(aid)
+        if idx is None or idx >= len(self.auction_scores):
+            return
+        self.auction_values[idx] = (low, high)
+        value = self.deal_values([idx])[0]
+        self.top_deals.update(aid, float(value), self.auctions[idx])
+        self.render_top_deals()
+
+    def render_top_deals(self):
+        self.deals_list.clear()
+        deals = self.top_deals.items()
+        if not deals:
+            placeholder = QListWidgetItem("No auctions loaded yet.")
+            placeholder.setFlags(Qt.NoItemFlags)
+            self.deals_list.addItem(placeholder)
+            return
 
-            if score < min_score or hrs > max_hours:
-                continue
+        for aid, value, a in deals:
+            bid = float(a["current_bid"].get("amount", 0))
+            item = QListWidgetItem(
+                f"{format_metric(self.top_deals_metric, value)} · ${bid:,.0f} · "
+                f"{a.get('unit_size', '')} · {a['city']} {a['state']}"
+            )
+            item.setData(Qt.UserRole, aid)
+            self.deals_list.addItem(item)
 
-            star_item = QStandardItem("⭐" if a["auction_id"] in self.state.watchlist else "")
-            star_item.setEditable(False)
-            star_item.setData(0, Qt.UserRole)
-
-            location_item = QStandardItem(f"{a['city']} {a['state']}")
-            location_item.setEditable(False)
-
-            unit_item = QStandardItem(a.get("unit_size", ""))
-            unit_item.setEditable(False)
-
-            bid_amount = float(a["current_bid"].get("amount", 0))
-            bid_item = QStandardItem(f"${bid_amount:.0f}")
-            bid_item.setEditable(False)
-            bid_item.setData(bid_amount, Qt.UserRole)
-
-            score_item = QStandardItem(f"{score}/100")
-            score_item.setEditable(False)
-            score_item.setData(score, Qt.UserRole)
-
-            vel_item = QStandardItem(f"{vel:.2f}/hr")
-            vel_item.setEditable(False)
-            vel_item.setData(vel, Qt.UserRole)
-
-            time_item = QStandardItem(time_left)
-            time_item.setEditable(False)
-            time_item.setData(sort_hours, Qt.UserRole)
-
-            self.list_model.appendRow([
-                star_item,
-                location_item,
-                unit_item,
-                bid_item,
-                score_item,
-                vel_item,
-                time_item,
-            ])
+    def on_deals_metric_changed(self, index):
+        self.top_deals_metric = self.deals_metric.itemData(index) or "score"
+        self.top_deals.clear()
+        self.refresh_top_deals()
 
-            self.filtered.append(a)
+    def open_top_deal(self, item):
+        aid = item.data(Qt.UserRole) if item else None
+        if not aid:
+            return
 
-        self.proxy_model.invalidate()
-        self.on_filter_text(self.filter_input.text())
-        self.apply_sort()
-        self.update_filter_status()
+        def fetch():
+            r = requests.get(
+                f"{API_BASE}/p/auctions/{aid}",
+                headers=HEADERS,
+                params={"refresh": "true", "user_ip": self.user_ip},
+            )
+            return r.json()
+
+        self.run_worker(fetch, self.render)
 
     def on_filter_text(self, text):
-        regex = QRegularExpression(text, QRegularExpression.CaseInsensitiveOption)
-        self.proxy_model.setFilterRegularExpression(regex)
-        self.update_filter_status()
+        self.filters.set_mask("text", self.search_index.query(text))
+        self.apply_filters()
 
     def update_filter_status(self):
-        visible = self.proxy_model.rowCount()
-        total = len(self.filtered)
-        self.filter_status.setText(f"{visible} shown / {total} matched filters")
+        visible = self.list_model.rowCount()
+        self.filter_status.setText(
+            f"{visible} shown / {self.filters.matched} matched filters"
+            f" · filtered in {self.filter_pass_ms:.2f} ms"
+        )
+
+    # ================= FACETS =================
+    def fill_facet_menu(self, facet):
+        menu = self.facet_buttons[facet].menu()
+        menu.clear()
+        if self.filter_timer.isActive():
+            self.apply_filters()
+        if len(self.filters) != len(self.auctions) or not self.auctions:
+            menu.addAction("No auctions loaded").setEnabled(False)
+            return
+
+        # Counts under every other filter; cached per facet until that changes
+        counts = self.facets.counts(self.filters.run(exclude=("facets",)))[facet]
+        selected = self.facets.selected[facet]
+        for value, count in sorted(counts.items(), key=lambda kv: (-kv[1], kv[0])):
+            if not count and value not in selected:
+                continue
+            action = menu.addAction(f"{value} ({count})")
+            action.setCheckable(True)
+            action.setChecked(value in selected)
+            action.triggered.connect(lambda _checked, f=facet, v=value: self.toggle_facet(f, v))
+        if menu.isEmpty():
+            menu.addAction("No matches").setEnabled(False)
+
+    def toggle_facet(self, facet, value):
+        self.facets.toggle(facet, value)
+        self.filters.set_mask("facets", self.facets.mask())
+        self.update_facet_buttons()
+        self.apply_filters()
+
+    def clear_facets(self):
+        self.facets.clear()
+        self.filters.set_mask("facets", None)
+        self.update_facet_buttons()
+        self.apply_filters()
+
+    def update_facet_buttons(self):
+        for facet, btn in self.facet_buttons.items():
+            picked = len(self.facets.selected[facet])
+            btn.setText(f"{FACETS[facet]} ({picked})" if picked else FACETS[facet])
+        self.btn_clear_facets.setEnabled(self.facets.active())
 
     def set_sort(self, field):
         column = self.field_column_map.get(field)
@@ -1165,11 +1363,7 @@ class AuctionBrowser(QMainWindow):
     def auction_from_index(self, index):
         if not index.isValid():
             return None
-        source_index = self.proxy_model.mapToSource(index)
-        row = source_index.row()
-        if row < 0 or row >= len(self.filtered):
-            return None
-        return self.filtered[row]
+        return self.list_model.auction_at(index.row())
 
     # ================= WATCHLIST =================
     def open_list_menu(self, pos):
@@ -1183,7 +1377,14 @@ class AuctionBrowser(QMainWindow):
         action = menu.addAction("Toggle Watchlist ⭐")
         if menu.exec_(self.list.mapToGlobal(pos)) == action:
             self.state.toggle_watch(aid)
-            self.apply_filters()
+            aids = [a["auction_id"] for a in self.auctions]
+            self.list_model.update_values(
+                watched=np.array([aid in self.state.watchlist for aid in aids], dtype=bool)
+            )
+            self.facets.set_watchlist(aids, self.state.watchlist)
+            if self.facets.selected["watchlist"]:
+                self.filters.set_mask("facets", self.facets.mask())
+                self.apply_filters()
 
     def load_cached_analysis(self, item):
         if not item or not self.recent_vision_results or self.vision_worker:
@@ -1232,9 +1433,12 @@ class AuctionBrowser(QMainWindow):
         self.set_analysis_active(False)
         save_bid(a)
         self.current = a
+        self.current_expiry = datetime.fromisoformat(
+            a["expire_date"]["utc"]["datetime"]
+        ).replace(tzinfo=timezone.utc)
 
         vel = bid_velocity(a["auction_id"])
-        score = profit_score(a, vel)
+        score = self.score_cache.score(a, vel, self.scoring_weights)
 
         tags = tag_from_text(a.get("unit_contents"))
 
@@ -1265,111 +1469,94 @@ class AuctionBrowser(QMainWindow):
         if lo is not None and hi is not None:
             self.update_totals_display({"low": lo, "high": hi})
         else:
-            self.lbl_resale.setText("--")
-
-        clear_layout(self.details_layout)
-        clear_layout(self.image_grid)
-        self.image_tile_map = {}
+            est_lo, est_hi = estimate(tags, a.get("unit_size") or "")
+            self.lbl_resale.setText(f"≈ ${est_lo:,.0f} – ${est_hi:,.0f}")
+            self.lbl_resale.setToolTip(
+                "Estimated from past appraisals for these categories and unit size. "
+                "Run Analyze Images for an itemized value."
+            )
 
-        def row(k, v):
-            row_frame = QFrame()
-            row_layout = QHBoxLayout(row_frame)
-            row_layout.setContentsMargins(6, 4, 6, 4)
-            row_layout.setSpacing(12)
-
-            title_lbl = QLabel(k)
-            title_lbl.setStyleSheet("font-weight:600;")
-            title_lbl.setMinimumWidth(120)
-
-            value_lbl = QLabel(str(v))
-            value_lbl.setWordWrap(True)
-            value_lbl.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
-            max_width = max(self.card_details.width(), self.details_scroll.viewport().width())
-            value_lbl.setMaximumWidth(max(max_width - 40, 320))
-
-            row_layout.addWidget(title_lbl)
-            row_layout.addWidget(value_lbl, 1)
-            self.details_layout.addWidget(row_frame)
-
-        row("Unit Size", a["unit_size"])
-        row("Current Bid", a["current_bid"]["formatted"])
-        row("Total Bids", a["total_bids"])
-        row("Views", a["total_views"])
-        row("Contents", a["unit_contents"] or "—")
-        row("Tags", ", ".join(tags))
+        self.image_pool.new_generation()
+
+        # Pooled rows and tiles are rebound in place; only changed fields are touched
+        max_width = max(self.card_details.width(), self.details_scroll.viewport().width())
+        details = [
+            ("Unit Size", a["unit_size"]),
+            ("Current Bid", a["current_bid"]["formatted"]),
+            ("Total Bids", a["total_bids"]),
+            ("Views", a["total_views"]),
+            ("Contents", a["unit_contents"] or "—"),
+            ("Tags", ", ".join(tags)),
+        ]
+        for row, (k, v) in zip(self.detail_rows.take(len(details)), details):
+            row.bind(k, v, max(max_width - 40, 320))
 
         bids = get_recent_bids(a["auction_id"])
-        sp = sparkline(bids, velocity=vel)
-        lbl = QLabel()
-        lbl.setPixmap(sp)
-        self.details_layout.addWidget(QLabel("Bid Trend"))
-        self.details_layout.addWidget(lbl)
+        self.bid_trend.setPixmap(sparkline(bids, velocity=vel))
+        self.bid_chart.set_history(get_bid_history(a["auction_id"]), velocity=vel)
+        self.bid_trend_title.setVisible(True)
+        self.bid_trend.setVisible(True)
 
-        r = c = 0
+        images = []
         for idx, img in enumerate(a.get("images", []), start=1):
             url = img.get("image_path_large") or img.get("image_path")
-            if not url:
-                continue
-
-            tile = QFrame()
-            tile_layout = QVBoxLayout(tile)
-            tile_layout.setContentsMargins(4, 4, 4, 4)
-            tile_layout.setSpacing(6)
-
-            lbl = ClickableLabel({"url": url, "index": idx})
-            lbl.clicked.connect(self.on_image_clicked)
-            lbl.setAlignment(Qt.AlignCenter)
-            lbl.setFixedSize(220, 220)
-            lbl.setStyleSheet("color:#9ca3af; border:1px dashed #1f2937;")
-            lbl.setText("Loading…")
-
-            status = QLabel("Not analyzed")
-            status.setAlignment(Qt.AlignCenter)
-            status.setStyleSheet(
-                "color:#9ca3af; padding:2px 6px; border-radius:8px;"
-                "background:#111827; font-size:11px;"
-            )
+            if url:
+                images.append((idx, url))
 
-            tile_layout.addWidget(lbl)
-            tile_layout.addWidget(status)
-            self.image_grid.addWidget(tile, r, c)
-
-            self.image_tile_map[url] = {
-                "label": lbl,
-                "status": status,
+        summaries = self.state.vision_image_summaries.get(aid) or {}
+        previous = self.image_tile_map
+        self.image_tile_map = {}
+        for tile, (idx, url) in zip(self.image_tiles.take(len(images)), images):
+            meta = {
+                "tile": tile,
+                "label": tile.label,
+                "status": tile.status,
                 "index": idx,
             }
-
-            loader = ImageLoader(url, lbl)
-            loader.loaded.connect(self.on_image_loaded)
-            self.image_threads.append(loader)
-            loader.finished.connect(lambda l=loader: self.image_threads.remove(l))
-            loader.start()
-
-            c += 1
-            if c == 3:
-                c = 0
-                r += 1
+            # Same image in the same tile (e.g. a refresh) keeps its pixmaps
+            old = None if tile.bind(url, idx) else previous.get(url)
+            if old and old.get("base_pixmap"):
+                for key in ("base_pixmap", "annotated_pixmap", "annotated_source"):
+                    if key in old:
+                        meta[key] = old[key]
+                meta["requested"] = True
+            self.image_tile_map[url] = meta
+            if url not in summaries:
+                tile.set_status("Not analyzed", "#111827", "#9ca3af")
 
         self.apply_image_summaries(aid)
+        # Tiles are only placeholders until they come near the viewport;
+        # wait for the grid to be laid out before measuring
+        QTimer.singleShot(0, self.realize_image_tiles)
 
         self.update_distance_badge(a.get("facility", {}).get("marker"))
         self.update_map_preview(a.get("facility", {}))
 
+    def make_image_tile(self):
+        tile = ImageTile(TILE_SIZE)
+        tile.label.clicked.connect(self.on_tile_clicked)
+        return tile
+
+    def summary_status(self, items):
+        if items:
+            return f"Analyzed ({len(items)} items)", "#22c55e"
+        return "Analyzed (no items)", "#6b7280"
+
     def render_vision_items(self, items, manual_active=False):
-        clear_layout(self.vision_container)
         self.analysis_placeholder = None
         self.vision_items_displayed = []
         self.btn_reset_ai.setVisible(manual_active)
+        self.vision_model.set_items([])
 
         if not items:
-            placeholder = QLabel("Analyze images to see itemized estimates.")
-            placeholder.setStyleSheet("color:#9ca3af;")
-            self.vision_container.addWidget(placeholder)
+            self.vision_table.setVisible(False)
+            self.btn_save_vision.setVisible(False)
+            self.vision_placeholder.setText("Analyze images to see itemized estimates.")
+            self.vision_placeholder.setVisible(True)
             return
 
+        self.vision_placeholder.setVisible(False)
         self.append_vision_items(items)
-        self.vision_items_displayed = list(items)
 
     def apply_image_summaries(self, aid):
         summaries = self.state.vision_image_summaries.get(aid)
@@ -1381,16 +1568,11 @@ class AuctionBrowser(QMainWindow):
             meta = self.image_tile_map.get(url, {})
             meta["items"] = items
             self.image_tile_map[url] = meta
-            if items:
-                label = f"Analyzed ({len(items)} items)"
-                color = "#22c55e"
-            else:
-                label = "Analyzed (no items)"
-                color = "#6b7280"
-            self.set_image_status(url, label, color)
+            self.set_image_status(url, *self.summary_status(items))
 
             annotated = info.get("annotated")
-            if annotated:
+            if annotated and annotated != meta.get("annotated_source"):
+                meta["annotated_source"] = annotated
                 try:
                     data = base64.b64decode(annotated)
                     pix = QPixmap()
@@ -1399,6 +1581,50 @@ class AuctionBrowser(QMainWindow):
                 except Exception:
                     pass
 
+    def realize_image_tiles(self, *_):
+        """Loads tiles near the gallery viewport and releases those far from it."""
+        container = self.images_scroll.widget()
+        visible = self.images_scroll.isVisible()
+        if visible:
+            top = self.images_scroll.verticalScrollBar().value()
+            height = self.images_scroll.viewport().height()
+
+        for url, meta in self.image_tile_map.items():
+            tile = meta.get("tile")
+            if tile is None:
+                continue
+            if visible:
+                y = tile.mapTo(container, QPoint(0, 0)).y()
+                near = y + tile.height() >= top - height * TILE_PREFETCH_SCREENS and y <= top + height * (1 + TILE_PREFETCH_SCREENS)
+                far = y + tile.height() < top - height * TILE_RELEASE_SCREENS or y > top + height * (1 + TILE_RELEASE_SCREENS)
+            else:
+                # Gallery tab hidden: prefetch the first screen so it opens painted
+                near = meta["index"] <= FIRST_SCREEN_TILES
+                far = False
+
+            if near and not meta.get("requested"):
+                self.load_tile(url, meta)
+            elif far and meta.get("requested"):
+                self.release_tile(url, meta)
+
+    def load_tile(self, url, meta):
+        meta["requested"] = True
+        thumb = IMAGE_CACHE.thumbnail(url)
+        if thumb is not None:
+            meta["label"].setText("")
+            self.set_label_pixmap(url, QPixmap.fromImage(thumb))
+        else:
+            self.image_pool.submit(url, priority=meta["index"])
+
+    def release_tile(self, url, meta):
+        meta["requested"] = False
+        self.image_pool.cancel(url)
+        if meta.get("annotated_pixmap"):
+            return
+        meta.pop("base_pixmap", None)
+        meta["label"].clear()
+        meta["label"].setText("Loading…")
+
     def set_label_pixmap(self, url, pixmap, is_annotated=False):
         meta = self.image_tile_map.get(url)
         if not meta:
@@ -1419,22 +1645,39 @@ class AuctionBrowser(QMainWindow):
         if not active:
             return
 
-        label.setPixmap(
-            active.scaled(
-                220,
-                220,
+        # Thumbnails arrive tile-sized; only annotated images need scaling
+        if active.width() > TILE_SIZE or active.height() > TILE_SIZE:
+            active = active.scaled(
+                TILE_SIZE,
+                TILE_SIZE,
                 Qt.KeepAspectRatio,
                 Qt.SmoothTransformation,
             )
-        )
+        label.setPixmap(active)
+
+    def on_tile_clicked(self, payload):
+        self.on_image_clicked(payload)
 
-        def handler(event, p=active, lbl=label, boxes=meta.get("items", [])):
-            lbl.clicked.emit(lbl.payload)
-            if p:
-                overlay_boxes = [] if meta.get("annotated_pixmap") else boxes
-                ImageViewer(p, boxes=overlay_boxes).exec()
+        url = payload.get("url")
+        meta = self.image_tile_map.get(url)
+        if not meta or not (meta.get("annotated_pixmap") or meta.get("base_pixmap")):
+            return
+        if meta.get("annotated_pixmap"):
+            ImageViewer(meta["annotated_pixmap"]).exec()
+            return
 
-        label.mousePressEvent = handler
+        # Tiles only hold thumbnails. The viewer opens on the thumbnail and
+        # swaps in the full image once the pool has read or fetched it
+        viewer = ImageViewer(meta["base_pixmap"], boxes=meta.get("items", []))
+
+        def on_full(loaded_url, image):
+            if loaded_url == url:
+                viewer.set_pixmap(QPixmap.fromImage(image))
+
+        self.image_pool.fullLoaded.connect(on_full)
+        self.image_pool.submit_full(url)
+        viewer.exec()
+        self.image_pool.fullLoaded.disconnect(on_full)
 
     def set_analysis_active(self, active, auction_name=""):
         self.card_details.setEnabled(not active)
@@ -1468,13 +1711,6 @@ class AuctionBrowser(QMainWindow):
         self.btn_cancel_analyze.setEnabled(True)
         self.recent_list.setEnabled(True)
 
-    def get_confidence_badge(self, conf):
-        if conf >= 0.8:
-            return "High", "#22c55e"
-        if conf >= 0.5:
-            return "Medium", "#eab308"
-        return "Low", "#ef4444"
-
     def resolve_display_items(self, res):
         manual_items = res.get("manual_items") or []
         if manual_items:
@@ -1506,6 +1742,7 @@ class AuctionBrowser(QMainWindow):
         lo = float(totals.get("low", 0))
         hi = float(totals.get("high", 0))
         self.lbl_resale.setText(f"${lo:,.0f} – ${hi:,.0f}")
+        self.lbl_resale.setToolTip("")
         self.update_profit_ratio_display(totals)
 
     def update_profit_ratio_display(self, totals=None):
@@ -1524,44 +1761,18 @@ class AuctionBrowser(QMainWindow):
             return
 
         vel = bid_velocity(self.current.get("auction_id"))
-        score = profit_score(self.current, vel)
+        score = self.score_cache.score(self.current, vel, self.scoring_weights)
         self.lbl_score.setText(f"{score}/100")
 
     def append_vision_items(self, items):
-        for it in items:
-            row = self.build_vision_row(it)
-            self.vision_container.addWidget(row)
+        self.vision_model.append_items(items)
+        self.vision_items_displayed.extend(items)
+        self.vision_table.setVisible(True)
+        self.btn_save_vision.setVisible(True)
+        self.vision_table.fit_rows()
 
     def collect_manual_items_from_ui(self):
-        manual_items = []
-        for i in range(self.vision_container.count()):
-            w = self.vision_container.itemAt(i).widget()
-            if not w or not hasattr(w, "name_input"):
-                continue
-
-            low_val = w.low_input.value()
-            high_val = w.high_input.value()
-            if high_val < low_val:
-                high_val = low_val
-                w.high_input.setValue(high_val)
-
-            manual_items.append(
-                {
-                    "name": w.name_input.text().strip() or "Unknown item",
-                    "brand": w.brand_input.text().strip() or "Unknown brand",
-                    "confidence": float(getattr(w, "confidence", 0)),
-                    "low": low_val,
-                    "high": high_val,
-                    "hidden": w.hide_btn.isChecked(),
-                }
-            )
-        return manual_items
-
-    def toggle_row_hidden(self, row, hidden):
-        for widget in (row.name_input, row.brand_input, row.low_input, row.high_input):
-            widget.setEnabled(not hidden)
-        row.hide_btn.setText("Show" if hidden else "Hide")
-        row.setStyleSheet("opacity:0.6;" if hidden else "")
+        return self.vision_model.items()
 
     def persist_manual_edits(self):
         if not self.current:
@@ -1598,10 +1809,12 @@ class AuctionBrowser(QMainWindow):
             facility_name=facility_name,
             manual_items=manual_items,
             manual_totals=totals,
+            unit_size=self.current.get("unit_size") or "",
         )
 
         self.using_manual = True
         self.update_totals_display(totals)
+        self.update_deal_value(aid, low, high)
         self.render_vision_items(manual_items, manual_active=True)
         self.vision_status.setStyleSheet("color:#22c55e;")
         self.vision_status.setText("Manual edits saved. Totals updated.")
@@ -1625,6 +1838,7 @@ class AuctionBrowser(QMainWindow):
             self.using_manual = manual_active
             self.render_vision_items(items, manual_active=manual_active)
             self.update_totals_display(totals)
+            self.update_deal_value(aid, totals["low"], totals["high"])
 
         self.btn_reset_ai.setVisible(False)
         self.vision_status.setStyleSheet("color:#9ca3af;")
@@ -1636,16 +1850,9 @@ class AuctionBrowser(QMainWindow):
 
     def set_image_status(self, url, text, color):
         meta = self.image_tile_map.get(url)
-        if not meta:
+        if not meta or not meta.get("tile"):
             return
-        lbl = meta.get("status")
-        if not lbl:
-            return
-        lbl.setText(text)
-        lbl.setStyleSheet(
-            "color:white; padding:2px 6px; border-radius:8px;"
-            f"background:{color}; font-size:11px;"
-        )
+        meta["tile"].set_status(text, color)
 
     def store_image_items(self, aid, url, index, items, annotated_bytes=None):
         if not url:
@@ -1710,82 +1917,13 @@ class AuctionBrowser(QMainWindow):
         layout.addWidget(buttons)
         dlg.exec()
 
-    def build_vision_row(self, it):
-        name = it.get("name") or "Unknown item"
-        brand = it.get("brand") or "Unknown brand"
-        conf = float(it.get("confidence", 0))
-        low = float(it.get("low", 0))
-        high = float(it.get("high", 0))
-        hidden = bool(it.get("hidden"))
-
-        badge_label, badge_color = self.get_confidence_badge(conf)
-
-        row = QWidget()
-        row_layout = QHBoxLayout(row)
-        row_layout.setContentsMargins(0, 0, 0, 0)
-        row_layout.setSpacing(8)
-
-        badge = QLabel(f"{badge_label} • {conf*100:.0f}%")
-        badge.setStyleSheet(
-            "color:white; padding:2px 8px; border-radius:8px; font-weight:600;"
-            f"background:{badge_color};"
-        )
-        row_layout.addWidget(badge)
-
-        name_input = QLineEdit(name)
-        name_input.setPlaceholderText("Item name")
-        brand_input = QLineEdit(brand)
-        brand_input.setPlaceholderText("Brand")
-
-        low_input = QDoubleSpinBox()
-        low_input.setRange(0, 1_000_000)
-        low_input.setDecimals(0)
-        low_input.setValue(low)
-        low_input.setPrefix("$")
-
-        high_input = QDoubleSpinBox()
-        high_input.setRange(0, 1_000_000)
-        high_input.setDecimals(0)
-        high_input.setValue(high)
-        high_input.setPrefix("$")
-
-        hide_btn = QPushButton("Hide")
-        hide_btn.setCheckable(True)
-        hide_btn.setChecked(hidden)
-        hide_btn.toggled.connect(lambda checked, r=row: self.toggle_row_hidden(r, checked))
-
-        save_btn = QPushButton("Save")
-        save_btn.clicked.connect(self.persist_manual_edits)
-
-        row.name_input = name_input
-        row.brand_input = brand_input
-        row.low_input = low_input
-        row.high_input = high_input
-        row.hide_btn = hide_btn
-        row.confidence = conf
-
-        row_layout.addWidget(name_input, 2)
-        row_layout.addWidget(brand_input, 2)
-        row_layout.addWidget(low_input)
-        row_layout.addWidget(high_input)
-        row_layout.addWidget(hide_btn)
-        row_layout.addWidget(save_btn)
-
-        self.toggle_row_hidden(row, hidden)
-
-        return row
-
     # ================= TIMER =================
     def update_countdown(self):
-        if not self.current:
+        if not self.current or not self.current_expiry:
             return
 
-        exp = datetime.fromisoformat(
-            self.current["expire_date"]["utc"]["datetime"]
-        ).replace(tzinfo=timezone.utc)
-
         now = datetime.now(timezone.utc)
-        delta = exp - now
+        delta = self.current_expiry - now
         mins = delta.total_seconds() / 60
 
         if mins <= 0:
@@ -1809,6 +1947,27 @@ class AuctionBrowser(QMainWindow):
         if fired:
             self.lbl_time.setStyleSheet("color:#ef4444; font-weight:700;")
 
+    def visible_list_rows(self):
+        count = self.list_model.rowCount()
+        first = self.list.rowAt(0)
+        if not count or first < 0:
+            return None
+        last = self.list.rowAt(self.list.viewport().height() - 1)
+        return first, (count - 1 if last < 0 else last)
+
+    def update_list_countdown(self):
+        # Only the rows on screen are repainted; their text is formatted
+        # from the epoch expiry at paint time.
+        rows = self.visible_list_rows()
+        if rows:
+            self.list_model.refresh_rows(*rows, COL_TIME)
+
+        # Auctions drift into the max-hours window as time passes
+        self.countdown_ticks += 1
+        if self.countdown_ticks % 60 == 0 and len(self.filters):
+            self.filters.refresh_hours(self.auction_expire_at)
+            self.apply_filters()
+
     # ================= ACTIONS =================
     def open_map(self):
         marker = None
@@ -1826,25 +1985,73 @@ class AuctionBrowser(QMainWindow):
         webbrowser.open(f"https://www.google.com/maps?q={lat},{lng}")
 
     def get_search_coordinates(self):
-        zip_code = str(SEARCH_PARAMS.get("search_term", "")).strip()
+        return self.zip_coordinates(str(SEARCH_PARAMS.get("search_term", "")).strip())
+
+    def zip_coordinates(self, zip_code):
         if not zip_code:
             return None
 
         if zip_code in self.zip_coord_cache:
             return self.zip_coord_cache[zip_code]
 
-        try:
-            info = self.geocoder.query_postal_code(zip_code)
-            lat, lng = float(info.latitude), float(info.longitude)
-            if math.isnan(lat) or math.isnan(lng):
-                raise ValueError("Invalid coordinates")
-            coords = (lat, lng)
-        except Exception:
-            coords = None
+        if self.zip_centroids is None:
+            # Answered again once the centroids are in
+            self.ensure_geocoder()
+            return None
 
+        coords = self.zip_centroids.lookup(zip_code)
         self.zip_coord_cache[zip_code] = coords
+        if coords:
+            save_zip_coords(zip_code, *coords)
         return coords
 
+    def refresh_distances(self):
+        """Miles from every listed facility to its nearest resolved search ZIP, in one pass."""
+        origins = [(z, self.zip_coordinates(z)) for z in self.search_zips]
+        origins = [(z, c) for z, c in origins if c]
+        self.origin_zips = [z for z, _ in origins]
+        self.auction_distances, self.auction_origin = nearest_origin(
+            [c for _, c in origins], self.auction_lat, self.auction_lng
+        )
+
+    def geocoder_failed(self):
+        """True while a failed centroid build is too recent to retry."""
+        return (
+            self.geocoder_failed_at is not None
+            and time.time() - self.geocoder_failed_at < GEOCODER_RETRY_SECONDS
+        )
+
+    def ensure_geocoder(self):
+        if self.zip_centroids is not None or self.geocoder_loading or self.geocoder_failed():
+            return
+        self.geocoder_loading = True
+
+        def load():
+            try:
+                return load_zip_centroids()
+            except Exception:
+                return None
+
+        self.run_worker(load, self.on_geocoder_ready)
+
+    def on_geocoder_ready(self, centroids):
+        self.geocoder_loading = False
+        if centroids is None:
+            # Every lookup would start another download attempt otherwise
+            self.geocoder_failed_at = time.time()
+            if self.current:
+                self.update_distance_badge(self.current.get("facility", {}).get("marker"))
+            return
+        self.geocoder_failed_at = None
+        self.zip_centroids = centroids
+        if len(self.filters) == len(self.auctions):
+            self.refresh_distances()
+            self.filters.set_distances(self.auction_distances)
+            self.list_model.update_values(distance=self.auction_distances)
+            self.apply_filters()
+        if self.current:
+            self.update_distance_badge(self.current.get("facility", {}).get("marker"))
+
     def calculate_distance_miles(self, facility_marker):
         if not facility_marker:
             return None
@@ -1864,34 +2071,39 @@ class AuctionBrowser(QMainWindow):
         if None in (lat2, lng2) or math.isnan(lat2) or math.isnan(lng2):
             return None
 
-        def to_radians(deg):
-            return deg * math.pi / 180
-
-        r = 3958.8  # Earth radius in miles
-        dlat = to_radians(lat2 - lat1)
-        dlng = to_radians(lng2 - lng1)
-        a = (
-            math.sin(dlat / 2) ** 2
-            + math.cos(to_radians(lat1))
-            * math.cos(to_radians(lat2))
-            * math.sin(dlng / 2) ** 2
-        )
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-        return r * c
+        return float(haversine_miles(lat1, lng1, lat2, lng2))
+
+    def listed_distance(self, aid):
+        """(miles, origin ZIP) from the precomputed distance column, or None."""
+        idx = self.auction_index.get(aid)
+        if idx is None or idx >= len(self.auction_distances) or np.isnan(self.auction_distances[idx]):
+            return None
+        return float(self.auction_distances[idx]), self.origin_zips[self.auction_origin[idx]]
 
     def update_distance_badge(self, facility_marker):
-        distance = self.calculate_distance_miles(facility_marker)
-        zip_code = SEARCH_PARAMS.get("search_term", "")
+        listed = self.listed_distance(self.current.get("auction_id")) if self.current else None
+        if listed:
+            distance, zip_code = listed
+        else:
+            distance = self.calculate_distance_miles(facility_marker)
+            zip_code = SEARCH_PARAMS.get("search_term", "")
 
         if distance is None:
-            self.distance_badge.setText("Distance unavailable")
+            self.distance_badge.setText(
+                "Distance unavailable — ZIP lookup failed, retrying later"
+                if self.geocoder_failed() else "Distance unavailable"
+            )
             self.distance_badge.setStyleSheet(
                 "background:#6b7280; color:white; padding:6px 10px;"
                 "border-radius:10px; font-weight:600;"
             )
             return
 
-        self.distance_badge.setText(f"{distance:.1f} mi from {zip_code}")
+        text = f"{distance:.1f} mi from {zip_code}"
+        nearby = self.nearby_auctions(facility_marker)
+        if nearby:
+            text += f" · {len(nearby)} more nearby"
+        self.distance_badge.setText(text)
         badge_color = "#22c55e" if distance <= 25 else "#f59e0b" if distance <= 75 else "#ef4444"
         self.distance_badge.setStyleSheet(
             f"background:{badge_color}; color:white; padding:6px 10px;"
@@ -1900,7 +2112,20 @@ class AuctionBrowser(QMainWindow):
 
     def update_map_preview(self, facility):
         marker = facility.get("marker") if facility else None
-        self.map_preview.load_marker(marker)
+        nearby = self.nearby_auctions(marker)
+        self.map_preview.load_marker(
+            marker, [(self.auction_lat[i], self.auction_lng[i]) for i in nearby]
+        )
+
+    def nearby_auctions(self, facility_marker):
+        """List positions of the other listed auctions within NEARBY_MILES of a facility."""
+        try:
+            lat, lng = float(facility_marker.get("lat")), float(facility_marker.get("lng"))
+        except (AttributeError, TypeError, ValueError):
+            return []
+        positions, _ = self.facility_index.within(lat, lng, NEARBY_MILES)
+        current = self.auction_index.get(self.current.get("auction_id")) if self.current else None
+        return [int(i) for i in positions if i != current]
 
     def format_end_time(self):
         exp = (
@@ -1950,7 +2175,7 @@ class AuctionBrowser(QMainWindow):
             if it.get("hidden"):
                 continue
             conf = float(it.get("confidence", 0))
-            badge_label, badge_color = self.get_confidence_badge(conf)
+            badge_label, badge_color = confidence_badge(conf)
             badge_data.append(
                 {
                     "name": it.get("name") or "Unknown item",
@@ -2108,6 +2333,7 @@ class AuctionBrowser(QMainWindow):
 
 # ================= MAIN =================
 if __name__ == "__main__":
+    register_tile_scheme()
     app = QApplication(sys.argv)
     app.setStyleSheet(STYLE)
     win = AuctionBrowser()
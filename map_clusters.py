@@ -0,0 +1,108 @@
+
+import numpy as np
+
+# Zoom levels clustered in advance; views outside use the nearest level
+MIN_ZOOM = 2
+MAX_ZOOM = 18
+# Grid cell size in screen pixels; markers sharing a cell become one cluster
+CELL_PX = 60
+TILE_PX = 256
+
+
+def mercator_px(lat, lng, zoom):
+    """Web Mercator pixel coordinates at `zoom`, as Leaflet places them."""
+    world = TILE_PX * 2.0 ** zoom
+    lat = np.clip(np.asarray(lat, dtype=np.float64), -85.05112878, 85.05112878)
+    x = (np.asarray(lng, dtype=np.float64) + 180.0) / 360.0 * world
+    phi = np.radians(lat)
+    y = (1.0 - np.log(np.tan(phi) + 1.0 / np.cos(phi)) / np.pi) / 2.0 * world
+    return x, y
+
+
+class ClusterLevel:
+    """Clusters of one zoom level: centroid, count and members of each."""
+
+    def __init__(self, lat, lng, zoom, cell_px):
+        x, y = mercator_px(lat, lng, zoom)
+        cells_per_row = int(TILE_PX * 2 ** zoom // cell_px) + 1
+        keys = np.floor(x / cell_px).astype(np.int64) * cells_per_row + np.floor(y / cell_px).astype(np.int64)
+        _, inverse, self.counts = np.unique(keys, return_inverse=True, return_counts=True)
+        self.lat = np.bincount(inverse, weights=lat) / self.counts
+        self.lng = np.bincount(inverse, weights=lng) / self.counts
+        # Points grouped by cluster: members of cluster c are order[offsets[c]:offsets[c + 1]]
+        self.order = np.argsort(inverse, kind="stable")
+        self.offsets = np.concatenate(([0], np.cumsum(self.counts)))
+
+    def __len__(self):
+        return len(self.counts)
+
+
+class ClusterIndex:
+    """
+    Grid clustering of map points for every zoom level, computed once
+    per point set.
+
+    Each level buckets points by a CELL_PX pixel grid in Web Mercator
+    space, so the map draws one marker per occupied cell however many
+    auctions fall inside it. Points carry caller ids (e.g. list slots);
+    NaN coordinates are dropped.
+    """
+
+    def __init__(self, ids, lat, lng, cell_px=CELL_PX):
+        lat = np.asarray(lat, dtype=np.float64)
+        lng = np.asarray(lng, dtype=np.float64)
+        valid = np.isfinite(lat) & np.isfinite(lng)
+        self.ids = np.asarray(ids)[valid]
+        self.lat = lat[valid]
+        self.lng = lng[valid]
+        self.levels = {
+            zoom: ClusterLevel(self.lat, self.lng, zoom, cell_px)
+            for zoom in range(MIN_ZOOM, MAX_ZOOM + 1)
+        } if len(self.ids) else {}
+
+    def __len__(self):
+        return len(self.ids)
+
+    def level(self, zoom):
+        return self.levels.get(min(max(int(zoom), MIN_ZOOM), MAX_ZOOM))
+
+    def bounds(self, ids=None):
+        """(south, west, north, east) around the given ids, or every point."""
+        if ids is None:
+            lat, lng = self.lat, self.lng
+        else:
+            pick = np.isin(self.ids, ids)
+            lat, lng = self.lat[pick], self.lng[pick]
+        if not len(lat):
+            return None
+        return float(lat.min()), float(lng.min()), float(lat.max()), float(lng.max())
+
+    def clusters(self, zoom, bounds=None):
+        """
+        [lat, lng, count, cluster] rows of one zoom level, limited to
+        `bounds` (south, west, north, east) when given.
+        """
+        level = self.level(zoom)
+        if level is None:
+            return []
+        keep = np.arange(len(level))
+        if bounds is not None:
+            south, west, north, east = bounds
+            inside = (
+                (level.lat >= south) & (level.lat <= north)
+                & (level.lng >= west) & (level.lng <= east)
+            )
+            keep = keep[inside]
+        return np.column_stack((
+            np.round(level.lat[keep], 6),
+            np.round(level.lng[keep], 6),
+            level.counts[keep],
+            keep,
+        )).tolist()
+
+    def members(self, zoom, cluster):
+        """Ids of the points in one cluster of a zoom level."""
+        level = self.level(zoom)
+        if level is None or not 0 <= cluster < len(level):
+            return self.ids[:0]
+        return self.ids[level.order[level.offsets[cluster]:level.offsets[cluster + 1]]]
@@ -0,0 +1,416 @@
+
+import json
+import math
+import os
+
+import numpy as np
+from PySide6.QtCore import (
+    Qt, QBuffer, QCoreApplication, QIODevice, QObject, QRunnable, QThreadPool, QUrl, Signal, Slot,
+)
+from PySide6.QtWidgets import (
+    QHBoxLayout, QLabel, QStackedLayout, QStyle, QToolButton, QVBoxLayout, QWidget,
+)
+from PySide6.QtWebChannel import QWebChannel
+from PySide6.QtWebEngineCore import (
+    QWebEngineUrlRequestJob, QWebEngineUrlScheme, QWebEngineUrlSchemeHandler,
+)
+from PySide6.QtWebEngineWidgets import QWebEngineView
+
+from map_clusters import ClusterIndex
+from tile_cache import MAX_TILE_READ_THREADS, MAX_TILE_THREADS, TILE_CACHE, TILE_SCHEME, parse_tile_path, upstream_url
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+# Leaflet pages with bundled leaflet.js/css, so no CDN round trip per load
+MAP_PAGE = os.path.join(ASSETS_DIR, "map.html")
+CLUSTER_MAP_PAGE = os.path.join(ASSETS_DIR, "cluster_map.html")
+
+MARKER_ZOOM = 13
+# Furthest the cluster map zooms in when fitting points
+FIT_MAX_ZOOM = 15
+# Clusters are sent for the view plus this fraction of it on each side,
+# so short pans do not wait for Python
+VIEW_PADDING = 0.5
+
+
+def register_tile_scheme():
+    """Declares tiles:// to Qt WebEngine; must run before the QApplication is created."""
+    scheme = QWebEngineUrlScheme(TILE_SCHEME)
+    scheme.setSyntax(QWebEngineUrlScheme.Syntax.Host)
+    scheme.setFlags(QWebEngineUrlScheme.SecureScheme | QWebEngineUrlScheme.CorsEnabled)
+    QWebEngineUrlScheme.registerScheme(scheme)
+
+
+class _TileRead(QRunnable):
+    def __init__(self, handler, key, url):
+        super().__init__()
+        self.handler = handler
+        self.key = key
+        self.url = url
+
+    def run(self):
+        try:
+            data = self.handler.cache.cached_bytes(self.url)
+        except Exception:
+            data = None
+        if data is None:
+            self.handler.network.start(_TileFetch(self.handler, self.key, self.url))
+        else:
+            self.handler.fetched.emit(self.key, data)
+
+
+class _TileFetch(QRunnable):
+    def __init__(self, handler, key, url):
+        super().__init__()
+        self.handler = handler
+        self.key = key
+        self.url = url
+
+    def run(self):
+        try:
+            data = self.handler.cache.get_bytes(self.url)
+        except Exception:
+            data = None
+        self.handler.fetched.emit(self.key, data)
+
+
+class TileSchemeHandler(QWebEngineUrlSchemeHandler):
+    """
+    Serves tiles://<any>/{z}/{x}/{y}.png from the disk tile cache.
+
+    requestStarted does no I/O. Tiles are read from disk on one thread
+    pool; misses and stale tiles move on to a second, smaller pool that
+    downloads or revalidates them against TILE_SERVER_URL, so cached
+    tiles never wait behind the network. Either replies when done.
+    """
+
+    fetched = Signal(int, object)
+
+    def __init__(self, cache=TILE_CACHE, parent=None):
+        super().__init__(parent)
+        self.cache = cache
+        self.disk = QThreadPool(self)
+        self.disk.setMaxThreadCount(MAX_TILE_READ_THREADS)
+        self.network = QThreadPool(self)
+        self.network.setMaxThreadCount(MAX_TILE_THREADS)
+        self.jobs = {}
+        self.next_key = 0
+        self.fetched.connect(self.on_fetched)
+
+    def requestStarted(self, job):
+        tile = parse_tile_path(job.requestUrl().path())
+        if tile is None:
+            job.fail(QWebEngineUrlRequestJob.UrlInvalid)
+            return
+        url = upstream_url(*tile)
+        key = self.next_key
+        self.next_key += 1
+        self.jobs[key] = job
+        # The page may drop the request (e.g. panned away) before we answer
+        job.destroyed.connect(lambda *_, k=key: self.jobs.pop(k, None))
+        self.disk.start(_TileRead(self, key, url))
+
+    def on_fetched(self, key, data):
+        job = self.jobs.pop(key, None)
+        if job is None:
+            return
+        if data is None:
+            job.fail(QWebEngineUrlRequestJob.RequestFailed)
+        else:
+            self.reply(job, data)
+
+    def shutdown(self):
+        self.disk.clear()
+        self.network.clear()
+        self.disk.waitForDone(2000)
+        self.network.waitForDone(2000)
+
+    @staticmethod
+    def reply(job, data):
+        buffer = QBuffer(job)
+        buffer.setData(data)
+        buffer.open(QIODevice.ReadOnly)
+        job.reply(b"image/png", buffer)
+
+
+_tile_handler = None
+
+
+def install_tile_handler(profile):
+    global _tile_handler
+    if _tile_handler is None:
+        _tile_handler = TileSchemeHandler(parent=QCoreApplication.instance())
+    if profile.urlSchemeHandler(TILE_SCHEME) is None:
+        profile.installUrlSchemeHandler(TILE_SCHEME, _tile_handler)
+
+
+def shutdown_tile_handler():
+    """Drops queued tile reads and downloads and waits for running ones."""
+    if _tile_handler is not None:
+        _tile_handler.shutdown()
+
+
+class LeafletView(QWebEngineView):
+    """
+    Web view of one bundled Leaflet page, loaded on the first call.
+
+    `call(fn, *args)` runs a page function with JSON arguments; calls made
+    while the page is loading wait for it, keeping only the latest call
+    of each function.
+    """
+
+    failed = Signal()
+
+    def __init__(self, page_path, parent=None):
+        super().__init__(parent)
+        self.page_path = page_path
+        self.page_requested = False
+        self.page_ready = False
+        self.pending = {}
+
+        self.setContextMenuPolicy(Qt.NoContextMenu)
+        self.setStyleSheet("border:1px solid #1f2937; border-radius:12px;")
+        # Tiles come through the tiles:// disk cache, never straight from the network
+        install_tile_handler(self.page().profile())
+        self.loadFinished.connect(self.on_page_loaded)
+
+    def ensure_page(self):
+        if not self.page_requested:
+            self.page_requested = True
+            self.setUrl(QUrl.fromLocalFile(self.page_path))
+
+    def on_page_loaded(self, ok):
+        self.page_ready = ok
+        if not ok:
+            self.page_requested = False
+            self.failed.emit()
+            return
+        pending, self.pending = self.pending, {}
+        for script in pending.values():
+            self.page().runJavaScript(script)
+
+    def call(self, fn, *args):
+        script = f"{fn}({', '.join(json.dumps(a) for a in args)});"
+        if self.page_ready:
+            self.page().runJavaScript(script)
+        else:
+            self.pending[fn] = script
+            self.ensure_page()
+
+
+class MapPreview(QWidget):
+    """
+    Facility map for the selected auction.
+
+    The Leaflet page is loaded once, on the first marker; after that a
+    selection only calls `setMarker` and `setNearby` in the page, which
+    move the marker, view and neighbouring listings without reloading
+    anything.
+    """
+
+    def __init__(self, on_open_full_map, parent=None):
+        super().__init__(parent)
+        self.setMinimumSize(240, 170)
+        self.setMaximumHeight(240)
+
+        self.on_open_full_map = on_open_full_map
+        self.marker = None
+        self.center = None
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(8)
+
+        toolbar = QHBoxLayout()
+        toolbar.setContentsMargins(0, 0, 0, 0)
+
+        self.btn_recenter = QToolButton()
+        self.btn_recenter.setText("Recenter")
+        self.btn_recenter.setIcon(self.style().standardIcon(QStyle.SP_BrowserReload))
+        self.btn_recenter.clicked.connect(self.recenter)
+        self.btn_recenter.setEnabled(False)
+
+        self.btn_open_full = QToolButton()
+        self.btn_open_full.setText("Open Full Map")
+        self.btn_open_full.setIcon(self.style().standardIcon(QStyle.SP_DriveNetIcon))
+        self.btn_open_full.clicked.connect(self.open_full_map)
+        self.btn_open_full.setEnabled(False)
+
+        toolbar.addWidget(self.btn_recenter)
+        toolbar.addWidget(self.btn_open_full)
+        toolbar.addStretch()
+        layout.addLayout(toolbar)
+
+        self.web_view = LeafletView(MAP_PAGE)
+        self.web_view.failed.connect(lambda: self.show_fallback("Map preview failed to load."))
+
+        self.fallback_label = QLabel("Add a facility location to preview the map.")
+        self.fallback_label.setAlignment(Qt.AlignCenter)
+        self.fallback_label.setWordWrap(True)
+        self.fallback_label.setStyleSheet(
+            "border:1px dashed #1f2937; border-radius:12px; padding:12px; color:#9ca3af;"
+        )
+
+        self.stack = QStackedLayout()
+        self.stack.setContentsMargins(0, 0, 0, 0)
+        self.stack.setStackingMode(QStackedLayout.StackAll)
+        self.stack.addWidget(self.fallback_label)
+        self.stack.addWidget(self.web_view)
+
+        container = QWidget()
+        container.setLayout(self.stack)
+        layout.addWidget(container)
+
+        self.show_fallback()
+
+    def show_fallback(self, message="Add a facility location to preview the map."):
+        self.fallback_label.setText(message)
+        self.stack.setCurrentWidget(self.fallback_label)
+        self.btn_recenter.setEnabled(False)
+        self.btn_open_full.setEnabled(False)
+
+    def show_map(self):
+        self.stack.setCurrentWidget(self.web_view)
+        self.btn_recenter.setEnabled(True)
+        self.btn_open_full.setEnabled(True)
+
+    # ---- marker ----
+    def load_marker(self, marker, nearby=()):
+        """Shows `marker` and, as small dots, the (lat, lng) of `nearby` listings."""
+        self.marker = marker if marker else None
+        if not marker:
+            self.show_fallback("Map preview unavailable without coordinates.")
+            return
+
+        lat, lng = marker.get("lat"), marker.get("lng")
+        try:
+            lat, lng = float(lat), float(lng)
+        except (TypeError, ValueError):
+            lat = lng = math.nan
+        if not (math.isfinite(lat) and math.isfinite(lng)):
+            self.show_fallback("Map preview unavailable without valid coordinates.")
+            return
+
+        self.center = (lat, lng)
+        self.web_view.call("setMarker", lat, lng, MARKER_ZOOM)
+        self.web_view.call("setNearby", [[float(a), float(b)] for a, b in nearby])
+        self.show_map()
+
+    def recenter(self):
+        if self.center:
+            lat, lng = self.center
+            self.web_view.call("setMarker", lat, lng, MARKER_ZOOM)
+
+    def open_full_map(self):
+        if self.marker and self.on_open_full_map:
+            self.on_open_full_map()
+
+
+class MapBridge(QObject):
+    """Object the cluster page reaches through QWebChannel."""
+
+    viewChanged = Signal(int, float, float, float, float)
+    clusterClicked = Signal(int, int, int)
+
+    @Slot(int, float, float, float, float)
+    def view_changed(self, zoom, south, west, north, east):
+        self.viewChanged.emit(zoom, south, west, north, east)
+
+    @Slot(int, int, int)
+    def clicked(self, generation, zoom, cluster):
+        self.clusterClicked.emit(generation, zoom, cluster)
+
+
+class ClusterMap(QWidget):
+    """
+    Every auction of the filtered list on one map.
+
+    Clusters for all zoom levels are computed in Python when the point
+    set changes (ClusterIndex); the page reports its zoom and bounds on
+    every move and gets back only the clusters of that level near the
+    view, so thousands of auctions stay a few dozen markers. Clicking a
+    marker emits `auctionsClicked` with its list slots; clicking a
+    cluster that spans an area also zooms to it.
+    """
+
+    auctionsClicked = Signal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.index = None
+        self.points = None
+        self.generation = 0
+        self.view = None
+        self.sent = None
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self.web_view = LeafletView(CLUSTER_MAP_PAGE)
+        self.bridge = MapBridge(self)
+        self.bridge.viewChanged.connect(self.on_view_changed)
+        self.bridge.clusterClicked.connect(self.on_cluster_clicked)
+        self.channel = QWebChannel(self.web_view.page())
+        self.channel.registerObject("bridge", self.bridge)
+        self.web_view.page().setWebChannel(self.channel)
+
+        self.empty_label = QLabel("No filtered auctions have a facility location.")
+        self.empty_label.setAlignment(Qt.AlignCenter)
+        self.empty_label.setStyleSheet("color:#9ca3af;")
+
+        self.stack = QStackedLayout()
+        self.stack.addWidget(self.empty_label)
+        self.stack.addWidget(self.web_view)
+        layout.addLayout(self.stack)
+
+    def set_points(self, slots, lat, lng):
+        """Plots the auctions at list `slots`; a no-op when the set is unchanged."""
+        slots = np.asarray(slots)
+        lat = np.asarray(lat, dtype=np.float64)
+        lng = np.asarray(lng, dtype=np.float64)
+        # List order does not matter to the map, only which points are on it
+        order = np.argsort(slots)
+        points = np.column_stack((slots[order], lat[order], lng[order]))
+        if self.points is not None and np.array_equal(points, self.points, equal_nan=True):
+            return
+        self.points = points
+        self.index = ClusterIndex(slots, lat, lng)
+        self.generation += 1
+        self.sent = None
+
+        bounds = self.index.bounds()
+        if bounds is None:
+            self.stack.setCurrentWidget(self.empty_label)
+            return
+        self.stack.setCurrentWidget(self.web_view)
+        # The page reports the fitted view back, which sends the clusters
+        self.web_view.call("fitPoints", *bounds, FIT_MAX_ZOOM)
+
+    def on_view_changed(self, zoom, south, west, north, east):
+        self.view = (zoom, south, west, north, east)
+        self.send_clusters()
+
+    def send_clusters(self):
+        if self.index is None or self.view is None:
+            return
+        if self.sent == (self.generation, self.view):
+            return
+        self.sent = (self.generation, self.view)
+        zoom, south, west, north, east = self.view
+        pad_lat = (north - south) * VIEW_PADDING
+        pad_lng = (east - west) * VIEW_PADDING
+        bounds = (south - pad_lat, west - pad_lng, north + pad_lat, east + pad_lng)
+        self.web_view.call(
+            "setClusters", self.generation, zoom, self.index.clusters(zoom, bounds)
+        )
+
+    def on_cluster_clicked(self, generation, zoom, cluster):
+        if generation != self.generation or self.index is None:
+            return
+        members = self.index.members(zoom, cluster)
+        if not len(members):
+            return
+        if len(members) > 1:
+            south, west, north, east = self.index.bounds(members)
+            if north > south or east > west:
+                self.web_view.call("fitPoints", south, west, north, east, FIT_MAX_ZOOM + 3)
+        self.auctionsClicked.emit(members.tolist())
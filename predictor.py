@@ -0,0 +1,234 @@
+
+"""
+Final-price predictor trained on archived auction outcomes.
+
+    python predictor.py              # train from auctions.db and save
+    python predictor.py --dry-run    # report fit quality only
+
+Every snapshot of an ended auction is one training example: its inputs at
+that moment (hours to expiry, current bid, bid count, views, unit size,
+content tags) and the price it finally closed at. The model is a ridge
+regression on the log uplift log1p(final) - log1p(current bid); its
+coefficients live in the final_price_model table and predictions for a
+whole list are one matrix-vector product.
+"""
+
+import argparse
+
+import numpy as np
+
+from db import (
+    init_db,
+    load_final_price_model,
+    load_final_price_training_rows,
+    save_final_price_model,
+)
+from resale import unit_size_class
+from vision import TAGGER, tag_many
+
+BASE_FEATURES = [
+    "intercept",
+    "log_hours_left",
+    "log_bid",
+    "log_bid_count",
+    "log_views",
+    "unit_area",
+]
+TAG_FEATURES = [f"tag:{c}" for c in TAGGER.categories + [TAGGER.fallback]]
+FEATURES = BASE_FEATURES + TAG_FEATURES
+
+# Ridge penalty; keeps rarely seen tags from getting wild coefficients.
+RIDGE = 1.0
+
+# Predictions are cached per auction and reused until an input changes or
+# the time to expiry moves into a different bucket.
+HOURS_BUCKET = 0.25
+
+
+def unit_area(unit_size):
+    """Square feet of a unit size string, 0.0 when it cannot be parsed."""
+    size_class = unit_size_class(unit_size)
+    if not size_class:
+        return 0.0
+    a, b = size_class.split("x")
+    return float(a) * float(b)
+
+
+def feature_matrix(bids, bid_counts, views, hours_left, unit_areas, tag_lists):
+    n = len(bids)
+    X = np.zeros((n, len(FEATURES)))
+    X[:, 0] = 1.0
+    X[:, 1] = np.log1p(np.clip(np.asarray(hours_left, dtype=np.float64), 0, None))
+    X[:, 2] = np.log1p(np.clip(np.asarray(bids, dtype=np.float64), 0, None))
+    X[:, 3] = np.log1p(np.clip(np.asarray(bid_counts, dtype=np.float64), 0, None))
+    X[:, 4] = np.log1p(np.clip(np.asarray(views, dtype=np.float64), 0, None))
+    X[:, 5] = np.asarray(unit_areas, dtype=np.float64) / 100.0
+
+    column = {name: i for i, name in enumerate(FEATURES)}
+    for row, tags in enumerate(tag_lists):
+        for tag in tags:
+            col = column.get(f"tag:{tag}")
+            if col is not None:
+                X[row, col] = 1.0
+    return X
+
+
+def fit(rows, ridge=RIDGE):
+    """Returns {feature: coefficient} fitted on training rows from the db."""
+    if not rows:
+        return {}
+
+    bids = np.array([r["bid"] for r in rows])
+    finals = np.array([r["final_bid"] for r in rows])
+    X = feature_matrix(
+        bids,
+        [r["total_bids"] for r in rows],
+        [r["total_views"] for r in rows],
+        [r["hours_left"] for r in rows],
+        [unit_area(r["unit_size"]) for r in rows],
+        tag_many(r["unit_contents"] for r in rows),
+    )
+    y = np.clip(np.log1p(np.clip(finals, 0, None)) - np.log1p(np.clip(bids, 0, None)), 0, None)
+
+    penalty = np.eye(len(FEATURES)) * ridge
+    penalty[0, 0] = 0.0  # leave the intercept unpenalized
+    coef = np.linalg.solve(X.T @ X + penalty, X.T @ y)
+    return dict(zip(FEATURES, coef.tolist()))
+
+
+class FinalPricePredictor:
+    def __init__(self, coefficients=None):
+        if coefficients is None:
+            coefficients = load_final_price_model()
+        self.coefficients = coefficients
+        self.weights = np.array([coefficients.get(name, 0.0) for name in FEATURES])
+
+    @property
+    def trained(self):
+        return bool(self.coefficients)
+
+    def predict(self, bids, bid_counts, views, hours_left, unit_areas, tag_lists):
+        """
+        Predicted closing price per row. Never below the current bid;
+        ended auctions keep their current bid. NaN when untrained.
+        """
+        bids = np.asarray(bids, dtype=np.float64)
+        if not self.trained:
+            return np.full(bids.shape, np.nan)
+
+        X = feature_matrix(bids, bid_counts, views, hours_left, unit_areas, tag_lists)
+        uplift = np.clip(X @ self.weights, 0, None)
+        uplift[np.asarray(hours_left, dtype=np.float64) <= 0] = 0.0
+        return np.expm1(np.log1p(np.clip(bids, 0, None)) + uplift)
+
+
+class PredictionCache:
+    """
+    Keeps the last prediction per auction and only re-predicts rows whose
+    bid, bid count, views, size, tags or expiry bucket changed, so a new
+    snapshot for a handful of auctions costs a handful of rows.
+    """
+
+    def __init__(self, predictor=None):
+        self.predictor = predictor
+        self.entries = {}
+
+    def set_predictor(self, predictor):
+        if predictor is not self.predictor:
+            self.predictor = predictor
+            self.entries.clear()
+
+    def reload(self):
+        """Picks up a newly trained model; the cache survives when the stored coefficients are unchanged."""
+        coefficients = load_final_price_model()
+        if self.predictor is None or coefficients != self.predictor.coefficients:
+            self.set_predictor(FinalPricePredictor(coefficients))
+
+    def predict(self, auction_ids, bids, bid_counts, views, hours_left, unit_areas, tag_lists):
+        if self.predictor is None:
+            self.predictor = FinalPricePredictor()
+
+        bids = np.asarray(bids, dtype=np.float64)
+        hours_left = np.asarray(hours_left, dtype=np.float64)
+        buckets = np.floor(hours_left / HOURS_BUCKET).astype(np.int64).tolist()
+
+        out = np.empty(len(bids))
+        stale = []
+        keys = []
+        for i, aid in enumerate(auction_ids):
+            key = (
+                bids[i],
+                int(bid_counts[i]),
+                int(views[i]),
+                buckets[i],
+                unit_areas[i],
+                tuple(tag_lists[i]),
+            )
+            keys.append(key)
+            cached = self.entries.get(aid)
+            if cached is not None and cached[0] == key:
+                out[i] = cached[1]
+            else:
+                stale.append(i)
+
+        if stale:
+            idx = np.asarray(stale, dtype=np.intp)
+            fresh = self.predictor.predict(
+                bids[idx],
+                np.asarray(bid_counts)[idx],
+                np.asarray(views)[idx],
+                hours_left[idx],
+                np.asarray(unit_areas, dtype=np.float64)[idx],
+                [tag_lists[i] for i in stale],
+            )
+            out[idx] = fresh
+            for i, value in zip(stale, fresh.tolist()):
+                self.entries[auction_ids[i]] = (keys[i], value)
+
+        return out
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Train the final-price predictor from archived auctions.")
+    parser.add_argument("--max-gap-hours", type=float, default=2.0,
+                        help="skip auctions last seen more than this long before expiry (default: %(default)s)")
+    parser.add_argument("--dry-run", action="store_true", help="report fit quality without saving")
+    args = parser.parse_args(argv)
+
+    init_db()
+    rows = load_final_price_training_rows(max_gap_hours=args.max_gap_hours)
+    auctions = len({r["auction_id"] for r in rows})
+    if not rows:
+        print("No ended auctions with a final price yet; nothing to train on.")
+        return
+
+    coefficients = fit(rows)
+    model = FinalPricePredictor(coefficients)
+    predicted = model.predict(
+        [r["bid"] for r in rows],
+        [r["total_bids"] for r in rows],
+        [r["total_views"] for r in rows],
+        [r["hours_left"] for r in rows],
+        [unit_area(r["unit_size"]) for r in rows],
+        tag_many(r["unit_contents"] for r in rows),
+    )
+    finals = np.array([r["final_bid"] for r in rows])
+    naive = np.array([r["bid"] for r in rows])
+
+    for name, coef in coefficients.items():
+        if coef:
+            print(f"{name:<22} {coef:+.4f}")
+    print(
+        f"\n{len(rows)} snapshots from {auctions} auctions: "
+        f"MAE ${np.mean(np.abs(predicted - finals)):,.2f} "
+        f"(current bid as the guess: ${np.mean(np.abs(naive - finals)):,.2f})"
+    )
+
+    if args.dry_run:
+        return
+    save_final_price_model(coefficients, len(rows))
+    print("Saved coefficients to final_price_model.")
+
+
+if __name__ == "__main__":
+    main()
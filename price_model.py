@@ -0,0 +1,131 @@
+"""
+Fits the category / unit-size price lookup that resale.estimate reads.
+
+    python price_model.py            # fit from auctions.db and save
+    python price_model.py --dry-run  # print the fitted table only
+
+Each saved analysis contributes its manual overrides when present
+(hidden items excluded), otherwise the AI items. Items are tagged by
+name and brand with the same taxonomy used for unit_contents, and every
+auction yields one low/high total per category it contains. The lookup
+stores the median of those per-auction totals per category, and per unit
+size class a multiplier: that class's median haul over the overall median.
+"""
+
+import argparse
+from collections import defaultdict
+from datetime import datetime, timezone
+
+import numpy as np
+
+from db import init_db, load_vision_training_rows, save_price_lookup
+from resale import unit_size_class
+from vision import tag_many
+
+
+def auction_items(row):
+    manual = row.get("manual_items") or []
+    if manual:
+        return [it for it in manual if not it.get("hidden")]
+    return row.get("items") or []
+
+
+def fit(rows, fitted_at=None):
+    fitted_at = fitted_at or datetime.now(timezone.utc).isoformat()
+
+    category_lows = defaultdict(list)
+    category_highs = defaultdict(list)
+    size_totals = defaultdict(list)
+    all_totals = []
+
+    for row in rows:
+        items = auction_items(row)
+        if not items:
+            continue
+
+        names = [f"{it.get('name') or ''} {it.get('brand') or ''}" for it in items]
+        lows = defaultdict(float)
+        highs = defaultdict(float)
+        total = 0.0
+        for it, cats in zip(items, tag_many(names)):
+            low = float(it.get("low") or 0)
+            high = max(float(it.get("high") or 0), low)
+            for cat in cats:
+                lows[cat] += low / len(cats)
+                highs[cat] += high / len(cats)
+            total += (low + high) / 2
+
+        for cat in lows:
+            category_lows[cat].append(lows[cat])
+            category_highs[cat].append(highs[cat])
+
+        all_totals.append(total)
+        size_class = unit_size_class(row.get("unit_size"))
+        if size_class:
+            size_totals[size_class].append(total)
+
+    fitted = []
+    for cat in sorted(category_lows):
+        lows = np.asarray(category_lows[cat])
+        highs = np.asarray(category_highs[cat])
+        fitted.append(
+            {
+                "kind": "category",
+                "key": cat,
+                "samples": len(lows),
+                "low": float(np.median(lows)),
+                "high": float(np.median(highs)),
+                "low_p25": float(np.percentile(lows, 25)),
+                "high_p75": float(np.percentile(highs, 75)),
+                "multiplier": None,
+                "fitted_at": fitted_at,
+            }
+        )
+
+    overall = float(np.median(all_totals)) if all_totals else 0.0
+    for size_class in sorted(size_totals):
+        totals = np.asarray(size_totals[size_class])
+        median = float(np.median(totals))
+        fitted.append(
+            {
+                "kind": "unit_size",
+                "key": size_class,
+                "samples": len(totals),
+                "low": float(np.percentile(totals, 25)),
+                "high": float(np.percentile(totals, 75)),
+                "low_p25": None,
+                "high_p75": None,
+                "multiplier": median / overall if overall > 0 else None,
+                "fitted_at": fitted_at,
+            }
+        )
+
+    return fitted
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fit the resale price lookup from saved vision results.")
+    parser.add_argument("--dry-run", action="store_true", help="print the fitted table without saving it")
+    args = parser.parse_args(argv)
+
+    init_db()
+    rows = load_vision_training_rows()
+    fitted = fit(rows)
+
+    for r in fitted:
+        if r["kind"] == "category":
+            print(f"category  {r['key']:<14} n={r['samples']:<5} ${r['low']:>8,.0f} – ${r['high']:>8,.0f}")
+        else:
+            mult = f"x{r['multiplier']:.2f}" if r["multiplier"] else "--"
+            print(f"unit_size {r['key']:<14} n={r['samples']:<5} {mult}")
+
+    if args.dry_run:
+        print(f"\nFitted {len(fitted)} rows from {len(rows)} analyses (not saved).")
+        return
+
+    save_price_lookup(fitted)
+    print(f"\nSaved {len(fitted)} rows from {len(rows)} analyses to price_lookup.")
+
+
+if __name__ == "__main__":
+    main()
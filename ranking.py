@@ -0,0 +1,264 @@
+
+"""
+Top-K "best deals" ranking.
+
+    python ranking.py                       # top 10 archived auctions by score
+    python ranking.py --metric margin -k 25
+    python ranking.py --near 44647 --miles 40    # only auctions around a ZIP or "lat,lng"
+
+TopK keeps only the K best auctions in a min-heap while remembering every
+auction's latest value, so adding or updating an auction is O(log K) and
+the full list is never sorted. The CLI ranks the active auctions archived
+in auctions.db without starting the UI.
+"""
+
+import argparse
+import heapq
+import math
+from datetime import datetime, timezone
+
+import numpy as np
+
+METRICS = {
+    "score": "Profit score",
+    "margin": "Predicted margin",
+    "value_per_dollar": "Value per bid $",
+}
+
+
+class TopK:
+    """
+    Bounded top-K by value with incremental updates.
+
+    The heap may hold stale entries (older values of an auction); an entry
+    is live only while it matches `top[aid]`. When a member's value drops or
+    it is removed, the next best auction could be anywhere, so the top set
+    is rebuilt lazily from `values` with heapq.nlargest on the next read.
+    """
+
+    def __init__(self, k=10):
+        self.k = k
+        self.values = {}
+        self.payloads = {}
+        self.top = {}
+        self.heap = []
+        self.dirty = False
+
+    def __len__(self):
+        return len(self.values)
+
+    def clear(self):
+        self.values.clear()
+        self.payloads.clear()
+        self.top.clear()
+        self.heap.clear()
+        self.dirty = False
+
+    def _min(self):
+        while self.heap:
+            value, aid = self.heap[0]
+            if self.top.get(aid) == value:
+                return value, aid
+            heapq.heappop(self.heap)
+        return None
+
+    def update(self, aid, value, payload=None):
+        """Adds or updates one auction. NaN/None values are not ranked."""
+        if payload is not None:
+            self.payloads[aid] = payload
+        if value is None or (isinstance(value, float) and math.isnan(value)):
+            self.remove(aid)
+            return
+
+        old = self.values.get(aid)
+        if old == value:
+            return
+        self.values[aid] = value
+
+        if self.dirty:
+            return
+
+        if aid in self.top:
+            if value >= self.top[aid]:
+                self.top[aid] = value
+                heapq.heappush(self.heap, (value, aid))
+            else:
+                self.dirty = True
+            return
+
+        if len(self.top) < self.k:
+            self.top[aid] = value
+            heapq.heappush(self.heap, (value, aid))
+            return
+
+        lowest = self._min()
+        if lowest and value > lowest[0]:
+            heapq.heappop(self.heap)
+            del self.top[lowest[1]]
+            self.top[aid] = value
+            heapq.heappush(self.heap, (value, aid))
+
+    def update_many(self, aids, values, payloads=None):
+        if payloads is None:
+            payloads = [None] * len(aids)
+        for aid, value, payload in zip(aids, values, payloads):
+            self.update(aid, value, payload)
+
+    def remove(self, aid):
+        self.payloads.pop(aid, None)
+        if self.values.pop(aid, None) is None:
+            return
+        if aid in self.top:
+            del self.top[aid]
+            self.dirty = True
+
+    def retain(self, aids):
+        """Drops every auction not in `aids` (e.g. after a new search)."""
+        keep = set(aids)
+        for aid in [a for a in self.values if a not in keep]:
+            self.remove(aid)
+
+    def _rebuild(self):
+        best = heapq.nlargest(self.k, self.values.items(), key=lambda kv: kv[1])
+        self.top = dict(best)
+        self.heap = [(value, aid) for aid, value in best]
+        heapq.heapify(self.heap)
+        self.dirty = False
+
+    def items(self):
+        """[(aid, value, payload)] best first."""
+        if self.dirty:
+            self._rebuild()
+        ranked = sorted(self.top.items(), key=lambda kv: kv[1], reverse=True)
+        return [(aid, value, self.payloads.get(aid)) for aid, value in ranked]
+
+
+def metric_values(metric, scores, bids, predicted, value_low, value_high):
+    """
+    Vectorized metric over columnar inputs.
+
+    score            - the profit score
+    margin           - midpoint of the value range minus the predicted final
+                       price (the current bid when there is no prediction)
+    value_per_dollar - midpoint of the value range per current bid dollar
+    """
+    bids = np.asarray(bids, dtype=np.float64)
+    mid = (np.asarray(value_low, dtype=np.float64) + np.asarray(value_high, dtype=np.float64)) / 2
+
+    if metric == "score":
+        return np.asarray(scores, dtype=np.float64)
+    if metric == "margin":
+        predicted = np.asarray(predicted, dtype=np.float64)
+        final = np.where(np.isnan(predicted), bids, predicted)
+        return mid - final
+    if metric == "value_per_dollar":
+        return mid / np.maximum(bids, 1.0)
+    raise ValueError(f"Unknown metric: {metric}")
+
+
+def value_range(vision_result, fallback):
+    """
+    (low, high) resale value of a unit: manual totals when the user edited
+    the vision result, the AI totals otherwise, and `fallback` (the
+    appraisal-based estimate) when the unit was never analysed.
+    """
+    if not vision_result:
+        return fallback
+    if vision_result.get("manual_total_low") is not None:
+        return vision_result["manual_total_low"], vision_result["manual_total_high"]
+    return vision_result.get("total_low", 0), vision_result.get("total_high", 0)
+
+
+def format_metric(metric, value):
+    if metric == "score":
+        return f"{value:.0f}/100"
+    if metric == "margin":
+        return f"${value:,.0f}"
+    return f"{value:.1f}x"
+
+
+def resolve_point(text):
+    """(lat, lng) of a "lat,lng" pair or a ZIP code, or None when it cannot be resolved."""
+    parts = text.split(",")
+    if len(parts) == 2:
+        try:
+            return float(parts[0]), float(parts[1])
+        except ValueError:
+            return None
+
+    from db import load_zip_coords
+    from geocode import load_zip_centroids
+
+    coords = load_zip_coords().get(text)
+    return tuple(coords) if coords else load_zip_centroids().lookup(text)
+
+
+def main(argv=None):
+    from db import (
+        init_db,
+        load_active_auctions,
+        bid_velocity_many,
+        load_vision_result_many,
+    )
+    from predictor import FinalPricePredictor, unit_area
+    from resale import estimate
+    from scoring import auction_columns, profit_scores
+    from vision import tag_many
+
+    parser = argparse.ArgumentParser(description="Rank archived active auctions without the UI.")
+    parser.add_argument("--metric", choices=sorted(METRICS), default="score")
+    parser.add_argument("-k", type=int, default=10)
+    parser.add_argument("--near", help='ZIP code or "lat,lng" to rank around')
+    parser.add_argument("--miles", type=float, default=25.0, help="radius for --near (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    init_db()
+    near = None
+    if args.near:
+        point = resolve_point(args.near)
+        if point is None:
+            parser.error(f"cannot locate {args.near!r}")
+        near = (*point, args.miles)
+    auctions = load_active_auctions(near=near)
+    if not auctions:
+        if near:
+            print(f"No active auctions within {args.miles:g} mi of {args.near}.")
+        else:
+            print("No active auctions archived yet.")
+        return
+
+    now = datetime.now(timezone.utc)
+    aids = [a["auction_id"] for a in auctions]
+    bids, views, bid_counts = auction_columns(auctions)
+    velocity_map = bid_velocity_many(aids)
+    scores = profit_scores(bids, views, bid_counts, [velocity_map[aid] for aid in aids])
+
+    tags = tag_many(a["unit_contents"] for a in auctions)
+    hours_left = [
+        max((datetime.fromisoformat(a["expire_at"]) - now).total_seconds() / 3600, 0)
+        for a in auctions
+    ]
+    predicted = FinalPricePredictor().predict(
+        bids, bid_counts, views, hours_left, [unit_area(a["unit_size"]) for a in auctions], tags
+    )
+
+    vision = load_vision_result_many(aids)
+    lows, highs = zip(*(
+        value_range(vision.get(a["auction_id"]), estimate(t, a["unit_size"]))
+        for a, t in zip(auctions, tags)
+    ))
+
+    top = TopK(args.k)
+    top.update_many(aids, metric_values(args.metric, scores, bids, predicted, lows, highs).tolist(), auctions)
+
+    print(f"Top {args.k} of {len(auctions)} active auctions by {METRICS[args.metric].lower()}:")
+    for rank, (aid, value, a) in enumerate(top.items(), start=1):
+        print(
+            f"{rank:>3}. {format_metric(args.metric, value):>10}  {aid:<10} "
+            f"${a['current_bid']['amount']:>7,.0f}  {a['unit_size']:<8} "
+            f"{a['city']}, {a['state']} — {a['facility_name']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
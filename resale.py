@@ -1,18 +1,82 @@
+import re
+
+from db import load_price_lookup
 
 CATEGORY_VALUES = {
     "clothing": (100, 300),
     "tools": (200, 800),
     "electronics": (150, 600),
     "furniture": (250, 1000),
+    "shoes": (40, 200),
+    "bedding": (40, 250),
+    "appliances": (150, 700),
+    "kitchen": (50, 250),
+    "sports": (100, 500),
+    "music": (150, 900),
+    "toys": (40, 200),
+    "baby": (60, 300),
+    "books": (20, 120),
+    "decor": (50, 300),
+    "jewelry": (100, 1200),
+    "collectibles": (100, 1000),
+    "auto": (100, 600),
+    "outdoor": (100, 600),
+    "office": (50, 300),
+    "household": (40, 200),
     "misc": (50, 200),
 }
 
+# Fitted rows backed by fewer appraisals than this are ignored in favour of
+# the static table above.
+MIN_SAMPLES = 3
+
+_SIZE_RE = re.compile(r"(\d+(?:\.\d+)?)\s*['\"]?\s*[x×*]\s*(\d+(?:\.\d+)?)", re.IGNORECASE)
+
+_lookup = None
+
+
+def unit_size_class(unit_size):
+    """
+    Normalizes listings like "10 x 10", "10'x15'" or "15X10 Unit" to
+    "10x10" / "10x15" (smaller side first). Unparseable sizes map to "".
+    """
+    m = _SIZE_RE.search(unit_size or "")
+    if not m:
+        return ""
+    a, b = sorted(float(v) for v in m.groups())
+    return f"{a:g}x{b:g}"
+
+
+def price_lookup():
+    global _lookup
+    if _lookup is None:
+        _lookup = load_price_lookup()
+    return _lookup
+
+
+def reload_price_lookup():
+    """Drops the in-memory copy so the next estimate re-reads the table."""
+    global _lookup
+    _lookup = None
+
+
 def estimate(tags, unit_size):
+    lookup = price_lookup()
+
     lo = hi = 0
     for t in tags:
-        a, b = CATEGORY_VALUES.get(t, (50, 200))
+        fitted = lookup.get(("category", t))
+        if fitted and fitted["samples"] >= MIN_SAMPLES:
+            a, b = fitted["low"], fitted["high"]
+        else:
+            a, b = CATEGORY_VALUES.get(t, (50, 200))
         lo += a
         hi += b
-    if "10" in unit_size:
+
+    size = lookup.get(("unit_size", unit_size_class(unit_size)))
+    if size and size["samples"] >= MIN_SAMPLES and size["multiplier"]:
+        lo = int(lo * size["multiplier"])
+        hi = int(hi * size["multiplier"])
+    elif "10" in (unit_size or ""):
         hi = int(hi * 1.2)
-    return lo, hi
+    return int(lo), int(hi)
@@ -1,8 +1,199 @@
+import math
 
-def profit_score(a, velocity):
+import numpy as np
+
+DEFAULT_PROFILE = "Balanced"
+
+# Weights used by profit_score. A profile is any subset of these keys;
+# missing keys fall back to the balanced defaults.
+DEFAULT_WEIGHTS = {
+    "bid_weight": 0.4,        # points lost per dollar of current bid
+    "velocity_weight": 5,     # points lost per $/hr of bid velocity
+    "views_pivot": 100,       # views above this cost points, below it earn them
+    "views_weight": 0.2,
+    "bids_pivot": 20,         # same for the number of bids
+    "bids_weight": 1.5,
+}
+
+SCORING_PROFILES = {
+    DEFAULT_PROFILE: dict(DEFAULT_WEIGHTS),
+    "Bargain hunter": {
+        "bid_weight": 0.8,
+        "velocity_weight": 3,
+    },
+    "Low competition": {
+        "velocity_weight": 8,
+        "views_pivot": 60,
+        "views_weight": 0.35,
+        "bids_pivot": 10,
+        "bids_weight": 2.5,
+    },
+}
+
+
+def profile_weights(weights=None):
+    """
+    A complete weight set from a partial one. Values that are not finite
+    numbers (as a hand-edited preferences file may hold) keep the default.
+    """
+    merged = dict(DEFAULT_WEIGHTS)
+    for key, value in (weights or {}).items():
+        if key not in DEFAULT_WEIGHTS:
+            continue
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            continue
+        if math.isfinite(value):
+            merged[key] = value
+    return merged
+
+
+def load_profiles(preferences):
+    """
+    Built-in profiles plus any defined under preferences["scoring_profiles"]
+    ({name: {weight: value}}), each filled out to a complete weight set.
+    """
+    profiles = {name: profile_weights(w) for name, w in SCORING_PROFILES.items()}
+    custom = (preferences or {}).get("scoring_profiles") or {}
+    if isinstance(custom, dict):
+        for name, weights in custom.items():
+            if isinstance(weights, dict):
+                profiles[str(name)] = profile_weights(weights)
+    return profiles
+
+
+def active_profile(preferences):
+    """Returns (name, weights) for preferences["scoring_profile"]."""
+    profiles = load_profiles(preferences)
+    name = (preferences or {}).get("scoring_profile") or DEFAULT_PROFILE
+    if name not in profiles:
+        name = DEFAULT_PROFILE
+    return name, profiles[name]
+
+
+def profit_score(a, velocity, weights=None):
+    w = DEFAULT_WEIGHTS if weights is None else profile_weights(weights)
     score = 100
-    score -= float(a["current_bid"]["amount"]) * 0.4
-    score -= velocity * 5
-    score += (100 - int(a["total_views"])) * 0.2
-    score += (20 - int(a["total_bids"])) * 1.5
+    score -= float(a["current_bid"]["amount"]) * w["bid_weight"]
+    score -= velocity * w["velocity_weight"]
+    score += (w["views_pivot"] - int(a["total_views"])) * w["views_weight"]
+    score += (w["bids_pivot"] - int(a["total_bids"])) * w["bids_weight"]
     return max(0, min(100, int(score)))
+
+
+def auction_columns(auctions):
+    """
+    Pull the inputs profit_score needs out of a list of auctions once, as
+    columnar arrays: (current_bid, total_views, total_bids).
+    """
+    n = len(auctions)
+    bids = np.fromiter(
+        (float(a["current_bid"]["amount"]) for a in auctions), dtype=np.float64, count=n
+    )
+    views = np.fromiter(
+        (int(a["total_views"]) for a in auctions), dtype=np.int64, count=n
+    )
+    bid_counts = np.fromiter(
+        (int(a["total_bids"]) for a in auctions), dtype=np.int64, count=n
+    )
+    return bids, views, bid_counts
+
+
+def profit_scores(bids, views, bid_counts, velocities, weights=None):
+    """
+    Vectorized profit_score over columnar inputs. Performs the same float
+    operations in the same order as the scalar version, so results match
+    it exactly; profit_score stays the reference implementation.
+    """
+    w = DEFAULT_WEIGHTS if weights is None else profile_weights(weights)
+    bids = np.asarray(bids, dtype=np.float64)
+    velocities = np.asarray(velocities, dtype=np.float64)
+    views = np.asarray(views, dtype=np.int64)
+    bid_counts = np.asarray(bid_counts, dtype=np.int64)
+
+    score = np.full(bids.shape, 100.0)
+    score -= bids * w["bid_weight"]
+    score -= velocities * w["velocity_weight"]
+    score += (w["views_pivot"] - views) * w["views_weight"]
+    score += (w["bids_pivot"] - bid_counts) * w["bids_weight"]
+    return np.clip(np.trunc(score), 0, 100).astype(np.int64)
+
+
+class ScoreCache:
+    """
+    Memoizes scores by (profile, auction_id, bid, views, bids, velocity
+    bucket). Only rows whose inputs or weights changed since they were last
+    scored are recomputed; everything else is a dict hit.
+
+    Velocities are quantized to `velocity_step` (the 0.01/hr the list
+    displays) and misses are scored with the quantized value, so equal keys
+    always map to equal scores.
+    """
+
+    def __init__(self, velocity_step=0.01, max_entries=200_000):
+        self.velocity_step = velocity_step
+        self.max_entries = max_entries
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        self.entries.clear()
+
+    def scores(self, auction_ids, bids, views, bid_counts, velocities, weights=None):
+        w = profile_weights(weights)
+        profile = tuple(sorted(w.items()))
+
+        bids = np.asarray(bids, dtype=np.float64)
+        views = np.asarray(views, dtype=np.int64)
+        bid_counts = np.asarray(bid_counts, dtype=np.int64)
+        buckets = np.rint(
+            np.asarray(velocities, dtype=np.float64) / self.velocity_step
+        ).astype(np.int64)
+
+        keys = list(zip(
+            [profile] * len(bids),
+            auction_ids,
+            bids.tolist(),
+            views.tolist(),
+            bid_counts.tolist(),
+            buckets.tolist(),
+        ))
+
+        out = np.empty(len(keys), dtype=np.int64)
+        missing = []
+        for i, key in enumerate(keys):
+            score = self.entries.get(key)
+            if score is None:
+                missing.append(i)
+            else:
+                out[i] = score
+
+        self.hits += len(keys) - len(missing)
+        self.misses += len(missing)
+
+        if missing:
+            idx = np.asarray(missing, dtype=np.intp)
+            fresh = profit_scores(
+                bids[idx],
+                views[idx],
+                bid_counts[idx],
+                buckets[idx] * self.velocity_step,
+                w,
+            )
+            out[idx] = fresh
+
+            if len(self.entries) + len(missing) > self.max_entries:
+                self.entries.clear()
+            for i, score in zip(missing, fresh.tolist()):
+                self.entries[keys[i]] = score
+
+        return out
+
+    def score(self, auction, velocity, weights=None):
+        """One auction's score exactly as `scores` gives it to the list."""
+        bids, views, bid_counts = auction_columns([auction])
+        return int(self.scores(
+            [auction.get("auction_id")], bids, views, bid_counts, [velocity], weights
+        )[0])
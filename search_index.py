@@ -0,0 +1,86 @@
+
+import re
+from bisect import bisect_left
+
+import numpy as np
+
+from resale import unit_size_class
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text):
+    return TOKEN_RE.findall((text or "").lower())
+
+
+def auction_document(a, tags=()):
+    """Searchable tokens of one auction: location, facility, size, contents, tags."""
+    tokens = set()
+    for field in ("city", "state", "facility_name", "unit_size", "unit_contents"):
+        tokens.update(tokenize(a.get(field)))
+    size_class = unit_size_class(a.get("unit_size") or "")
+    if size_class:
+        tokens.add(size_class)
+    for tag in tags:
+        tokens.update(tokenize(tag))
+    return tokens
+
+
+class SearchIndex:
+    """
+    Token inverted index over the auction list with prefix matching.
+
+    Postings are stored flat in token order, so every token sharing a
+    prefix owns one contiguous slice of the postings array: a prefix
+    lookup is two bisects on the sorted vocabulary and a single
+    vectorized scatter into a row mask.
+    """
+
+    def __init__(self, documents):
+        self.rows = len(documents)
+        pairs = sorted(
+            (token, row)
+            for row, tokens in enumerate(documents)
+            for token in set(tokens)
+        )
+
+        self.tokens = []
+        offsets = []
+        for i, (token, _) in enumerate(pairs):
+            if not self.tokens or self.tokens[-1] != token:
+                self.tokens.append(token)
+                offsets.append(i)
+        offsets.append(len(pairs))
+
+        self.offsets = np.asarray(offsets, dtype=np.intp)
+        self.postings = np.fromiter((row for _, row in pairs), dtype=np.intp, count=len(pairs))
+        self._memo = {}
+
+    @classmethod
+    def from_auctions(cls, auctions, tag_lists):
+        return cls([auction_document(a, tags) for a, tags in zip(auctions, tag_lists)])
+
+    def prefix_mask(self, prefix):
+        mask = self._memo.get(prefix)
+        if mask is None:
+            lo = bisect_left(self.tokens, prefix)
+            hi = bisect_left(self.tokens, prefix + "\U0010ffff", lo)
+            mask = np.zeros(self.rows, dtype=bool)
+            mask[self.postings[self.offsets[lo]:self.offsets[hi]]] = True
+            if len(self._memo) > 256:
+                self._memo.clear()
+            self._memo[prefix] = mask
+        return mask
+
+    def query(self, text):
+        """
+        Row mask of auctions having, for every query word, a token that
+        starts with it. None for an empty query (no filtering).
+        """
+        terms = tokenize(text)
+        if not terms:
+            return None
+        mask = self.prefix_mask(terms[0])
+        for term in terms[1:]:
+            mask = mask & self.prefix_mask(term)
+        return mask
@@ -0,0 +1,170 @@
+
+import math
+
+import numpy as np
+
+from geo import EARTH_RADIUS_MILES, haversine_miles
+
+BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+# Stored with every archived auction: cells of roughly 0.75 x 0.4 miles
+GEOHASH_PRECISION = 6
+# In-memory buckets: cells of roughly 3 x 3 miles
+INDEX_PRECISION = 5
+# Most cells a database radius query spells out before it coarsens
+MAX_QUERY_CELLS = 32
+HALF_EARTH_MILES = math.pi * EARTH_RADIUS_MILES
+# Listings this close to a facility are shown with it as neighbours
+NEARBY_MILES = 1.0
+
+
+def grid_bits(precision):
+    """(latitude bits, longitude bits) of a geohash of `precision` characters."""
+    bits = 5 * precision
+    return bits // 2, (bits + 1) // 2
+
+
+def grid_cells(lat, lng, precision):
+    """Row and column of each point in the geohash grid of `precision`."""
+    lat_bits, lng_bits = grid_bits(precision)
+    rows = np.floor((np.asarray(lat, dtype=np.float64) + 90.0) / 180.0 * 2 ** lat_bits)
+    cols = np.floor((np.asarray(lng, dtype=np.float64) + 180.0) / 360.0 * 2 ** lng_bits)
+    rows = np.clip(rows, 0, 2 ** lat_bits - 1).astype(np.int64)
+    cols = np.clip(cols, 0, 2 ** lng_bits - 1).astype(np.int64)
+    return rows, cols
+
+
+def cell_geohash(row, col, precision):
+    """Geohash string of one grid cell; longitude and latitude bits interleave from the top."""
+    lat_bits, lng_bits = grid_bits(precision)
+    code = 0
+    for i in range(5 * precision):
+        if i % 2 == 0:
+            lng_bits -= 1
+            code = (code << 1) | ((col >> lng_bits) & 1)
+        else:
+            lat_bits -= 1
+            code = (code << 1) | ((row >> lat_bits) & 1)
+    return "".join(BASE32[(code >> shift) & 31] for shift in range(5 * (precision - 1), -1, -5))
+
+
+def geohash(lat, lng, precision=GEOHASH_PRECISION):
+    """Geohash of a point, or None without valid coordinates."""
+    try:
+        lat, lng = float(lat), float(lng)
+    except (TypeError, ValueError):
+        return None
+    if not (abs(lat) <= 90 and abs(lng) <= 180):
+        return None
+    rows, cols = grid_cells(lat, lng, precision)
+    return cell_geohash(int(rows), int(cols), precision)
+
+
+def cover(lat, lng, miles, precision):
+    """
+    Grid cells that can hold a point within `miles` of (lat, lng), as
+    (row, first column, last column) runs. The runs span the exact
+    bounding box of the circle, split where it crosses the antimeridian.
+    """
+    _, lng_bits = grid_bits(precision)
+    n_cols = 2 ** lng_bits
+    theta = min(miles / EARTH_RADIUS_MILES, math.pi)
+    south = max(lat - math.degrees(theta), -90.0)
+    north = min(lat + math.degrees(theta), 90.0)
+    ratio = math.sin(theta) / max(math.cos(math.radians(lat)), 1e-12)
+    if north >= 90.0 or south <= -90.0 or ratio >= 1.0:
+        runs = [(0, n_cols - 1)]
+    else:
+        half = math.degrees(math.asin(ratio))
+        first = math.floor((lng - half + 180.0) / 360.0 * n_cols)
+        last = math.floor((lng + half + 180.0) / 360.0 * n_cols)
+        if last - first + 1 >= n_cols:
+            runs = [(0, n_cols - 1)]
+        elif first < 0:
+            runs = [(first + n_cols, n_cols - 1), (0, last)]
+        elif last >= n_cols:
+            runs = [(first, n_cols - 1), (0, last - n_cols)]
+        else:
+            runs = [(first, last)]
+
+    (row_lo, row_hi), _ = grid_cells([south, north], [0.0, 0.0], precision)
+    return [(row, c0, c1) for row in range(int(row_lo), int(row_hi) + 1) for c0, c1 in runs]
+
+
+def geohash_ranges(lat, lng, miles, max_cells=MAX_QUERY_CELLS):
+    """
+    Geohash prefixes whose cells cover the circle, at the finest
+    precision that needs no more than `max_cells` of them. A column
+    matches a prefix p when p <= geohash < p + '~'.
+    """
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        runs = cover(lat, lng, miles, precision)
+        if sum(c1 - c0 + 1 for _, c0, c1 in runs) <= max_cells or precision == 1:
+            break
+    return sorted({
+        cell_geohash(row, col, precision)
+        for row, c0, c1 in runs
+        for col in range(c0, c1 + 1)
+    })
+
+
+class FacilityIndex:
+    """
+    Facility markers bucketed by geohash cell for radius and nearest
+    queries.
+
+    Points are sorted by a row-major cell key, so the cells of one grid
+    row that a circle touches are one contiguous slice found by binary
+    search; only points in those slices get an exact haversine distance.
+    Queries return positions into the arrays the index was built from,
+    nearest first. NaN coordinates are left out.
+    """
+
+    def __init__(self, lat, lng, precision=INDEX_PRECISION):
+        lat = np.asarray(lat, dtype=np.float64)
+        lng = np.asarray(lng, dtype=np.float64)
+        self.precision = precision
+        self.n_cols = 2 ** grid_bits(precision)[1]
+        positions = np.flatnonzero(np.isfinite(lat) & np.isfinite(lng))
+        rows, cols = grid_cells(lat[positions], lng[positions], precision)
+        keys = rows * self.n_cols + cols
+        order = np.argsort(keys, kind="stable")
+        self.keys = keys[order]
+        self.positions = positions[order]
+        self.lat = lat[self.positions]
+        self.lng = lng[self.positions]
+        # Height of one cell; the first ring a nearest query searches
+        self.cell_miles = 180.0 / 2 ** grid_bits(precision)[0] * math.pi / 180.0 * EARTH_RADIUS_MILES
+
+    def __len__(self):
+        return len(self.positions)
+
+    def within(self, lat, lng, miles):
+        """Positions and distances of every point within `miles`, nearest first."""
+        if not len(self.keys) or not (math.isfinite(lat) and math.isfinite(lng)) or miles < 0:
+            return np.zeros(0, dtype=np.intp), np.zeros(0)
+        runs = np.array(cover(lat, lng, miles, self.precision), dtype=np.int64).reshape(-1, 3)
+        starts = np.searchsorted(self.keys, runs[:, 0] * self.n_cols + runs[:, 1], side="left")
+        ends = np.searchsorted(self.keys, runs[:, 0] * self.n_cols + runs[:, 2], side="right")
+        slices = [np.arange(s, e) for s, e in zip(starts, ends) if e > s]
+        if not slices:
+            return np.zeros(0, dtype=np.intp), np.zeros(0)
+        candidates = np.concatenate(slices)
+        distances = haversine_miles(lat, lng, self.lat[candidates], self.lng[candidates])
+        keep = distances <= miles
+        candidates, distances = candidates[keep], distances[keep]
+        order = np.argsort(distances, kind="stable")
+        return self.positions[candidates[order]], distances[order]
+
+    def nearest(self, lat, lng, k, max_miles=math.inf):
+        """
+        Positions and distances of the `k` nearest points within
+        `max_miles`. The search radius doubles from one cell until it
+        holds k points; anything outside a radius is farther than
+        everything inside it, so those k are the exact nearest.
+        """
+        miles = min(self.cell_miles, max_miles)
+        while True:
+            positions, distances = self.within(lat, lng, miles)
+            if len(positions) >= k or miles >= min(max_miles, HALF_EARTH_MILES):
+                return positions[:k], distances[:k]
+            miles = min(miles * 2, max_miles, HALF_EARTH_MILES)
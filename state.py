@@ -19,6 +19,9 @@ class AppState:
             "theme": "Dark",
             "lock_during_analysis": True,
             "show_analysis_banner": True,
+            "scoring_profile": "Balanced",
+            # name -> {weight: value}, merged over the built-in profiles
+            "scoring_profiles": {},
         }
         self.load()
 
@@ -34,6 +37,14 @@ class AppState:
             # fall back to in-memory defaults on error
             pass
 
+    def toggle_watch(self, aid):
+        """Adds or removes an auction from the watchlist; returns True when now watched."""
+        if aid in self.watchlist:
+            self.watchlist.discard(aid)
+            return False
+        self.watchlist.add(aid)
+        return True
+
     def save(self):
         payload = {"preferences": self.preferences}
         try:
@@ -0,0 +1,151 @@
+
+# Keyword taxonomy for vision.tag_from_text.
+#
+# Category -> terms. Terms are matched case-insensitively on word
+# boundaries, with an optional plural "s"/"es"; irregular plurals are
+# listed explicitly. Multi-word terms match across any run of spaces or
+# hyphens, and win over their shorter prefixes ("table saw" is a tool, not
+# furniture). Adding a category here makes it a tag everywhere.
+#
+# Every tag adds its category's value range to the resale estimate, so
+# terms name contents, not packaging: "boxes", "totes" or "bags" say
+# nothing about what is inside and are left out, and ambiguous words
+# ("ring", "gold", "watch", "art", "fan", "bat", "china") only count in
+# qualified phrases.
+
+TAXONOMY = {
+    "clothing": (
+        "shirt", "t-shirt", "tee", "blouse", "dress", "skirt", "jacket",
+        "coat", "clothes", "clothing", "apparel", "jeans", "pants",
+        "trousers", "shorts", "sweater", "hoodie", "sweatshirt", "suit",
+        "uniform", "vest", "scarf", "gloves", "baseball cap", "ball cap",
+        "winter hat", "lingerie",
+        "pajamas", "leather jacket", "winter coat", "garment", "wardrobe",
+    ),
+    "shoes": (
+        "shoe", "sneaker", "boot", "sandal", "heels", "loafer", "slipper",
+        "cleats", "footwear", "work boots", "running shoes",
+    ),
+    "tools": (
+        "tool", "toolbox", "tool box", "tool chest", "drill", "saw",
+        "wrench", "hammer", "screwdriver", "pliers", "socket set",
+        "ratchet", "circular saw", "table saw", "miter saw", "chainsaw",
+        "jigsaw", "sander", "grinder", "nail gun", "air compressor",
+        "compressor", "welder", "generator", "pressure washer",
+        "impact driver", "router", "ladder", "workbench", "vise", "clamp",
+        "tape measure", "dewalt", "milwaukee", "makita",
+        "craftsman", "ryobi", "snap-on", "husky", "shop vac", "floor jack",
+        "jack stand", "creeper",
+    ),
+    "electronics": (
+        "tv", "television", "flat screen", "flatscreen", "laptop",
+        "computer", "desktop", "monitor", "phone", "cell phone",
+        "smartphone", "tablet", "ipad", "iphone", "electronics", "stereo",
+        "speaker", "subwoofer", "receiver", "amplifier", "sound bar",
+        "soundbar", "dvd", "dvd player", "blu-ray", "vcr", "printer",
+        "camera", "projector", "router", "modem", "headphones", "radio",
+        "xbox", "playstation", "ps4", "ps5", "nintendo", "wii",
+        "game console", "video games", "keyboard", "cables",
+    ),
+    "furniture": (
+        "couch", "sofa", "sectional", "loveseat", "recliner", "futon",
+        "table", "coffee table", "end table", "dining table", "chair",
+        "dining chairs", "office chair", "stool", "bench", "bed",
+        "bed frame", "headboard", "bunk bed", "crib", "dresser",
+        "nightstand", "chest of drawers", "armoire", "cabinet", "hutch",
+        "bookcase", "bookshelf", "shelf", "shelves", "shelving", "desk",
+        "entertainment center", "tv stand", "ottoman", "furniture",
+        "vanity", "buffet", "china cabinet", "patio furniture",
+    ),
+    "bedding": (
+        "mattress", "box spring", "boxspring", "bedding", "blanket",
+        "comforter", "quilt", "pillow", "sheets", "linens", "duvet",
+    ),
+    "appliances": (
+        "appliance", "refrigerator", "fridge", "mini fridge", "freezer",
+        "washer", "dryer", "washing machine", "dishwasher", "stove",
+        "oven", "microwave", "air conditioner", "ac unit",
+        "dehumidifier", "humidifier", "space heater", "heater", "vacuum",
+        "vacuum cleaner", "box fan", "ceiling fan", "floor fan",
+        "tower fan", "water heater",
+    ),
+    "kitchen": (
+        "kitchen", "pots", "pans", "cookware", "dishes", "plates",
+        "bowls", "cups", "mugs", "glasses", "silverware", "utensils",
+        "knives", "knife", "cutlery", "blender", "mixer", "toaster",
+        "coffee maker", "crock pot", "slow cooker", "air fryer",
+        "instant pot", "kitchenware", "small appliances", "cutting board",
+    ),
+    "sports": (
+        "bike", "bicycle", "treadmill", "elliptical", "exercise bike",
+        "weights", "dumbbell", "barbell", "weight bench", "golf",
+        "golf clubs", "golf bag", "fishing", "fishing rod", "fishing pole",
+        "tackle box", "skateboard", "scooter", "surfboard", "kayak",
+        "canoe", "ski", "snowboard", "basketball", "football", "baseball",
+        "baseball bat", "helmet", "hockey", "tennis", "racket", "camping", "tent",
+        "sleeping bag", "exercise equipment", "gym equipment", "gun safe",
+    ),
+    "music": (
+        "guitar", "bass guitar", "acoustic guitar", "electric guitar",
+        "amp", "drum", "drum set", "drums", "piano", "keyboard piano",
+        "violin", "cello", "trumpet", "saxophone", "flute", "clarinet",
+        "microphone", "mixer board", "records", "vinyl", "turntable",
+        "record player", "cd", "cds", "sheet music", "instrument",
+    ),
+    "toys": (
+        "toy", "toys", "lego", "legos", "doll", "dollhouse", "action figure",
+        "stuffed animal", "plush", "board game", "puzzle", "train set",
+        "hot wheels", "barbie", "nerf", "rc car", "ride-on",
+    ),
+    "baby": (
+        "stroller", "car seat", "high chair", "playpen", "pack n play",
+        "baby", "bassinet", "changing table", "baby gear",
+    ),
+    "books": (
+        "book", "books", "textbook", "novel", "magazine", "comic",
+        "comics", "encyclopedia", "binder", "paperback", "hardcover",
+    ),
+    "decor": (
+        "decor", "lamp", "floor lamp", "mirror", "rug", "area rug",
+        "curtain", "frame", "picture frame", "painting", "artwork",
+        "art print", "framed art", "framed print", "poster", "vase", "candle", "clock", "wall art",
+        "christmas decorations", "holiday decorations", "decorations",
+        "wreath", "artificial tree", "christmas tree", "figurine",
+    ),
+    "jewelry": (
+        "jewelry", "jewellery", "necklace", "diamond ring",
+        "engagement ring", "wedding ring", "bracelet", "earring",
+        "wrist watch", "wristwatch", "pocket watch", "rolex", "pendant",
+        "gold jewelry", "gold chain", "silver jewelry", "sterling silver",
+        "diamond", "jewelry box",
+    ),
+    "collectibles": (
+        "collectible", "collectibles", "antique", "antiques", "vintage",
+        "coin", "coins", "stamp", "stamps", "baseball cards",
+        "trading cards", "pokemon", "memorabilia", "sports memorabilia",
+        "fine china", "china set", "porcelain", "crystal", "glassware", "figurines",
+        "comic books", "die-cast", "model trains",
+    ),
+    "auto": (
+        "tire", "tires", "rim", "rims", "wheel", "wheels", "car parts",
+        "auto parts", "engine", "transmission", "motorcycle", "dirt bike",
+        "atv", "car battery", "truck bed", "hitch", "trailer",
+        "floor jack", "motor oil",
+    ),
+    "outdoor": (
+        "lawn mower", "mower", "riding mower", "weed eater", "trimmer",
+        "leaf blower", "blower", "snow blower", "snowblower", "grill",
+        "bbq", "smoker", "patio", "garden", "gardening", "hose",
+        "wheelbarrow", "shovel", "rake", "planter", "fire pit",
+        "outdoor furniture", "umbrella",
+    ),
+    "office": (
+        "office", "filing cabinet", "file cabinet", "files", "paperwork",
+        "office supplies", "shredder", "copier", "whiteboard",
+        "cubicle",
+    ),
+    "household": (
+        "household", "household items", "home goods", "housewares",
+        "cleaning supplies", "laundry basket", "trash can", "suitcase", "luggage", "personal items", "misc items",
+    ),
+}
@@ -0,0 +1,145 @@
+import os
+import random
+import time
+import unittest
+from unittest import mock
+
+import numpy as np
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import Qt
+from PySide6.QtTest import QAbstractItemModelTester
+from PySide6.QtWidgets import QApplication
+
+import auction_table
+from auction_table import COL_BID, COL_DIST, COL_SCORE, COL_TIME, AuctionTableModel
+
+
+def make_values(rng, n):
+    return {
+        "watched": np.array([rng.random() < 0.2 for _ in range(n)]),
+        "bid": np.array([float(rng.randint(1, 50)) for _ in range(n)]),
+        "predicted": np.array([np.nan if rng.random() < 0.3 else rng.uniform(1, 99) for _ in range(n)]),
+        "est_low": np.full(n, 10.0),
+        "est_high": np.full(n, 40.0),
+        "score": np.array([float(rng.randint(0, 100)) for _ in range(n)]),
+        "velocity": np.array([rng.uniform(0, 3) for _ in range(n)]),
+        "expire_at": np.array([time.time() + rng.uniform(-3600, 86400) for _ in range(n)]),
+        "distance": np.array([np.nan if rng.random() < 0.1 else rng.uniform(0, 80) for _ in range(n)]),
+    }
+
+
+class AuctionTableModelTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.rng = random.Random(4)
+        self.n = 60
+        self.model = AuctionTableModel()
+        # Aborts on any inconsistent row signal or index
+        self.tester = QAbstractItemModelTester(self.model, QAbstractItemModelTester.FailureReportingMode.Fatal)
+        self.model.set_auctions(
+            [{"auction_id": str(i)} for i in range(self.n)],
+            make_values(self.rng, self.n),
+            [f"City {i % 7}" for i in range(self.n)],
+            ["10x10"] * self.n,
+            [""] * self.n,
+            [[1.0, 2.0]] * self.n,
+        )
+
+        # Replays the row signals on a plain list; it must end up equal to the model
+        self.mirror = list(self.model.visible)
+        self.model.rowsRemoved.connect(lambda parent, first, last: self.mirror.__delitem__(slice(first, last + 1)))
+        self.model.rowsInserted.connect(
+            lambda parent, first, last: self.mirror.__setitem__(
+                slice(first, first), list(self.model.visible[first:last + 1])
+            )
+        )
+        self.model.modelReset.connect(lambda: setattr(self, "mirror", list(self.model.visible)))
+        self.model.layoutChanged.connect(lambda *args: setattr(self, "mirror", list(self.model.visible)))
+
+    def expected(self, mask, column=None, order=Qt.AscendingOrder):
+        slots = range(self.n)
+        if column is not None:
+            keys = self.model.sort_keys(column)
+            slots = sorted(slots, key=lambda i: keys[i])
+            if order == Qt.DescendingOrder:
+                slots = slots[::-1]
+        return [i for i in slots if mask[i]]
+
+    def shown(self):
+        return [self.model.slot_at(row) for row in range(self.model.rowCount())]
+
+    # A low run limit so a 60 row list reaches the reset fallback too
+    @mock.patch.object(auction_table, "MAX_SIGNAL_RUNS", 8)
+    def test_masks_and_sorts_match_brute_force(self):
+        sorts = [(None, None), (COL_BID, Qt.AscendingOrder), (COL_DIST, Qt.DescendingOrder), (COL_SCORE, Qt.DescendingOrder)]
+        resets = []
+        self.model.modelReset.connect(lambda: resets.append(True))
+        for step in range(24):
+            column, order = sorts[step % len(sorts)]
+            if column is not None:
+                self.model.sort(column, order)
+            # Sparse masks give few runs (row signals), dense random ones force a reset
+            density = self.rng.choice([0.02, 0.5, 0.97])
+            mask = np.array([self.rng.random() < density for _ in range(self.n)])
+            self.model.set_mask(mask)
+
+            self.assertEqual(self.shown(), self.expected(mask, self.model.sort_column, self.model.sort_order))
+            self.assertEqual(self.mirror, self.shown())
+            rows = self.model.row_positions()
+            for row, slot in enumerate(self.shown()):
+                self.assertEqual(rows[slot], row)
+            self.assertTrue(np.all(rows[~mask] == -1))
+        # Both the row-signal path and the reset fallback were exercised
+        self.assertTrue(resets)
+
+    def test_small_mask_change_emits_row_signals_not_reset(self):
+        resets = []
+        self.model.modelReset.connect(lambda: resets.append(True))
+        mask = np.ones(self.n, dtype=bool)
+        mask[[3, 4, 5, 40]] = False
+        self.model.set_mask(mask)
+        mask[4] = True
+        self.model.set_mask(mask)
+        self.assertEqual(resets, [])
+        self.assertEqual(self.mirror, self.expected(mask))
+
+    def test_update_values_signals_only_changed_rows(self):
+        self.model.sort(COL_BID, Qt.AscendingOrder)
+        mask = np.arange(self.n) % 3 != 0
+        self.model.set_mask(mask)
+        changes = []
+        self.model.dataChanged.connect(
+            lambda top, bottom, roles=(): changes.append((top.row(), bottom.row(), top.column(), bottom.column()))
+        )
+
+        score = self.model.values["score"].copy()
+        score[[1, 2, 31]] += 1
+        score[0] += 1  # hidden row
+        self.model.update_values(score=score)
+
+        signalled = {row for first, last, _, _ in changes for row in range(first, last + 1)}
+        rows = self.model.row_positions()
+        self.assertEqual(signalled, {int(rows[i]) for i in (1, 2, 31)})
+        self.assertTrue(all(c0 == c1 == COL_SCORE for _, _, c0, c1 in changes))
+
+        # NaN staying NaN is not a change
+        changes.clear()
+        self.model.update_values(distance=self.model.values["distance"].copy())
+        self.assertEqual(changes, [])
+
+    def test_update_of_sort_column_resorts(self):
+        self.model.sort(COL_TIME, Qt.AscendingOrder)
+        expire_at = self.model.values["expire_at"].copy()
+        expire_at[::2] += 50000
+        self.model.update_values(expire_at=expire_at)
+        self.assertEqual(self.shown(), self.expected(np.ones(self.n, dtype=bool), COL_TIME))
+        self.assertEqual(self.mirror, self.shown())
+
+
+if __name__ == "__main__":
+    unittest.main()
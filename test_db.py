@@ -0,0 +1,122 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+
+import db
+
+
+class BatchedQueryTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._original_path = db.DB_PATH
+        db.DB_PATH = os.path.join(self._tmp.name, "test.db")
+        db.init_db()
+
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        rows = []
+        for n, aid in enumerate(("a1", "a2", "a3")):
+            for i in range(8 + n):
+                ts = start + timedelta(minutes=15 * i)
+                rows.append((aid, 10.0 + i * (n + 1), ts.isoformat()))
+        conn = sqlite3.connect(db.DB_PATH)
+        conn.executemany("INSERT INTO bid_history (auction_id, bid, timestamp) VALUES (?,?,?)", rows)
+        conn.commit()
+        conn.close()
+
+        db.save_vision_result("a1", {"items": [{"name": "Couch"}], "total_low": 10, "total_high": 40})
+        db.save_vision_result(
+            "a2",
+            {"items": [], "total_low": 0, "total_high": 0},
+            manual_items=[{"name": "Drill", "low": 5, "high": 9}],
+            manual_totals={"low": 5, "high": 9},
+        )
+
+    def tearDown(self):
+        db.DB_PATH = self._original_path
+        self._tmp.cleanup()
+
+    def test_bid_velocity_many_matches_scalar(self):
+        aids = ["a1", "a2", "a3", "missing"]
+        batched = db.bid_velocity_many(aids)
+        for aid in aids:
+            self.assertAlmostEqual(batched[aid], db.bid_velocity(aid))
+
+    def test_get_recent_bids_many_matches_scalar(self):
+        aids = ["a1", "a2", "a3", "missing"]
+        batched = db.get_recent_bids_many(aids, limit=5)
+        for aid in aids:
+            self.assertEqual(batched[aid], db.get_recent_bids(aid, limit=5))
+
+    def test_get_recent_bids_returns_newest_oldest_first(self):
+        # a1 has 8 bids rising from 10 to 17
+        self.assertEqual(db.get_recent_bids("a1", limit=3), [15.0, 16.0, 17.0])
+        self.assertEqual(db.get_recent_bids_many(["a1"], limit=3)["a1"], [15.0, 16.0, 17.0])
+
+    def test_get_bid_history_is_complete_and_ordered(self):
+        history = db.get_bid_history("a3")
+        self.assertEqual(len(history), 10)
+        self.assertEqual([b for _, b in history], [10.0 + i * 3 for i in range(10)])
+        self.assertEqual(history, sorted(history))
+
+    def test_load_vision_result_many_matches_scalar(self):
+        batched = db.load_vision_result_many(["a1", "a2", "a3"])
+        self.assertEqual(set(batched), {"a1", "a2"})
+        for aid, res in batched.items():
+            self.assertEqual(res, db.load_vision_result(aid))
+
+    def test_archive_auctions_records_snapshots_and_details(self):
+        auction = {
+            "auction_id": "a9",
+            "current_bid": {"amount": "42.5"},
+            "total_bids": "3",
+            "total_views": 17,
+            "facility_name": "Acme Storage",
+            "city": "Canton",
+            "state": "OH",
+            "unit_size": "10x10",
+            "unit_contents": "couch",
+            "expire_date": {"utc": {"datetime": "2030-01-02 15:00:00"}},
+            "facility": {"marker": {"lat": "40.79", "lng": "-81.37"}},
+        }
+        db.archive_auctions([auction])
+        db.archive_auctions([dict(auction, current_bid={"amount": 50})])
+
+        conn = sqlite3.connect(db.DB_PATH)
+        history = conn.execute(
+            "SELECT bid, total_bids, total_views FROM bid_history WHERE auction_id='a9' ORDER BY timestamp"
+        ).fetchall()
+        details = conn.execute(
+            "SELECT facility_name, expire_at, lat, lng FROM auctions WHERE auction_id='a9'"
+        ).fetchall()
+        conn.close()
+
+        self.assertEqual(history, [(42.5, 3, 17), (50.0, 3, 17)])
+        self.assertEqual(details, [("Acme Storage", "2030-01-02T15:00:00+00:00", 40.79, -81.37)])
+
+    def test_save_bid_skips_unchanged_snapshots(self):
+        auction = {"auction_id": "a8", "current_bid": {"amount": "20"}, "total_bids": 2, "total_views": 9}
+        db.archive_auctions([auction])
+        db.save_bid(auction)
+        db.save_bid(dict(auction, total_views=10))
+        db.save_bid(dict(auction, total_views=10))
+        db.save_bid(dict(auction, current_bid={"amount": 25}, total_views=10))
+
+        conn = sqlite3.connect(db.DB_PATH)
+        history = conn.execute(
+            "SELECT bid, total_bids, total_views FROM bid_history WHERE auction_id='a8' ORDER BY timestamp"
+        ).fetchall()
+        conn.close()
+
+        self.assertEqual(history, [(20.0, 2, 9), (20.0, 2, 10), (25.0, 2, 10)])
+
+    def test_zip_coords_persist(self):
+        self.assertEqual(db.load_zip_coords(), {})
+        db.save_zip_coords("44647", 40.79, -81.37)
+        db.save_zip_coords("44647", 40.8, -81.4)
+        self.assertEqual(db.load_zip_coords(), {"44647": (40.8, -81.4)})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,9 +3,20 @@ import sys
 import types
 import unittest
 
+import numpy as np
+
+
+def _real_module_available(name):
+    # Other test modules in the same run need the real package when installed
+    try:
+        __import__(name)
+    except ImportError:
+        return False
+    return True
+
 
 def _install_dummy_requests():
-    if "requests" in sys.modules:
+    if "requests" in sys.modules or _real_module_available("requests"):
         return
     dummy_requests = types.SimpleNamespace(get=lambda *args, **kwargs: None)
     sys.modules["requests"] = dummy_requests
@@ -30,8 +41,25 @@ def _install_dummy_pgeocode():
     sys.modules["pgeocode"] = dummy_pgeocode
 
 
+def _install_dummy_web_engine():
+    # Real Qt was loaded by another test module; the web engine may still
+    # be unloadable (e.g. missing system libraries on a headless box)
+    for name, attributes in (
+        ("PySide6.QtWebEngineWidgets", ["QWebEngineView"]),
+        ("PySide6.QtWebEngineCore", ["QWebEngineUrlRequestJob", "QWebEngineUrlScheme", "QWebEngineUrlSchemeHandler"]),
+        ("PySide6.QtWebChannel", ["QWebChannel"]),
+    ):
+        if name in sys.modules or _real_module_available(name):
+            continue
+        mod = types.ModuleType(name)
+        for attr in attributes:
+            setattr(mod, attr, type(attr, (), {"__init__": lambda self, *args, **kwargs: None}))
+        sys.modules[name] = mod
+
+
 def _install_dummy_qt():
     if "PySide6" in sys.modules:
+        _install_dummy_web_engine()
         return
 
     class Dummy:
@@ -58,6 +86,7 @@ def _install_dummy_qt():
         ],
     )
     qt_core.Qt = types.SimpleNamespace(Horizontal=1)
+    qt_core.Slot = lambda *args, **kwargs: (lambda fn: fn)
 
     qt_widgets = _build_module(
         "PySide6.QtWidgets",
@@ -109,18 +138,31 @@ def _install_dummy_qt():
         ],
     )
 
+    qt_web_widgets = _build_module("PySide6.QtWebEngineWidgets", ["QWebEngineView"])
+    qt_web_core = _build_module(
+        "PySide6.QtWebEngineCore",
+        ["QWebEngineUrlRequestJob", "QWebEngineUrlScheme", "QWebEngineUrlSchemeHandler"],
+    )
+    qt_web_channel = _build_module("PySide6.QtWebChannel", ["QWebChannel"])
+
     qt_module.QtCore = qt_core
     qt_module.QtWidgets = qt_widgets
     qt_module.QtGui = qt_gui
+    qt_module.QtWebEngineWidgets = qt_web_widgets
+    qt_module.QtWebEngineCore = qt_web_core
+    qt_module.QtWebChannel = qt_web_channel
 
     sys.modules["PySide6"] = qt_module
     sys.modules["PySide6.QtCore"] = qt_core
     sys.modules["PySide6.QtWidgets"] = qt_widgets
     sys.modules["PySide6.QtGui"] = qt_gui
+    sys.modules["PySide6.QtWebEngineWidgets"] = qt_web_widgets
+    sys.modules["PySide6.QtWebEngineCore"] = qt_web_core
+    sys.modules["PySide6.QtWebChannel"] = qt_web_channel
 
 
 def _install_dummy_pil():
-    if "PIL" in sys.modules:
+    if "PIL" in sys.modules or _real_module_available("PIL.ImageDraw"):
         return
 
     pil_module = types.ModuleType("PIL")
@@ -146,6 +188,7 @@ _install_dummy_pgeocode()
 _install_dummy_qt()
 _install_dummy_pil()
 
+from geo import haversine_miles, marker_coords, nearest_origin
 from main import AuctionBrowser
 
 
@@ -176,5 +219,90 @@ class CalculateDistanceTests(unittest.TestCase):
         self.assertIsNone(distance)
 
 
+LOS_ANGELES = (34.0, -118.0)
+NEW_YORK = (40.71, -74.0)
+
+
+class NearestOriginTests(unittest.TestCase):
+    def test_two_origins_pick_the_closer_one(self):
+        lat = [34.05, 40.8, 39.0]
+        lng = [-118.25, -73.9, -75.0]
+
+        distances, which = nearest_origin([LOS_ANGELES, NEW_YORK], lat, lng)
+
+        self.assertEqual(which.tolist(), [0, 1, 1])
+        for i, origin in enumerate(which):
+            expected = haversine_miles(*(LOS_ANGELES, NEW_YORK)[origin], lat[i], lng[i])
+            self.assertAlmostEqual(distances[i], expected)
+
+    def test_points_without_coordinates_get_nan(self):
+        distances, which = nearest_origin([LOS_ANGELES], [np.nan, 34.05], [-118.0, -118.25])
+
+        self.assertTrue(math.isnan(distances[0]))
+        self.assertEqual(which.tolist(), [-1, 0])
+
+    def test_no_origins(self):
+        distances, which = nearest_origin([], [34.05, 40.8], [-118.25, -73.9])
+
+        self.assertTrue(np.isnan(distances).all())
+        self.assertEqual(which.tolist(), [-1, -1])
+
+    def test_matches_scalar_distance(self):
+        browser = DummyBrowser(coords=LOS_ANGELES)
+        markers = [{"lat": "34.05", "lng": "-118.25"}, {"lat": "invalid", "lng": "-118.25"}]
+
+        lat, lng = marker_coords([{"facility": {"marker": m}} for m in markers])
+        distances, _ = nearest_origin([LOS_ANGELES], lat, lng)
+
+        for marker, distance in zip(markers, distances):
+            scalar = AuctionBrowser.calculate_distance_miles(browser, marker)
+            if scalar is None:
+                self.assertTrue(math.isnan(distance))
+            else:
+                self.assertAlmostEqual(distance, scalar)
+
+    def test_refresh_distances_skips_unresolved_zips(self):
+        browser = types.SimpleNamespace(
+            search_zips=["90001", "00000", "10001"],
+            zip_coordinates={"90001": LOS_ANGELES, "10001": NEW_YORK}.get,
+            auction_lat=np.array([40.8, 34.05]),
+            auction_lng=np.array([-73.9, -118.25]),
+        )
+
+        AuctionBrowser.refresh_distances(browser)
+
+        self.assertEqual(browser.origin_zips, ["90001", "10001"])
+        self.assertEqual([browser.origin_zips[i] for i in browser.auction_origin], ["10001", "90001"])
+        self.assertTrue(np.isfinite(browser.auction_distances).all())
+
+
+class GeocoderRetryTests(unittest.TestCase):
+    def make_browser(self):
+        browser = types.SimpleNamespace(
+            zip_centroids=None, geocoder_loading=False, geocoder_failed_at=None, current=None, started=[]
+        )
+        browser.geocoder_failed = lambda: AuctionBrowser.geocoder_failed(browser)
+        browser.on_geocoder_ready = None
+        browser.run_worker = lambda fn, done: browser.started.append(fn)
+        return browser
+
+    def test_failed_load_is_not_retried_on_every_lookup(self):
+        browser = self.make_browser()
+        AuctionBrowser.ensure_geocoder(browser)
+        AuctionBrowser.on_geocoder_ready(browser, None)
+        for _ in range(3):
+            AuctionBrowser.ensure_geocoder(browser)
+
+        self.assertEqual(len(browser.started), 1)
+        self.assertTrue(browser.geocoder_failed())
+
+    def test_retries_after_backoff(self):
+        browser = self.make_browser()
+        browser.geocoder_failed_at = 0.0
+        AuctionBrowser.ensure_geocoder(browser)
+
+        self.assertEqual(len(browser.started), 1)
+
+
 if __name__ == "__main__":
     unittest.main()
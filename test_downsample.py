@@ -0,0 +1,36 @@
+import unittest
+
+import numpy as np
+
+from downsample import lttb, visible_slice
+
+
+class LttbTests(unittest.TestCase):
+    def test_short_series_is_untouched(self):
+        self.assertEqual(lttb(range(5), [1, 2, 3, 4, 5], 10).tolist(), [0, 1, 2, 3, 4])
+
+    def test_keeps_endpoints_and_threshold(self):
+        x = np.arange(10_000)
+        y = np.sin(x / 300.0)
+        keep = lttb(x, y, 140)
+        self.assertEqual(len(keep), 140)
+        self.assertEqual(keep[0], 0)
+        self.assertEqual(keep[-1], len(x) - 1)
+        self.assertTrue(np.all(np.diff(keep) > 0))
+
+    def test_preserves_spike(self):
+        y = np.zeros(5_000)
+        y[2_345] = 100.0
+        keep = lttb(np.arange(len(y)), y, 50)
+        self.assertIn(2_345, keep.tolist())
+
+
+class VisibleSliceTests(unittest.TestCase):
+    def test_includes_neighbours(self):
+        x = np.array([0.0, 10.0, 20.0, 30.0, 40.0])
+        self.assertEqual(visible_slice(x, 12, 28), (1, 4))
+        self.assertEqual(visible_slice(x, -5, 100), (0, 5))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+
+import numpy as np
+
+from facets import FacetIndex, NOT_WATCHED, WATCHED
+
+
+class FacetIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.auctions = [
+            {"auction_id": "1", "city": "Akron", "state": "OH", "facility_name": "Acme", "unit_size": "10x10"},
+            {"auction_id": "2", "city": "Akron", "state": "OH", "facility_name": "Public", "unit_size": "5x10"},
+            {"auction_id": "3", "city": "Canton", "state": "OH", "facility_name": "Acme", "unit_size": "10 x 10"},
+            {"auction_id": "4", "city": "Erie", "state": "PA", "facility_name": "Extra", "unit_size": "huge"},
+        ]
+        tags = [["tools"], ["furniture", "tools"], [], ["electronics"]]
+        self.index = FacetIndex(self.auctions, tags, watchlist={"3"})
+        self.everything = np.ones(4, dtype=bool)
+
+    def test_initial_counts(self):
+        counts = self.index.counts(self.everything)
+        self.assertEqual(counts["city"], {"Akron": 2, "Canton": 1, "Erie": 1})
+        self.assertEqual(counts["size"], {"10x10": 2, "5x10": 1, "other": 1})
+        self.assertEqual(counts["tag"], {"electronics": 1, "furniture": 1, "misc": 1, "tools": 2})
+        self.assertEqual(counts["watchlist"], {NOT_WATCHED: 3, WATCHED: 1})
+        self.assertIsNone(self.index.mask())
+
+    def test_selection_narrows_other_facets_but_not_its_own(self):
+        self.index.toggle("city", "Akron")
+        self.assertEqual(self.index.mask().tolist(), [True, True, False, False])
+
+        counts = self.index.counts(self.everything)
+        self.assertEqual(counts["city"], {"Akron": 2, "Canton": 1, "Erie": 1})
+        self.assertEqual(counts["facility"], {"Acme": 1, "Extra": 0, "Public": 1})
+
+        # values within a facet are OR-ed, facets are AND-ed
+        self.index.toggle("city", "Erie")
+        self.index.toggle("state", "PA")
+        self.assertEqual(self.index.mask().tolist(), [False, False, False, True])
+
+        self.index.clear()
+        self.assertIsNone(self.index.mask())
+
+    def test_counts_follow_base_mask_and_watchlist(self):
+        base = np.array([True, False, True, True])
+        self.assertEqual(self.index.counts(base)["city"], {"Akron": 1, "Canton": 1, "Erie": 1})
+
+        self.index.set_watchlist([a["auction_id"] for a in self.auctions], {"1", "4"})
+        self.index.toggle("watchlist", WATCHED)
+        self.assertEqual(self.index.mask().tolist(), [True, False, False, True])
+        self.assertEqual(self.index.counts(base)["state"], {"OH": 1, "PA": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
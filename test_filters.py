@@ -0,0 +1,53 @@
+import unittest
+
+import numpy as np
+
+from filters import FilterPipeline
+
+
+class FilterPipelineTests(unittest.TestCase):
+    def setUp(self):
+        self.now = 1_000_000.0
+        self.pipeline = FilterPipeline()
+        self.pipeline.set_rows(
+            [10, 50, 90, 70],
+            [self.now + 3600, self.now + 3600 * 48, self.now - 60, self.now + 3600 * 100],
+            now=self.now,
+        )
+
+    def test_thresholds(self):
+        self.assertEqual(self.pipeline.run().tolist(), [True, True, True, False])
+        self.pipeline.set_thresholds(min_score=50, max_hours=24)
+        # ended auctions count as zero hours left
+        self.assertEqual(self.pipeline.run().tolist(), [False, False, True, False])
+        self.assertEqual(self.pipeline.matched, 1)
+
+    def test_named_masks_combine_and_reset_with_rows(self):
+        self.pipeline.set_thresholds(max_hours=200)
+        self.pipeline.set_mask("text", [True, False, True, True])
+        self.assertEqual(self.pipeline.run().tolist(), [True, False, True, True])
+        self.assertEqual(self.pipeline.matched, 4)
+
+        self.pipeline.set_mask("text", None)
+        self.assertTrue(self.pipeline.run().all())
+
+        self.pipeline.set_mask("text", [False] * 4)
+        self.pipeline.set_rows(np.zeros(2), [self.now, self.now], now=self.now)
+        self.assertEqual(self.pipeline.run().tolist(), [True, True])
+
+    def test_radius_keeps_unknown_distances(self):
+        self.pipeline.set_thresholds(max_hours=200)
+        self.pipeline.set_distances([5.0, 80.0, np.nan, 40.0])
+        self.assertTrue(self.pipeline.run().all())
+        self.pipeline.set_thresholds(max_miles=40)
+        self.assertEqual(self.pipeline.run().tolist(), [True, False, True, True])
+        self.pipeline.set_thresholds(max_miles=np.inf)
+        self.assertTrue(self.pipeline.run().all())
+
+    def test_mask_length_must_match(self):
+        with self.assertRaises(ValueError):
+            self.pipeline.set_mask("text", [True])
+
+
+if __name__ == "__main__":
+    unittest.main()
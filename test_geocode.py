@@ -0,0 +1,84 @@
+import os
+import sys
+import tempfile
+import types
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from geocode import ZipCentroids, load_zip_centroids, zip_key
+
+
+class ZipCentroidsTests(unittest.TestCase):
+    def setUp(self):
+        self.centroids = ZipCentroids.from_records(
+            ["44647", "02134", "bad", "90210", "44647", "10001"],
+            [40.79, 42.35, 1.0, 34.09, 41.0, np.nan],
+            [-81.37, -71.13, 1.0, -118.41, -82.0, -73.99],
+        )
+
+    def test_zip_key(self):
+        self.assertEqual(zip_key("02134"), 2134)
+        self.assertEqual(zip_key(" 44647-1234 "), 44647)
+        self.assertIsNone(zip_key("ab123"))
+        self.assertIsNone(zip_key(None))
+
+    def test_sorted_unique_and_valid_only(self):
+        self.assertEqual(self.centroids.zips.tolist(), [2134, 44647, 90210])
+
+    def test_lookup(self):
+        lat, lng = self.centroids.lookup("44647")
+        self.assertAlmostEqual(lat, 40.79, places=4)
+        self.assertAlmostEqual(lng, -81.37, places=4)
+        self.assertIsNotNone(self.centroids.lookup("02134"))
+        self.assertIsNone(self.centroids.lookup("10001"))
+        self.assertIsNone(self.centroids.lookup("99999"))
+        self.assertIsNone(self.centroids.lookup(""))
+
+    def test_lookup_many_matches_lookup(self):
+        codes = ["90210", "00000", "44647", "x", "99999"]
+        lat, lng = self.centroids.lookup_many(codes)
+        for code, la, ln in zip(codes, lat, lng):
+            expected = self.centroids.lookup(code)
+            if expected is None:
+                self.assertTrue(np.isnan(la) and np.isnan(ln))
+            else:
+                self.assertAlmostEqual(la, expected[0], places=5)
+                self.assertAlmostEqual(ln, expected[1], places=5)
+
+    def test_saved_arrays_are_loaded_without_pgeocode(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "zips.npz")
+            self.centroids.save(path)
+            loaded = load_zip_centroids(path)
+        self.assertEqual(loaded.zips.tolist(), self.centroids.zips.tolist())
+        self.assertEqual(loaded.lookup("90210"), self.centroids.lookup("90210"))
+
+    def test_build_uses_only_the_public_query_api(self):
+        known = {"44647": (40.79, -81.37), "02134": (42.35, -71.13)}
+
+        class Nominatim:
+            # Only the documented method; private attributes would raise
+            __slots__ = ()
+
+            def __init__(self, country):
+                pass
+
+            def query_postal_code(self, codes):
+                return {
+                    "postal_code": list(codes),
+                    "latitude": [known.get(c, (np.nan, np.nan))[0] for c in codes],
+                    "longitude": [known.get(c, (np.nan, np.nan))[1] for c in codes],
+                }
+
+        with tempfile.TemporaryDirectory() as tmp, mock.patch.dict(
+            sys.modules, {"pgeocode": types.SimpleNamespace(Nominatim=Nominatim)}
+        ):
+            built = load_zip_centroids(os.path.join(tmp, "zips.npz"))
+        self.assertEqual(built.zips.tolist(), [2134, 44647])
+        self.assertAlmostEqual(built.lookup("02134")[0], 42.35, places=4)
+
+
+if __name__ == "__main__":
+    unittest.main()
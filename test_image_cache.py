@@ -0,0 +1,128 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+import image_cache
+from image_cache import ImageCache
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, body=b"", headers=None):
+        self.status_code = status_code
+        self.body = body
+        self.headers = headers or {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise image_cache.requests.HTTPError(str(self.status_code))
+
+    def iter_content(self, size):
+        for i in range(0, len(self.body), size):
+            yield self.body[i:i + size]
+
+
+class ImageCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = ImageCache(os.path.join(self.tmp.name, "cache"), max_disk_bytes=1000)
+        self.calls = []
+        self.responses = {}
+
+        def fake_get(url, headers=None, **kwargs):
+            self.calls.append((url, dict(headers or {})))
+            return self.responses[url]
+
+        patcher = mock.patch.object(image_cache.requests, "get", side_effect=fake_get)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_second_read_skips_network(self):
+        self.responses["a"] = FakeResponse(body=b"jpeg-a", headers={"ETag": '"1"'})
+        self.assertEqual(self.cache.get_bytes("a"), b"jpeg-a")
+        self.assertEqual(self.cache.get_bytes("a"), b"jpeg-a")
+        self.assertEqual(len(self.calls), 1)
+
+    def test_stale_entry_revalidates_with_validators(self):
+        self.responses["a"] = FakeResponse(
+            body=b"jpeg-a", headers={"ETag": '"1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}
+        )
+        self.cache.get_bytes("a")
+        self.cache.revalidate_after = 0
+        self.responses["a"] = FakeResponse(status_code=304)
+        self.assertEqual(self.cache.get_bytes("a"), b"jpeg-a")
+        headers = self.calls[-1][1]
+        self.assertEqual(headers["If-None-Match"], '"1"')
+        self.assertEqual(headers["If-Modified-Since"], "Mon, 01 Jan 2024 00:00:00 GMT")
+        self.assertEqual(self.cache.revalidated, 1)
+
+    def test_same_content_is_stored_once(self):
+        self.responses["a"] = FakeResponse(body=b"same")
+        self.responses["b"] = FakeResponse(body=b"same")
+        self.cache.get_bytes("a")
+        self.cache.get_bytes("b")
+        blobs = [f for _, _, files in os.walk(self.cache.directory) for f in files if f != "index.sqlite"]
+        self.assertEqual(len(blobs), 1)
+
+    def test_disk_tier_evicts_least_recently_used(self):
+        for url in "abc":
+            self.responses[url] = FakeResponse(body=url.encode() * 400)
+        self.cache.get_bytes("a")
+        time.sleep(0.01)
+        self.cache.get_bytes("b")
+        time.sleep(0.01)
+        self.cache.get_bytes("a")  # a is now newer than b
+        time.sleep(0.01)
+        self.cache.get_bytes("c")
+        self.calls.clear()
+        self.cache.get_bytes("a")
+        self.cache.get_bytes("c")
+        self.assertEqual(self.calls, [])
+        self.cache.get_bytes("b")
+        self.assertEqual([url for url, _ in self.calls], ["b"])
+
+    def test_hits_batch_their_last_use(self):
+        self.responses["a"] = FakeResponse(body=b"a" * 100)
+        self.cache.get_bytes("a")
+        used_at = lambda: self.cache._connect().execute("SELECT used_at FROM blobs").fetchone()[0]
+        stored = used_at()
+        time.sleep(0.01)
+        for _ in range(5):
+            self.cache.get_bytes("a")
+            self.cache.cached_bytes("a")
+        self.assertEqual(used_at(), stored)
+        self.cache.flush_used()
+        self.assertGreater(used_at(), stored)
+
+    def test_cancelled_download_is_not_stored(self):
+        self.responses["a"] = FakeResponse(body=b"x" * 200_000)
+        cancel = threading.Event()
+        cancel.set()
+        self.assertIsNone(self.cache.get_bytes("a", cancel=cancel))
+        self.assertEqual(self.cache.get_bytes("a"), b"x" * 200_000)
+        self.assertEqual(len(self.calls), 2)
+
+    def test_memory_tier_is_lru_by_bytes(self):
+        cache = ImageCache(self.tmp.name, max_memory_bytes=10)
+        cache.put_thumbnail("a", "A", 4)
+        cache.put_thumbnail("b", "B", 4)
+        cache.thumbnail("a")
+        cache.put_thumbnail("c", "C", 4)
+        self.assertEqual(cache.thumbnail("a"), "A")
+        self.assertIsNone(cache.thumbnail("b"))
+        self.assertEqual(cache.thumbnail("c"), "C")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+
+import numpy as np
+
+from geo import marker_coords
+from map_clusters import MAX_ZOOM, MIN_ZOOM, ClusterIndex
+
+
+class MarkerCoordsTests(unittest.TestCase):
+    def test_parses_strings_and_blanks_invalid(self):
+        auctions = [
+            {"facility": {"marker": {"lat": "34.05", "lng": "-118.25"}}},
+            {"facility": {"marker": {"lat": "invalid", "lng": "-118.25"}}},
+            {"facility": {"marker": {"lat": 95, "lng": 10}}},
+            {"facility": None},
+            {},
+        ]
+        lat, lng = marker_coords(auctions)
+        self.assertAlmostEqual(lat[0], 34.05)
+        self.assertAlmostEqual(lng[0], -118.25)
+        self.assertTrue(np.isnan(lat[1:]).all())
+        self.assertTrue(np.isnan(lng[1:]).all())
+
+
+class ClusterIndexTests(unittest.TestCase):
+    def setUp(self):
+        # Two tight groups far apart, plus one auction without coordinates
+        self.lat = [40.0, 40.001, 40.002, 34.0, 34.001, np.nan]
+        self.lng = [-81.0, -81.001, -81.002, -118.0, -118.001, np.nan]
+        self.index = ClusterIndex([10, 11, 12, 20, 21, 30], self.lat, self.lng)
+
+    def test_every_point_lands_in_one_cluster_per_level(self):
+        self.assertEqual(len(self.index), 5)
+        for zoom in range(MIN_ZOOM, MAX_ZOOM + 1):
+            counts = [c[2] for c in self.index.clusters(zoom)]
+            self.assertEqual(sum(counts), 5)
+
+    def test_groups_merge_when_zoomed_out_and_split_when_zoomed_in(self):
+        self.assertEqual(sorted(c[2] for c in self.index.clusters(6)), [2, 3])
+        self.assertEqual(len(self.index.clusters(MAX_ZOOM)), 5)
+
+    def test_members_and_bounds_filter(self):
+        rows = self.index.clusters(6, bounds=(39, -82, 41, -80))
+        self.assertEqual(len(rows), 1)
+        lat, lng, count, cluster = rows[0]
+        self.assertEqual(count, 3)
+        self.assertEqual(sorted(self.index.members(6, int(cluster)).tolist()), [10, 11, 12])
+        self.assertAlmostEqual(lat, 40.001, places=4)
+
+    def test_zoom_outside_levels_uses_nearest(self):
+        self.assertEqual(self.index.clusters(0), self.index.clusters(MIN_ZOOM))
+        self.assertEqual(self.index.clusters(30), self.index.clusters(MAX_ZOOM))
+
+    def test_empty(self):
+        index = ClusterIndex([1], [np.nan], [np.nan])
+        self.assertEqual(index.clusters(5), [])
+        self.assertIsNone(index.bounds())
+        self.assertEqual(len(index.members(5, 0)), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
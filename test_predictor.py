@@ -0,0 +1,135 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+import db
+import predictor
+
+
+class FinalPricePredictorTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._original_path = db.DB_PATH
+        db.DB_PATH = os.path.join(self._tmp.name, "test.db")
+        db.init_db()
+
+        # Auctions that ended yesterday; bids roughly double over the last day
+        expire = datetime.now(timezone.utc) - timedelta(days=1)
+        snapshots = []
+        for i in range(30):
+            aid = f"a{i}"
+            final = 100.0 + 10 * i
+            conn = sqlite3.connect(db.DB_PATH)
+            conn.execute(
+                "INSERT INTO auctions (auction_id, unit_size, unit_contents, expire_at) VALUES (?, ?, ?, ?)",
+                (aid, "10x10" if i % 2 else "5x10", "couch and tools" if i % 3 else "boxes", expire.isoformat()),
+            )
+            conn.commit()
+            conn.close()
+            for hours_left in (24, 12, 6, 1, 0.5):
+                bid = final / (1 + hours_left / 24)
+                ts = expire - timedelta(hours=hours_left)
+                snapshots.append((aid, bid, ts.isoformat(), int(10 - hours_left / 3), 50 + i))
+        # An auction we stopped watching long before it ended is not usable
+        snapshots.append(("gone", 10.0, (expire - timedelta(hours=30)).isoformat(), 1, 5))
+
+        conn = sqlite3.connect(db.DB_PATH)
+        conn.execute(
+            "INSERT INTO auctions (auction_id, unit_size, unit_contents, expire_at) VALUES ('gone', '', '', ?)",
+            (expire.isoformat(),),
+        )
+        conn.executemany(
+            "INSERT INTO bid_history (auction_id, bid, timestamp, total_bids, total_views) VALUES (?,?,?,?,?)",
+            snapshots,
+        )
+        conn.commit()
+        conn.close()
+
+    def tearDown(self):
+        db.DB_PATH = self._original_path
+        self._tmp.cleanup()
+
+    def test_training_rows_pair_snapshots_with_final_price(self):
+        rows = db.load_final_price_training_rows()
+        self.assertEqual(len(rows), 150)
+        self.assertNotIn("gone", {r["auction_id"] for r in rows})
+        a0 = [r for r in rows if r["auction_id"] == "a0"]
+        self.assertTrue(all(r["final_bid"] == a0[-1]["bid"] for r in a0))
+        self.assertAlmostEqual(a0[0]["hours_left"], 24, places=3)
+
+    def test_fit_beats_current_bid_and_roundtrips(self):
+        rows = db.load_final_price_training_rows()
+        coefficients = predictor.fit(rows)
+        db.save_final_price_model(coefficients, len(rows))
+
+        model = predictor.FinalPricePredictor()
+        self.assertTrue(model.trained)
+
+        args = (
+            [r["bid"] for r in rows],
+            [r["total_bids"] for r in rows],
+            [r["total_views"] for r in rows],
+            [r["hours_left"] for r in rows],
+            [predictor.unit_area(r["unit_size"]) for r in rows],
+            [["misc"]] * len(rows),
+        )
+        predicted = model.predict(*args)
+        finals = np.array([r["final_bid"] for r in rows])
+        bids = np.array(args[0])
+        self.assertTrue(np.all(predicted >= bids - 1e-9))
+        self.assertLess(np.mean(np.abs(predicted - finals)), np.mean(np.abs(bids - finals)))
+
+    def test_untrained_model_predicts_nan(self):
+        model = predictor.FinalPricePredictor()
+        self.assertFalse(model.trained)
+        self.assertTrue(np.isnan(model.predict([10.0], [1], [1], [5.0], [100.0], [["misc"]])).all())
+
+    def test_cache_only_repredicts_changed_rows(self):
+        calls = []
+
+        class Recording(predictor.FinalPricePredictor):
+            def predict(self, bids, *args):
+                calls.append(len(bids))
+                return super().predict(bids, *args)
+
+        cache = predictor.PredictionCache(Recording({"intercept": 0.5}))
+        args = [["x", "y", "z"], [10.0, 20.0, 30.0], [1, 2, 3], [5, 5, 5], [10.0, 10.0, 10.0], [0.0] * 3, [["misc"]] * 3]
+        first = cache.predict(*args)
+        args[1] = [10.0, 25.0, 30.0]
+        second = cache.predict(*args)
+
+        self.assertEqual(calls, [3, 1])
+        self.assertEqual(first[0], second[0])
+        self.assertAlmostEqual(second[1], np.expm1(np.log1p(25.0) + 0.5))
+
+    def test_reload_keeps_cache_until_coefficients_change(self):
+        calls = []
+
+        class Recording(predictor.FinalPricePredictor):
+            def predict(self, bids, *args):
+                calls.append(len(bids))
+                return super().predict(bids, *args)
+
+        db.save_final_price_model({"intercept": 0.5}, 30)
+        cache = predictor.PredictionCache(Recording(db.load_final_price_model()))
+        args = [["x", "y", "z"], [10.0, 20.0, 30.0], [1, 2, 3], [5, 5, 5], [10.0, 10.0, 10.0], [0.0] * 3, [["misc"]] * 3]
+        cache.predict(*args)
+
+        # A list reload with new snapshots but the same model
+        cache.reload()
+        args[1] = [10.0, 25.0, 30.0]
+        cache.predict(*args)
+        self.assertEqual(calls, [3, 1])
+
+        db.save_final_price_model({"intercept": 0.7}, 30)
+        cache.reload()
+        retrained = cache.predict(*args)
+        self.assertAlmostEqual(retrained[0], np.expm1(np.log1p(10.0) + 0.7))
+
+
+if __name__ == "__main__":
+    unittest.main()
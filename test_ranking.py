@@ -0,0 +1,55 @@
+import random
+import unittest
+
+import numpy as np
+
+from ranking import TopK, metric_values, value_range
+
+
+class TopKTests(unittest.TestCase):
+    def expected(self, values, k):
+        return sorted(values.values(), reverse=True)[:k]
+
+    def test_matches_full_sort_under_random_updates(self):
+        rng = random.Random(7)
+        top = TopK(k=5)
+        values = {}
+        for _ in range(2000):
+            aid = f"a{rng.randint(0, 60)}"
+            if rng.random() < 0.1:
+                top.remove(aid)
+                values.pop(aid, None)
+            else:
+                value = rng.uniform(-50, 50)
+                top.update(aid, value)
+                values[aid] = value
+            self.assertEqual([v for _, v, _ in top.items()], self.expected(values, 5))
+
+    def test_nan_values_are_not_ranked(self):
+        top = TopK(k=3)
+        top.update_many(["a", "b", "c"], [1.0, float("nan"), 3.0])
+        self.assertEqual([aid for aid, _, _ in top.items()], ["c", "a"])
+
+    def test_retain_drops_auctions_no_longer_listed(self):
+        top = TopK(k=2)
+        top.update_many(["a", "b", "c"], [3.0, 2.0, 1.0], ["A", "B", "C"])
+        top.retain(["b", "c"])
+        self.assertEqual(top.items(), [("b", 2.0, "B"), ("c", 1.0, "C")])
+
+
+class MetricTests(unittest.TestCase):
+    def test_margin_falls_back_to_current_bid(self):
+        margin = metric_values("margin", [0, 0], [100, 100], [150, np.nan], [200, 200], [400, 400])
+        self.assertEqual(margin.tolist(), [150.0, 200.0])
+
+    def test_value_range_prefers_manual_totals(self):
+        self.assertEqual(value_range(None, (5, 9)), (5, 9))
+        self.assertEqual(value_range({"total_low": 10, "total_high": 20}, (5, 9)), (10, 20))
+        self.assertEqual(
+            value_range({"total_low": 10, "total_high": 20, "manual_total_low": 1, "manual_total_high": 2}, (5, 9)),
+            (1, 2),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
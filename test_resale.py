@@ -0,0 +1,77 @@
+import os
+import tempfile
+import unittest
+
+import db
+import price_model
+import resale
+
+
+class UnitSizeClassTests(unittest.TestCase):
+    def test_normalizes_common_formats(self):
+        self.assertEqual(resale.unit_size_class("10x10"), "10x10")
+        self.assertEqual(resale.unit_size_class("10 X 15 Unit"), "10x15")
+        self.assertEqual(resale.unit_size_class("15'x10'"), "10x15")
+        self.assertEqual(resale.unit_size_class("5 × 7.5"), "5x7.5")
+        self.assertEqual(resale.unit_size_class("Parking space"), "")
+        self.assertEqual(resale.unit_size_class(None), "")
+
+
+class PriceLookupTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._original_path = db.DB_PATH
+        db.DB_PATH = os.path.join(self._tmp.name, "test.db")
+        db.init_db()
+        resale.reload_price_lookup()
+
+    def tearDown(self):
+        db.DB_PATH = self._original_path
+        resale.reload_price_lookup()
+        self._tmp.cleanup()
+
+    def test_falls_back_to_static_values_without_fitted_data(self):
+        self.assertEqual(resale.estimate(["tools", "furniture"], "5x5"), (450, 1800))
+        self.assertEqual(resale.estimate(["tools"], "10x10"), (200, 960))
+
+    def test_estimate_uses_fitted_lookup(self):
+        for i in range(4):
+            db.save_vision_result(
+                f"a{i}",
+                {
+                    "items": [
+                        {"name": "Cordless drill", "brand": "DeWalt", "low": 40, "high": 80},
+                        {"name": "Couch", "low": 100 + i, "high": 300},
+                    ],
+                    "total_low": 0,
+                    "total_high": 0,
+                },
+                unit_size="10x10" if i % 2 else "10 x 20",
+            )
+        # Manual overrides win over AI items and hidden rows are skipped
+        db.save_vision_result(
+            "a4",
+            {"items": [{"name": "Couch", "low": 9999, "high": 9999}], "total_low": 0, "total_high": 0},
+            manual_items=[
+                {"name": "Drill", "low": 40, "high": 80},
+                {"name": "Couch", "low": 9999, "high": 9999, "hidden": True},
+            ],
+            manual_totals={"low": 40, "high": 80},
+        )
+
+        fitted = price_model.fit(db.load_vision_training_rows())
+        db.save_price_lookup(fitted)
+        resale.reload_price_lookup()
+
+        lookup = resale.price_lookup()
+        self.assertEqual(lookup[("category", "tools")]["samples"], 5)
+        self.assertEqual(lookup[("category", "tools")]["low"], 40)
+        self.assertEqual(lookup[("category", "furniture")]["samples"], 4)
+        self.assertEqual(resale.estimate(["tools"], "Storage"), (40, 80))
+        # Only two 10x20 appraisals: too few, so the crude size rule applies
+        self.assertEqual(lookup[("unit_size", "10x20")]["samples"], 2)
+        self.assertEqual(resale.estimate(["tools"], "10x20"), (40, 96))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+import random
+import unittest
+
+from scoring import (
+    ScoreCache,
+    SCORING_PROFILES,
+    active_profile,
+    auction_columns,
+    profile_weights,
+    profit_score,
+    profit_scores,
+)
+
+
+def make_auction(bid, views, bids):
+    return {
+        "current_bid": {"amount": bid},
+        "total_views": views,
+        "total_bids": bids,
+    }
+
+
+class ProfitScoresTests(unittest.TestCase):
+    def test_matches_scalar_reference(self):
+        rng = random.Random(7)
+        auctions = []
+        velocities = []
+        for _ in range(5000):
+            auctions.append(
+                make_auction(
+                    rng.choice([rng.uniform(0, 400), rng.randint(0, 400), str(rng.randint(0, 90))]),
+                    rng.choice([rng.randint(0, 1000), str(rng.randint(0, 300))]),
+                    rng.randint(0, 60),
+                )
+            )
+            velocities.append(rng.choice([0.0, rng.uniform(-5, 40)]))
+
+        scores = profit_scores(*auction_columns(auctions), velocities)
+
+        expected = [profit_score(a, v) for a, v in zip(auctions, velocities)]
+        self.assertEqual(scores.tolist(), expected)
+
+    def test_truncates_toward_zero_before_clamping(self):
+        # 100 - 250.5 * 0.4 + ... lands on fractional negatives and >100 values
+        auctions = [
+            make_auction(250.5, 100, 20),
+            make_auction(0, 0, 0),
+            make_auction(2.5, 100, 20),
+        ]
+        velocities = [0.0, 0.0, 0.0]
+
+        scores = profit_scores(*auction_columns(auctions), velocities)
+
+        self.assertEqual(scores.tolist(), [profit_score(a, 0.0) for a in auctions])
+
+    def test_empty_list(self):
+        self.assertEqual(profit_scores(*auction_columns([]), []).tolist(), [])
+
+
+class ScoreCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.auctions = [make_auction(10 * i, 5 * i, i) for i in range(50)]
+        self.aids = [str(i) for i in range(50)]
+        self.columns = auction_columns(self.auctions)
+        self.velocities = [0.25 * i for i in range(50)]
+
+    def test_matches_uncached_scores(self):
+        cache = ScoreCache()
+        for name in SCORING_PROFILES:
+            weights = profile_weights(SCORING_PROFILES[name])
+            cached = cache.scores(self.aids, *self.columns, self.velocities, weights)
+            expected = profit_scores(*self.columns, self.velocities, weights)
+            self.assertEqual(cached.tolist(), expected.tolist())
+
+    def test_only_changed_rows_are_rescored(self):
+        cache = ScoreCache()
+        cache.scores(self.aids, *self.columns, self.velocities)
+        self.assertEqual((cache.hits, cache.misses), (0, 50))
+
+        bids, views, bid_counts = self.columns
+        bids = bids.copy()
+        bids[3] += 25
+        cache.scores(self.aids, bids, views, bid_counts, self.velocities)
+        self.assertEqual((cache.hits, cache.misses), (49, 51))
+
+    def test_switching_profiles_back_is_free(self):
+        cache = ScoreCache()
+        bargain = SCORING_PROFILES["Bargain hunter"]
+        cache.scores(self.aids, *self.columns, self.velocities)
+        cache.scores(self.aids, *self.columns, self.velocities, bargain)
+        misses = cache.misses
+        cache.scores(self.aids, *self.columns, self.velocities)
+        cache.scores(self.aids, *self.columns, self.velocities, bargain)
+        self.assertEqual(cache.misses, misses)
+
+    def test_single_score_matches_the_list(self):
+        auctions = [dict(a, auction_id=aid) for a, aid in zip(self.auctions, self.aids)]
+        # Raw velocities just off the 0.01 buckets the list scores with
+        velocities = [0.25 * i + 0.004 for i in range(50)]
+        weights = SCORING_PROFILES["Low competition"]
+        listed = ScoreCache().scores(self.aids, *self.columns, velocities, weights)
+
+        detail = ScoreCache()
+        for a, velocity, expected in zip(auctions, velocities, listed.tolist()):
+            self.assertEqual(detail.score(a, velocity, weights), expected)
+
+        # Already scored by the list: the detail card reads the same entry
+        cache = ScoreCache()
+        cache.scores(self.aids, *self.columns, velocities, weights)
+        misses = cache.misses
+        self.assertEqual(cache.score(auctions[7], velocities[7], weights), listed[7])
+        self.assertEqual(cache.misses, misses)
+
+    def test_active_profile_from_preferences(self):
+        prefs = {
+            "scoring_profile": "Mine",
+            "scoring_profiles": {"Mine": {"bid_weight": 1.0}},
+        }
+        name, weights = active_profile(prefs)
+        self.assertEqual(name, "Mine")
+        self.assertEqual(weights["bid_weight"], 1.0)
+        self.assertEqual(weights["bids_pivot"], 20)
+
+        name, _ = active_profile({"scoring_profile": "Unknown"})
+        self.assertEqual(name, "Balanced")
+
+    def test_bad_custom_weights_keep_defaults(self):
+        prefs = {
+            "scoring_profile": "Typo",
+            "scoring_profiles": {
+                "Typo": {
+                    "bid_weight": "2",
+                    "velocity_weight": "fast",
+                    "views_weight": None,
+                    "bids_weight": float("nan"),
+                    "bids_pivot": [10],
+                },
+            },
+        }
+        _, weights = active_profile(prefs)
+        self.assertEqual(weights, dict(profile_weights(), bid_weight=2.0))
+
+        scores = profit_scores(*self.columns, self.velocities, weights)
+        expected = [profit_score(a, v, weights) for a, v in zip(self.auctions, self.velocities)]
+        self.assertEqual(scores.tolist(), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
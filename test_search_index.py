@@ -0,0 +1,40 @@
+import unittest
+
+from search_index import SearchIndex, auction_document
+
+
+class SearchIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.auctions = [
+            {"city": "Akron", "state": "OH", "facility_name": "Acme Storage", "unit_size": "10x10", "unit_contents": "couch, tools"},
+            {"city": "Canton", "state": "OH", "facility_name": "Public Storage", "unit_size": "15' x 10'", "unit_contents": "TV and boxes"},
+            {"city": "Pittsburgh", "state": "PA", "facility_name": "Extra Space", "unit_size": "5x10", "unit_contents": ""},
+        ]
+        tags = [["furniture", "tools"], ["electronics"], ["misc"]]
+        self.index = SearchIndex.from_auctions(self.auctions, tags)
+
+    def rows(self, text):
+        return self.index.query(text).nonzero()[0].tolist()
+
+    def test_prefix_matches_any_field(self):
+        self.assertEqual(self.rows("akr"), [0])
+        self.assertEqual(self.rows("stor"), [0, 1])
+        self.assertEqual(self.rows("electr"), [1])
+        self.assertEqual(self.rows("oh"), [0, 1])
+
+    def test_all_terms_must_match(self):
+        self.assertEqual(self.rows("oh tool"), [0])
+        self.assertEqual(self.rows("pa couch"), [])
+
+    def test_unit_size_class_is_searchable(self):
+        self.assertEqual(self.rows("10x15"), [1])
+        self.assertEqual(self.rows("10x"), [0, 1])
+        self.assertIn("5x10", auction_document(self.auctions[2]))
+
+    def test_empty_query_does_not_filter(self):
+        self.assertIsNone(self.index.query("  "))
+        self.assertEqual(SearchIndex([]).query("x").tolist(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
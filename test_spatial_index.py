@@ -0,0 +1,105 @@
+import math
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+import db
+from geo import haversine_miles
+from spatial_index import FacilityIndex, geohash, geohash_ranges
+
+
+class GeohashTests(unittest.TestCase):
+    def test_known_hashes(self):
+        self.assertEqual(geohash(57.64911, 10.40744, 11), "u4pruydqqvj")
+        self.assertEqual(geohash(42.6, -5.6, 5), "ezs42")
+        self.assertIsNone(geohash(None, 10))
+        self.assertIsNone(geohash(91, 10))
+
+    def test_ranges_cover_the_circle(self):
+        rng = np.random.default_rng(3)
+        lat, lng = 40.8 + rng.uniform(-1, 1, 500), -81.4 + rng.uniform(-1, 1, 500)
+        prefixes = geohash_ranges(40.8, -81.4, 40)
+        inside = haversine_miles(40.8, -81.4, lat, lng) <= 40
+        for a, b in zip(lat[inside], lng[inside]):
+            self.assertTrue(any(geohash(a, b).startswith(p) for p in prefixes))
+
+
+class FacilityIndexTests(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(11)
+        self.lat = rng.uniform(25, 49, 20000)
+        self.lng = rng.uniform(-124, -67, 20000)
+        self.lat[:50] = np.nan
+        self.index = FacilityIndex(self.lat, self.lng)
+
+    def brute(self, lat, lng):
+        d = haversine_miles(lat, lng, self.lat, self.lng)
+        return np.where(np.isnan(d), np.inf, d)
+
+    def test_within_matches_linear_scan(self):
+        for lat, lng, miles in ((40.8, -81.4, 40), (30.0, -100.0, 400), (48.9, -123.9, 3), (40.8, -81.4, 0.1)):
+            positions, distances = self.index.within(lat, lng, miles)
+            d = self.brute(lat, lng)
+            self.assertEqual(set(positions.tolist()), set(np.flatnonzero(d <= miles).tolist()))
+            self.assertTrue(np.all(np.diff(distances) >= 0))
+
+    def test_nearest_matches_linear_scan(self):
+        for lat, lng, k in ((40.8, -81.4, 1), (25.0, -67.0, 15), (60.0, -150.0, 5)):
+            _, distances = self.index.nearest(lat, lng, k)
+            np.testing.assert_allclose(distances, np.sort(self.brute(lat, lng))[:k])
+        _, distances = self.index.nearest(40.8, -81.4, 100, max_miles=5)
+        self.assertTrue(np.all(distances <= 5))
+
+    def test_wraps_the_antimeridian(self):
+        index = FacilityIndex([0.0, 0.0, 10.0], [179.99, -179.99, 0.0])
+        positions, _ = index.within(0.0, 180.0, 5)
+        self.assertEqual(sorted(positions.tolist()), [0, 1])
+        self.assertEqual(len(FacilityIndex([], []).within(0.0, 0.0, math.inf)[0]), 0)
+
+
+class ArchivedRadiusQueryTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._original_path = db.DB_PATH
+        db.DB_PATH = os.path.join(self._tmp.name, "test.db")
+        db.init_db()
+        expire = (datetime.now(timezone.utc) + timedelta(days=1)).strftime("%Y-%m-%d %H:%M:%S")
+        rng = np.random.default_rng(5)
+        self.points = {
+            str(i): (float(a), float(b))
+            for i, (a, b) in enumerate(zip(rng.uniform(39, 42, 400), rng.uniform(-83, -80, 400)))
+        }
+        db.archive_auctions([
+            {
+                "auction_id": aid,
+                "current_bid": {"amount": 10},
+                "expire_date": {"utc": {"datetime": expire}},
+                "facility": {"marker": {"lat": lat, "lng": lng}},
+            }
+            for aid, (lat, lng) in self.points.items()
+        ])
+
+    def tearDown(self):
+        db.DB_PATH = self._original_path
+        self._tmp.cleanup()
+
+    def test_near_returns_exactly_the_auctions_in_radius(self):
+        found = db.load_active_auctions(near=(40.8, -81.4, 30))
+        expected = {
+            aid for aid, (lat, lng) in self.points.items()
+            if haversine_miles(40.8, -81.4, lat, lng) <= 30
+        }
+        self.assertTrue(expected)
+        self.assertEqual({a["auction_id"] for a in found}, expected)
+        distances = [
+            haversine_miles(40.8, -81.4, a["facility"]["marker"]["lat"], a["facility"]["marker"]["lng"])
+            for a in found
+        ]
+        self.assertEqual(distances, sorted(distances))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import tempfile
+import unittest
+
+from image_cache import ImageCache
+from tile_cache import TILE_HEADERS, parse_tile_path, upstream_url
+import tile_server
+
+
+class ParseTilePathTests(unittest.TestCase):
+    def test_valid_and_invalid_paths(self):
+        self.assertEqual(parse_tile_path("/13/2263/3052.png"), (13, 2263, 3052))
+        self.assertIsNone(parse_tile_path("/13/2263/3052.jpg"))
+        self.assertIsNone(parse_tile_path("/2/4/0.png"))  # x past the edge of zoom 2
+        self.assertIsNone(parse_tile_path("/20/0/0.png"))
+        self.assertIsNone(parse_tile_path("/../etc/passwd"))
+
+    def test_upstream_url(self):
+        self.assertEqual(
+            upstream_url(3, 4, 5, "http://localhost/{z}/{x}/{y}.png"),
+            "http://localhost/3/4/5.png",
+        )
+
+
+class LocalTileServerTests(unittest.TestCase):
+    def setUp(self):
+        self.server = tile_server.serve(port=0)
+        self.template = tile_server.tile_url(self.server)
+        self.dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.dir.cleanup()
+
+    def cache(self, **kw):
+        return ImageCache(self.dir.name, max_memory_bytes=0, headers=TILE_HEADERS, **kw)
+
+    def test_second_paint_comes_from_disk(self):
+        cache = self.cache()
+        url = upstream_url(5, 8, 11, self.template)
+        self.assertIsNone(cache.cached_bytes(url))
+        data = cache.get_bytes(url)
+        self.assertTrue(data.startswith(b"\x89PNG"))
+        self.assertEqual(cache.cached_bytes(url), data)
+        self.assertEqual((cache.downloads, cache.hits), (1, 1))
+
+    def test_stale_tile_is_revalidated_not_downloaded(self):
+        cache = self.cache(revalidate_after=0)
+        url = upstream_url(5, 8, 11, self.template)
+        first = cache.get_bytes(url)
+        self.assertIsNone(cache.cached_bytes(url))
+        self.assertEqual(cache.get_bytes(url), first)
+        self.assertEqual((cache.downloads, cache.revalidated), (1, 1))
+
+    def test_evicts_past_disk_cap(self):
+        old, new = upstream_url(5, 8, 11, self.template), upstream_url(5, 8, 12, self.template)
+        cache = self.cache()
+        cache.max_disk_bytes = int(len(cache.get_bytes(old)) * 1.5)
+        cache.get_bytes(new)
+        self.assertIsNone(cache.cached_bytes(old))
+        self.assertIsNotNone(cache.cached_bytes(new))
+
+
+if __name__ == "__main__":
+    unittest.main()
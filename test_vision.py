@@ -0,0 +1,45 @@
+import unittest
+
+from vision import KeywordTagger, tag_from_text, tag_many
+
+
+class TagFromTextTests(unittest.TestCase):
+    def test_matches_whole_words_only(self):
+        self.assertEqual(tag_from_text("Outvote the embedded toolkitten"), ["misc"])
+        self.assertEqual(tag_from_text("tv and a bed"), ["electronics", "furniture"])
+
+    def test_plurals_and_case(self):
+        self.assertEqual(tag_from_text("TVs, Dressers, DRILLS"), ["electronics", "furniture", "tools"])
+
+    def test_longest_term_wins(self):
+        self.assertEqual(tag_from_text("table saw"), ["tools"])
+        self.assertEqual(tag_from_text("table-saw"), ["tools"])
+        self.assertEqual(tag_from_text("table, saw"), ["furniture", "tools"])
+
+    def test_empty_text_is_misc(self):
+        self.assertEqual(tag_from_text(None), ["misc"])
+        self.assertEqual(tag_from_text(""), ["misc"])
+
+    def test_packaging_and_ambiguous_words_add_no_category(self):
+        self.assertEqual(tag_from_text("boxes, totes, bins and bags"), ["misc"])
+        self.assertEqual(tag_from_text("gold ring, watch, art, fan, bat, cap"), ["misc"])
+        self.assertEqual(tag_from_text("couch and boxes"), ["furniture"])
+        self.assertEqual(tag_from_text("diamond ring and a wrist watch"), ["jewelry"])
+        self.assertEqual(tag_from_text("gun safe"), ["sports"])
+
+    def test_batch_matches_single(self):
+        texts = ["table", "saw", None, "couch\nsaw", "golf clubs", "table", "lamp shade"]
+        self.assertEqual(tag_many(texts), [tag_from_text(t) for t in texts])
+
+    def test_batch_does_not_match_across_texts(self):
+        tagger = KeywordTagger({"tools": ("table saw",), "furniture": ("table",)})
+        self.assertEqual(tagger.tag_many(["oak table", "saw"]), [["furniture"], ["misc"]])
+
+    def test_custom_taxonomy(self):
+        tagger = KeywordTagger({"fish": ("trout", "sea bass")}, fallback="none")
+        self.assertEqual(tagger.tag("two Sea  Basses"), ["fish"])
+        self.assertEqual(tagger.tag("bass"), ["none"])
+
+
+if __name__ == "__main__":
+    unittest.main()
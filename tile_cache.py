@@ -0,0 +1,44 @@
+
+import re
+
+from config import TILE_SERVER_URL
+from image_cache import ImageCache
+
+# Map pages request tiles as tiles://osm/{z}/{x}/{y}.png; the scheme
+# handler answers from TILE_CACHE and only goes upstream on a miss
+TILE_SCHEME = b"tiles"
+TILE_CACHE_DIR = "tile_cache"
+MAX_TILE_DISK_BYTES = 256 * 1024 * 1024
+# Tile servers ask clients to keep tiles at least a week
+TILE_MAX_AGE = 7 * 24 * 3600
+MAX_TILE_ZOOM = 19
+# The OSM tile policy caps clients at two connections
+MAX_TILE_THREADS = 2
+# Disk reads of cached tiles
+MAX_TILE_READ_THREADS = 4
+TILE_HEADERS = {"User-Agent": "StorageTreasures-AuctionBrowser/1.0"}
+
+_TILE_PATH = re.compile(r"^/(\d{1,2})/(\d{1,7})/(\d{1,7})\.png$")
+
+TILE_CACHE = ImageCache(
+    TILE_CACHE_DIR,
+    max_disk_bytes=MAX_TILE_DISK_BYTES,
+    max_memory_bytes=0,
+    revalidate_after=TILE_MAX_AGE,
+    headers=TILE_HEADERS,
+)
+
+
+def parse_tile_path(path):
+    """(z, x, y) of a '/z/x/y.png' path, or None when it is not a valid tile."""
+    m = _TILE_PATH.match(path)
+    if not m:
+        return None
+    z, x, y = (int(v) for v in m.groups())
+    if z > MAX_TILE_ZOOM or x >= 2 ** z or y >= 2 ** z:
+        return None
+    return z, x, y
+
+
+def upstream_url(z, x, y, template=None):
+    return (template or TILE_SERVER_URL).format(z=z, x=x, y=y)
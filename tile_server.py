@@ -0,0 +1,106 @@
+
+"""
+Local stand-in for the map tile server.
+
+    python tile_server.py                    # placeholder tiles on :8765
+    python tile_server.py --dir osm_tiles    # serve saved z/x/y.png tiles
+    TILE_SERVER_URL=http://127.0.0.1:8765/{z}/{x}/{y}.png python main.py
+
+Tiles found under --dir are served as-is; anything else gets a generated
+grid tile labelled with its z/x/y, so the map still renders offline and
+in tests. Responses carry an ETag and answer If-None-Match with 304,
+like the real server, so the tile cache's revalidation path is exercised.
+"""
+
+import argparse
+import hashlib
+import io
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from PIL import Image, ImageDraw
+
+from tile_cache import parse_tile_path
+
+DEFAULT_PORT = 8765
+TILE_PX = 256
+
+
+def placeholder_tile(z, x, y):
+    img = Image.new("RGB", (TILE_PX, TILE_PX), (17, 24, 39))
+    draw = ImageDraw.Draw(img)
+    draw.rectangle((0, 0, TILE_PX - 1, TILE_PX - 1), outline=(55, 65, 81))
+    draw.text((8, 8), f"{z}/{x}/{y}", fill=(156, 163, 175))
+    buf = io.BytesIO()
+    img.save(buf, "PNG")
+    return buf.getvalue()
+
+
+class TileRequestHandler(BaseHTTPRequestHandler):
+    directory = None
+
+    def do_GET(self):
+        tile = parse_tile_path(self.path.split("?", 1)[0])
+        if tile is None:
+            self.send_error(404)
+            return
+        data = self.load(*tile)
+        etag = '"%s"' % hashlib.sha1(data).hexdigest()
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "image/png")
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "max-age=604800")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def load(self, z, x, y):
+        if self.directory:
+            path = os.path.join(self.directory, str(z), str(x), f"{y}.png")
+            try:
+                with open(path, "rb") as f:
+                    return f.read()
+            except OSError:
+                pass
+        return placeholder_tile(z, x, y)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(port=DEFAULT_PORT, directory=None, host="127.0.0.1"):
+    """Starts the server on a daemon thread and returns it; port 0 picks a free port."""
+    handler = type("Handler", (TileRequestHandler,), {"directory": directory})
+    server = ThreadingHTTPServer((host, port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def tile_url(server):
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}/{{z}}/{{x}}/{{y}}.png"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve map tiles locally for offline use and tests.")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="port to listen on (default: %(default)s)")
+    parser.add_argument("--dir", help="directory of saved tiles laid out as z/x/y.png")
+    args = parser.parse_args(argv)
+
+    server = serve(args.port, args.dir)
+    print(f"Serving tiles at {tile_url(server)}")
+    print("Set TILE_SERVER_URL to that template before starting the app. Ctrl+C stops.")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
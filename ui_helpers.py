@@ -1,4 +1,5 @@
 
+from PySide6.QtCore import Signal
 from PySide6.QtWidgets import QFrame, QVBoxLayout, QLabel
 
 class Card(QFrame):
@@ -15,8 +16,13 @@ class Card(QFrame):
             t.setObjectName("CardTitle")
             self.layout.addWidget(t)
 
-def clear_layout(layout):
-    while layout.count():
-        w = layout.takeAt(0).widget()
-        if w:
-            w.deleteLater()
+class ClickableLabel(QLabel):
+    clicked = Signal(object)
+
+    def __init__(self, payload=None, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.payload = payload or {}
+
+    def mousePressEvent(self, event):
+        self.clicked.emit(self.payload)
+        super().mousePressEvent(event)
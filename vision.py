@@ -1,17 +1,140 @@
+import bisect
+import hashlib
+import re
+
+from taxonomy import TAXONOMY
+
+
+class KeywordTagger:
+    """
+    Tags free text with taxonomy categories using a single compiled regex.
+
+    All terms are folded into one prefix-trie pattern anchored on word
+    boundaries, so "tv" no longer matches "outvote" and "bed" no longer
+    matches "embedded". Results are memoized per text hash.
+    """
+
+    # Joins texts for batch tagging; it is neither a word character nor
+    # whitespace, so no match can straddle two texts.
+    SEPARATOR = "\x00"
+
+    def __init__(self, taxonomy, fallback="misc", max_memo=50_000):
+        self.fallback = fallback
+        self.max_memo = max_memo
+        self.term_categories = {}
+        for category, terms in taxonomy.items():
+            for term in terms:
+                term = self._normalize(term)
+                self.term_categories.setdefault(term, set()).add(category)
+
+        self.pattern = re.compile(
+            rf"\b({self._trie_pattern(self.term_categories)})(?:e?s)?\b",
+            re.IGNORECASE,
+        )
+        self.categories = sorted({c for cats in self.term_categories.values() for c in cats})
+        self._memo = {}
+
+    @staticmethod
+    def _trie_pattern(terms):
+        # Prefix-factored alternation: the regex engine walks shared
+        # prefixes once instead of retrying every term at each position.
+        # Optional tails are greedy, so longer terms win.
+        trie = {}
+        for term in terms:
+            node = trie
+            for ch in term:
+                node = node.setdefault(ch, {})
+            node[""] = {}
+
+        def build(node):
+            alts = [
+                (r"[\s\-]+" if ch == " " else re.escape(ch)) + build(node[ch])
+                for ch in sorted(k for k in node if k)
+            ]
+            if not alts:
+                return ""
+            body = alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+            return f"(?:{body})?" if "" in node else body
+
+        return build(trie)
+
+    @staticmethod
+    def _normalize(term):
+        return " ".join(term.lower().replace("-", " ").split())
+
+    @staticmethod
+    def _key(text):
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+    def _categories_for(self, term):
+        return self.term_categories.get(self._normalize(term), ())
+
+    def _finish(self, found):
+        return sorted(found) if found else [self.fallback]
+
+    def tag(self, text):
+        text = text or ""
+        key = self._key(text)
+        tags = self._memo.get(key)
+        if tags is None:
+            found = set()
+            for m in self.pattern.finditer(text):
+                found.update(self._categories_for(m.group(1)))
+            tags = self._finish(found)
+            self._remember(key, tags)
+        return list(tags)
+
+    def tag_many(self, texts):
+        """
+        Tags a whole list in one regex pass over the concatenation of every
+        text not already memoized. Returns one tag list per input text.
+        """
+        texts = [t or "" for t in texts]
+        keys = [self._key(t) for t in texts]
+
+        resolved = {}
+        pending = {}
+        for key, text in zip(keys, texts):
+            if key in resolved or key in pending:
+                continue
+            tags = self._memo.get(key)
+            if tags is None:
+                pending[key] = text
+            else:
+                resolved[key] = tags
+
+        if pending:
+            pending_keys = list(pending)
+            starts = []
+            offset = 0
+            for key in pending_keys:
+                starts.append(offset)
+                offset += len(pending[key]) + len(self.SEPARATOR)
+            blob = self.SEPARATOR.join(pending[key] for key in pending_keys)
+
+            found = [set() for _ in pending_keys]
+            for m in self.pattern.finditer(blob):
+                idx = bisect.bisect_right(starts, m.start()) - 1
+                found[idx].update(self._categories_for(m.group(1)))
+
+            for key, cats in zip(pending_keys, found):
+                resolved[key] = self._remember(key, self._finish(cats))
+
+        return [list(resolved[key]) for key in keys]
+
+    def _remember(self, key, tags):
+        if len(self._memo) >= self.max_memo:
+            self._memo.clear()
+        tags = self._memo[key] = tuple(tags)
+        return tags
+
+
+TAGGER = KeywordTagger(TAXONOMY)
+
 
 def tag_from_text(text):
-    text = (text or "").lower()
-    tags = set()
-
-    if any(k in text for k in ("shirt","dress","jacket","clothes")):
-        tags.add("clothing")
-    if any(k in text for k in ("tool","drill","saw","wrench")):
-        tags.add("tools")
-    if any(k in text for k in ("tv","laptop","phone","electronics")):
-        tags.add("electronics")
-    if any(k in text for k in ("couch","table","chair","bed")):
-        tags.add("furniture")
-
-    if not tags:
-        tags.add("misc")
-    return list(tags)
+    return TAGGER.tag(text)
+
+
+def tag_many(texts):
+    return TAGGER.tag_many(texts)
@@ -0,0 +1,214 @@
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QBrush, QColor
+from PySide6.QtWidgets import (
+    QAbstractItemView, QDoubleSpinBox, QHeaderView, QLineEdit, QStyledItemDelegate, QTableView,
+)
+
+HEADERS = ["Confidence", "Item", "Brand", "Low", "High", "Hidden"]
+
+COL_CONF, COL_NAME, COL_BRAND, COL_LOW, COL_HIGH, COL_HIDDEN = range(6)
+
+# Columns the user can type into; Hidden is a checkbox
+TEXT_FIELDS = {COL_NAME: "name", COL_BRAND: "brand"}
+PRICE_FIELDS = {COL_LOW: "low", COL_HIGH: "high"}
+
+# Fixed widths keep layout independent of the row count; name and brand stretch
+COLUMN_WIDTHS = {COL_CONF: 110, COL_LOW: 90, COL_HIGH: 90, COL_HIDDEN: 70}
+# The table grows with its items up to this many rows, then scrolls
+MAX_VISIBLE_ROWS = 12
+
+
+def confidence_badge(conf):
+    if conf >= 0.8:
+        return "High", "#22c55e"
+    if conf >= 0.5:
+        return "Medium", "#eab308"
+    return "Low", "#ef4444"
+
+
+def normalize_item(it):
+    """Item dict in the shape manual edits are saved in."""
+    low = float(it.get("low", 0))
+    high = max(float(it.get("high", 0)), low)
+    return {
+        "name": (it.get("name") or "").strip() or "Unknown item",
+        "brand": (it.get("brand") or "").strip() or "Unknown brand",
+        "confidence": float(it.get("confidence", 0)),
+        "low": low,
+        "high": high,
+        "hidden": bool(it.get("hidden")),
+    }
+
+
+class VisionItemModel(QAbstractTableModel):
+    """
+    Editable vision items, one row per item.
+
+    The model owns the item dicts, so edits made in the view land in
+    them directly and saving is just `items()`; nothing walks widgets.
+    The view only paints, and only opens editors for, the rows on screen.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows = []
+
+    # ---- Qt model API ----
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def headerData(self, section, orientation, role):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return HEADERS[section]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        col = index.column()
+        if col == COL_HIDDEN:
+            return flags | Qt.ItemIsUserCheckable
+        if col in TEXT_FIELDS or col in PRICE_FIELDS:
+            if self.rows[index.row()]["hidden"]:
+                # Hidden items stay read-only until they are shown again
+                return Qt.ItemIsSelectable
+            return flags | Qt.ItemIsEditable
+        return flags
+
+    def data(self, index, role):
+        if not index.isValid() or index.row() >= len(self.rows):
+            return None
+        it = self.rows[index.row()]
+        col = index.column()
+
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            if col == COL_CONF:
+                return f"{confidence_badge(it['confidence'])[0]} • {it['confidence']*100:.0f}%"
+            if col in TEXT_FIELDS:
+                return it[TEXT_FIELDS[col]]
+            if col in PRICE_FIELDS:
+                value = it[PRICE_FIELDS[col]]
+                return value if role == Qt.EditRole else f"${value:,.0f}"
+            return None
+        if role == Qt.CheckStateRole and col == COL_HIDDEN:
+            return Qt.Checked if it["hidden"] else Qt.Unchecked
+        if role == Qt.BackgroundRole and col == COL_CONF:
+            return QBrush(QColor(confidence_badge(it["confidence"])[1]))
+        if role == Qt.ForegroundRole:
+            if col == COL_CONF:
+                return QBrush(QColor("white"))
+            if it["hidden"]:
+                return QBrush(QColor("#6b7280"))
+        if role == Qt.TextAlignmentRole and col in PRICE_FIELDS:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def setData(self, index, value, role=None):
+        if not index.isValid():
+            return False
+        it = self.rows[index.row()]
+        col = index.column()
+        row = index.row()
+
+        if col == COL_HIDDEN and role == Qt.CheckStateRole:
+            it["hidden"] = Qt.CheckState(value) == Qt.Checked
+            # Every column's flags and colors depend on it
+            self.dataChanged.emit(self.index(row, 0), self.index(row, COL_HIDDEN))
+            return True
+        if role != Qt.EditRole:
+            return False
+        if col in TEXT_FIELDS:
+            it[TEXT_FIELDS[col]] = str(value)
+        elif col in PRICE_FIELDS:
+            it[PRICE_FIELDS[col]] = float(value)
+        else:
+            return False
+        self.dataChanged.emit(index, index)
+        return True
+
+    # ---- items ----
+    def set_items(self, items):
+        self.beginResetModel()
+        self.rows = [normalize_item(it) for it in items]
+        self.endResetModel()
+
+    def append_items(self, items):
+        if not items:
+            return
+        first = len(self.rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(items) - 1)
+        self.rows.extend(normalize_item(it) for it in items)
+        self.endInsertRows()
+
+    def items(self):
+        """Current items as saved manual edits; a high below low is raised to low."""
+        return [normalize_item(it) for it in self.rows]
+
+
+class VisionItemDelegate(QStyledItemDelegate):
+    """Inline editors: line edits for name/brand, dollar spin boxes for prices."""
+
+    def createEditor(self, parent, option, index):
+        if index.column() in PRICE_FIELDS:
+            spin = QDoubleSpinBox(parent)
+            spin.setRange(0, 1_000_000)
+            spin.setDecimals(0)
+            spin.setPrefix("$")
+            spin.setFrame(False)
+            return spin
+        if index.column() in TEXT_FIELDS:
+            edit = QLineEdit(parent)
+            edit.setPlaceholderText("Item name" if index.column() == COL_NAME else "Brand")
+            edit.setFrame(False)
+            return edit
+        return super().createEditor(parent, option, index)
+
+    def setEditorData(self, editor, index):
+        value = index.data(Qt.EditRole)
+        if isinstance(editor, QDoubleSpinBox):
+            editor.setValue(float(value or 0))
+        elif isinstance(editor, QLineEdit):
+            editor.setText(value or "")
+        else:
+            super().setEditorData(editor, index)
+
+    def setModelData(self, editor, model, index):
+        if isinstance(editor, QDoubleSpinBox):
+            editor.interpretText()
+            model.setData(index, editor.value(), Qt.EditRole)
+        elif isinstance(editor, QLineEdit):
+            model.setData(index, editor.text(), Qt.EditRole)
+        else:
+            super().setModelData(editor, model, index)
+
+
+class VisionItemView(QTableView):
+    def __init__(self, model, parent=None):
+        super().__init__(parent)
+        self.setModel(model)
+        self.setItemDelegate(VisionItemDelegate(self))
+        self.verticalHeader().setVisible(False)
+        self.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.setEditTriggers(
+            QAbstractItemView.DoubleClicked
+            | QAbstractItemView.SelectedClicked
+            | QAbstractItemView.EditKeyPressed
+        )
+        header = self.horizontalHeader()
+        for col, width in COLUMN_WIDTHS.items():
+            header.resizeSection(col, width)
+        for col in TEXT_FIELDS:
+            header.setSectionResizeMode(col, QHeaderView.Stretch)
+
+    def fit_rows(self):
+        rows = min(self.model().rowCount(), MAX_VISIBLE_ROWS)
+        self.setFixedHeight(
+            self.horizontalHeader().height()
+            + rows * self.verticalHeader().defaultSectionSize()
+            + 2 * self.frameWidth()
+        )
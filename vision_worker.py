@@ -1,10 +1,10 @@
 from PySide6.QtCore import QThread, Signal
-import requests
+from image_cache import IMAGE_CACHE
 from io import BytesIO
 from PIL import Image, ImageDraw, ImageFont
 
 from vision_gpt import analyze_image
-
+
 class VisionWorker(QThread):
     # progress: aid, current index, total, all_items, image_index, image_url, image_items, annotated_image_bytes
     progress = Signal(str, int, int, list, int, str, list, object)
@@ -38,9 +38,7 @@ class VisionWorker(QThread):
             img_bytes = None
 
             try:
-                r = requests.get(url, timeout=10)
-                r.raise_for_status()
-                img_bytes = r.content
+                img_bytes = IMAGE_CACHE.get_bytes(url)
             except Exception as e:
                 self.error.emit(
                     self.auction_id,
@@ -173,4 +171,4 @@ class VisionWorker(QThread):
                 return out.getvalue()
         except Exception:
             return None
-
+